@@ -2,22 +2,40 @@
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Supported languages
 SUPPORTED_LANGUAGES = ["ru", "kz"]
 DEFAULT_LANGUAGE = "ru"
 
-# Cache for loaded locale data
-_locale_cache: dict[str, dict] = {}
+# Locale language codes mapped to supported languages (Telegram uses 'kk' for Kazakh)
+_LANGUAGE_ALIASES = {
+    "ru": "ru",
+    "kz": "kz",
+    "kk": "kz",
+    "kaz": "kz",
+}
+
+# Directory containing <language>.json locale files
+LOCALES_DIR = Path(__file__).parent.parent / "locales"
 
 
+@lru_cache(maxsize=None)
 def _load_locale(language: str) -> dict:
     """Load locale data from JSON file.
     
+    The parsed file is memoized per language, so each locale is read and
+    decoded once per process (until clear_cache() is called).
+    
     Args:
         language: Language code (e.g., 'ru', 'kz')
         
@@ -28,46 +46,50 @@ def _load_locale(language: str) -> dict:
         FileNotFoundError: If locale file does not exist
         json.JSONDecodeError: If locale file is invalid JSON
     """
-    if language in _locale_cache:
-        return _locale_cache[language]
-    
-    locale_path = Path(__file__).parent.parent / "locales" / f"{language}.json"
+    locale_path = LOCALES_DIR / f"{language}.json"
     
     if not locale_path.exists():
         logger.error(f"Locale file not found: {locale_path}")
         raise FileNotFoundError(f"Locale file not found for language: {language}")
     
     try:
-        with open(locale_path, "r", encoding="utf-8") as f:
-            locale_data = json.load(f)
-            _locale_cache[language] = locale_data
-            logger.info(f"Loaded locale data for language: {language}")
-            return locale_data
+        if orjson is not None:
+            locale_data = orjson.loads(locale_path.read_bytes())
+        else:
+            locale_data = json.loads(locale_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse locale file {locale_path}: {e}")
         raise
+    
+    logger.info(f"Loaded locale data for language: {language}")
+    return locale_data
+
 
+def _flatten(data: dict, prefix: str = "") -> dict[str, Any]:
+    """Map every dot-separated key path in nested locale data to its value."""
+    flat = {}
+    for k, v in data.items():
+        path = f"{prefix}.{k}" if prefix else k
+        flat[path] = v
+        if isinstance(v, dict):
+            flat.update(_flatten(v, path))
+    return flat
 
-def _get_nested_value(data: dict, key: str) -> Optional[Any]:
-    """Get value from nested dictionary using dot notation.
+
+@lru_cache(maxsize=None)
+def _load_flat_locale(language: str) -> dict[str, Any]:
+    """Load locale data keyed by full dot-separated paths.
+    
+    Lets get_text resolve 'greetings.welcome' with a single dict lookup
+    instead of walking the nested structure on every call.
     
     Args:
-        data: Dictionary to search in
-        key: Dot-separated key path (e.g., 'greetings.welcome')
+        language: Language code (e.g., 'ru', 'kz')
         
     Returns:
-        Value if found, None otherwise
+        Dictionary mapping key paths to locale values
     """
-    keys = key.split(".")
-    current = data
-    
-    for k in keys:
-        if isinstance(current, dict) and k in current:
-            current = current[k]
-        else:
-            return None
-    
-    return current
+    return _flatten(_load_locale(language))
 
 
 def get_text(key: str, language: str = DEFAULT_LANGUAGE, **kwargs) -> str:
@@ -101,27 +123,21 @@ def get_text(key: str, language: str = DEFAULT_LANGUAGE, **kwargs) -> str:
         logger.warning(f"Unsupported language '{language}', falling back to {DEFAULT_LANGUAGE}")
         language = DEFAULT_LANGUAGE
     
-    # Try to get text in requested language
-    try:
-        locale_data = _load_locale(language)
-        text = _get_nested_value(locale_data, key)
-        
-        if text is not None:
-            return _safe_format(text, **kwargs)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        logger.error(f"Failed to load locale for language '{language}': {e}")
+    # Try the requested language, then fall back to Russian
+    candidates = (language,) if language == DEFAULT_LANGUAGE else (language, DEFAULT_LANGUAGE)
     
-    # Fallback to Russian if key not found or error occurred
-    if language != DEFAULT_LANGUAGE:
-        logger.warning(f"Key '{key}' not found in language '{language}', falling back to {DEFAULT_LANGUAGE}")
+    for candidate in candidates:
+        if candidate != language:
+            logger.warning(f"Key '{key}' not found in language '{language}', falling back to {candidate}")
+        
         try:
-            fallback_locale = _load_locale(DEFAULT_LANGUAGE)
-            text = _get_nested_value(fallback_locale, key)
-            
-            if text is not None:
-                return _safe_format(text, **kwargs)
+            text = _load_flat_locale(candidate).get(key)
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to load fallback locale: {e}")
+            logger.error(f"Failed to load locale for language '{candidate}': {e}")
+            continue
+        
+        if text is not None:
+            return _safe_format(text, **kwargs)
     
     # If key not found in any language, log and return the key itself
     logger.warning(f"Translation key '{key}' not found in any locale")
@@ -131,7 +147,7 @@ def get_text(key: str, language: str = DEFAULT_LANGUAGE, **kwargs) -> str:
 def _safe_format(text: str, **kwargs) -> str:
     """Safely format text with placeholders.
     
-    Attempts to substitute placeholders in the text. If any placeholder
+    Substitutes placeholders in a single format_map pass. If any placeholder
     is missing from kwargs, it will be left as-is in the output.
     
     Args:
@@ -145,15 +161,7 @@ def _safe_format(text: str, **kwargs) -> str:
         return text
     
     try:
-        return text.format(**kwargs)
-    except KeyError as e:
-        logger.warning(f"Missing placeholder in text formatting: {e}")
-        # Return text with partial substitution
-        try:
-            return text.format_map(_SafeDict(**kwargs))
-        except Exception as e:
-            logger.error(f"Failed to format text: {e}")
-            return text
+        return text.format_map(_SafeDict(kwargs))
     except Exception as e:
         logger.error(f"Unexpected error during text formatting: {e}")
         return text
@@ -163,6 +171,7 @@ class _SafeDict(dict):
     """Dictionary that returns the key itself if not found."""
     
     def __missing__(self, key):
+        logger.warning(f"Missing placeholder in text formatting: '{key}'")
         return "{" + key + "}"
 
 
@@ -201,22 +210,11 @@ def detect_language(
     
     # Priority 2: Telegram locale
     if telegram_locale:
-        normalized = telegram_locale.lower()
-        
-        # Map Telegram's 'kk' (Kazakh) to our 'kz'
-        if normalized in ["kk", "kaz"]:
-            return "kz"
-        
-        if normalized in SUPPORTED_LANGUAGES:
-            return normalized
-        
-        # Check if it's a locale with region (e.g., 'ru_RU', 'kk_KZ')
-        if "_" in normalized or "-" in normalized:
-            lang_code = normalized.split("_")[0].split("-")[0]
-            if lang_code == "kk" or lang_code == "kaz":
-                return "kz"
-            if lang_code in SUPPORTED_LANGUAGES:
-                return lang_code
+        # Strip region suffixes ('ru_RU', 'kk-KZ') and map aliases like Telegram's 'kk'
+        lang_code = telegram_locale.lower().replace("-", "_").split("_", 1)[0]
+        language = _LANGUAGE_ALIASES.get(lang_code)
+        if language:
+            return language
         
         logger.debug(f"Telegram locale '{telegram_locale}' not supported")
     
@@ -230,6 +228,6 @@ def clear_cache() -> None:
     
     This is useful for testing or when locale files are updated at runtime.
     """
-    global _locale_cache
-    _locale_cache.clear()
+    _load_locale.cache_clear()
+    _load_flat_locale.cache_clear()
     logger.debug("Locale cache cleared")
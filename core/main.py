@@ -216,6 +216,14 @@ class BotApplication:
             except Exception as e:
                 logger.error(f"  Error stopping health monitor: {e}")
 
+        # Write queued Sheets log rows
+        if self.sheets_manager:
+            try:
+                self.sheets_manager.close()
+                logger.info("  ✓ Sheets manager closed")
+            except Exception as e:
+                logger.error(f"  Error closing Sheets manager: {e}")
+
         # Close bot session
         if self.bot:
             try:
@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from settings import settings
 
@@ -18,6 +19,11 @@ DATABASE_URL = _raw_database_url or "sqlite:///./vita.db"
 Base = declarative_base()
 
 
+def _is_sqlite_memory_url(database_url: str) -> bool:
+    """Return True for SQLite URLs that point at an in-memory database."""
+    return database_url in ("sqlite://", "sqlite:///") or ":memory:" in database_url
+
+
 def get_engine() -> Engine:
     """Create a SQLAlchemy engine with environment-aware configuration."""
     database_url = DATABASE_URL
@@ -28,6 +34,10 @@ def get_engine() -> Engine:
 
     if database_url.startswith("sqlite"):
         engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory_url(database_url):
+            # Each new connection would get its own empty in-memory database;
+            # share a single connection so the schema stays visible
+            engine_kwargs["poolclass"] = StaticPool
     else:
         engine_kwargs.update(
             pool_pre_ping=True,
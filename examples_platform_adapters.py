@@ -182,6 +182,8 @@ async def example_instagram_adapter():
         challenge="test_challenge_123"
     )
     print(f"Verification challenge: {challenge}")
+    
+    await adapter.close()
 
 
 async def example_message_router():
@@ -275,6 +277,8 @@ async def example_message_router():
         handler=handle_message
     )
     
+    # Release the adapters' pooled HTTP connections
+    await router.close()
     await bot.session.close()
 
 
@@ -1,18 +1,34 @@
 """Google Sheets integration manager for bi-directional synchronization."""
 
+import asyncio
+import functools
 import json
 import logging
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import gspread
+from gspread.exceptions import APIError
+from gspread.http_client import HTTPClient
+from gspread.utils import rowcol_to_a1
 from tenacity import (
+    RetryCallState,
     retry,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_exponential_jitter,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from settings import settings
 from exceptions import RecoverableExternalError, SheetsInitializationError, SheetsError
 from models import (
@@ -39,10 +55,87 @@ WORKSHEETS = {
     "errors": "Ошибки",
 }
 
+# Fallback formats for timestamps that are not ISO 8601 (e.g. typed into the sheet by hand)
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d/%m/%Y")
+
+# Seconds a worksheet read is served from memory before the sheet is read again
+RECORD_CACHE_TTL = 60.0
+
+# Data rows fetched per request when paging through a worksheet
+SPECIALIST_PAGE_SIZE = 500
+
+# Queued admin log rows that get written right away instead of with the next flush
+ADMIN_LOG_BATCH_SIZE = 50
+
+# Most error log rows kept in memory while waiting to be written; the oldest are dropped first
+ERROR_BUFFER_SIZE = 500
+
+# Seconds the oldest buffered error row may wait before the next error logged writes the buffer
+ERROR_FLUSH_INTERVAL = 30.0
+
+# Upper bound in seconds for a server-advised Retry-After wait
+MAX_RETRY_AFTER = 60.0
+
+_backoff_with_jitter = wait_exponential_jitter(initial=1, max=30)
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Network errors, timeouts, rate limits and server errors are worth retrying."""
+    if isinstance(exc, APIError):
+        # -1 means the error body could not be parsed, e.g. an HTML gateway page
+        return exc.code in (-1, 408, 429) or exc.code >= 500
+    return isinstance(exc, OSError)
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as a 429's Retry-After header asks, else back off exponentially with jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, APIError) and exc.code == 429:
+        try:
+            return min(float(exc.response.headers["Retry-After"]), MAX_RETRY_AFTER)
+        except (KeyError, TypeError, ValueError):
+            pass  # Missing or HTTP-date valued header
+    return _backoff_with_jitter(retry_state)
+
+
+# Shared retry policy for methods that call the Sheets API
+_sheets_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_for_retry,
+    retry=retry_if_exception(_is_retryable_error),
+)
+
+
+def _locked(method):
+    """Run a manager method while holding the manager's lock, so threads take turns."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class OrjsonHTTPClient(HTTPClient):
+    """gspread HTTP client that decodes API responses with orjson instead of the json module."""
+
+    def request(self, *args: Any, **kwargs: Any):
+        response = super().request(*args, **kwargs)
+        # gspread reads every result through response.json()
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+
+# HTTP client class gspread uses for Sheets requests
+SHEETS_HTTP_CLIENT = OrjsonHTTPClient if orjson is not None else HTTPClient
+
 
 class GoogleSheetsManager:
     """Manager for Google Sheets integration with bi-directional sync support."""
 
+    # Authorized clients and opened spreadsheets shared by every manager in the
+    # process, keyed by (service account path, spreadsheet ID)
+    _connections: dict[tuple[str, str], tuple[gspread.Client, gspread.Spreadsheet]] = {}
+
     def __init__(self, spreadsheet_id: str, service_account_path: Optional[str] = None):
         """
         Initialize the Google Sheets manager.
@@ -57,26 +150,39 @@ class GoogleSheetsManager:
         self.spreadsheet = None
         self.worksheets = {}
         self.sync_state = SyncState()
+        # Serializes public calls that touch the caches and write queues below, so the
+        # async wrappers' worker threads and direct callers take turns
+        self._lock = threading.RLock()
+        # Rows waiting to be appended, keyed by worksheet key
+        self._pending_appends: dict[str, list[list]] = {}
+        # Row overwrites waiting to be written, keyed by (worksheet key, sheet row);
+        # a later write to the same row replaces the earlier one
+        self._write_log: dict[tuple[str, int], list] = {}
+        # Nesting depth of batched() blocks; writes are deferred while above zero
+        self._batch_depth = 0
+        # Raw worksheet values with the monotonic time they were read, keyed by worksheet key
+        self._values_cache: dict[str, tuple[float, list[list]]] = {}
+        # Record ID -> 1-based sheet row per worksheet key, with the cached values list
+        # and its length the map was built from; a hint that writes confirm first
+        self._row_indexes: dict[str, tuple[list[list], int, dict[int, int]]] = {}
+        # Drive modifiedTime of the spreadsheet as of the last completed pull
+        self._last_pull_modified_time: Optional[str] = None
+        # Admin log rows waiting to be written with the next flush
+        self._log_queue: queue.Queue[list] = queue.Queue()
+        # Error log rows not yet written, kept across failed flushes
+        self._error_buffer: deque[list] = deque(maxlen=ERROR_BUFFER_SIZE)
+        self._error_buffer_lock = threading.Lock()
+        # Monotonic time the buffered error rows have been waiting since; None when empty
+        self._error_buffer_since: Optional[float] = None
 
         self._initialize()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    @_sheets_retry
     def _initialize(self) -> None:
         """Initialize Google Sheets client and ensure worksheets exist."""
         try:
-            # Authenticate using service account
-            self.client = gspread.service_account(filename=self.service_account_path)
-            logger.info(
-                f"Authenticated to Google Sheets using {self.service_account_path}"
-            )
+            self.client, self.spreadsheet = self._connect()
 
-            # Open the spreadsheet
-            self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
-            logger.info(f"Opened spreadsheet: {self.spreadsheet.title}")
 
             # Ensure all required worksheets exist
             self._ensure_worksheets()
@@ -99,33 +205,91 @@ class GoogleSheetsManager:
             logger.error(f"Failed to initialize Google Sheets manager: {e}")
             raise SheetsInitializationError(f"Initialization failed: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    def _connect(self) -> tuple[gspread.Client, gspread.Spreadsheet]:
+        """
+        Get an authorized client and the opened spreadsheet, reusing a cached pair.
+
+        The client keeps its OAuth token in memory and refreshes it when it
+        expires, so later managers skip the token exchange and metadata fetch.
+        """
+        cache_key = (self.service_account_path, self.spreadsheet_id)
+        connection = self._connections.get(cache_key)
+        if connection is not None:
+            return connection
+
+        # Authenticate using service account
+        client = gspread.service_account(filename=self.service_account_path, http_client=SHEETS_HTTP_CLIENT)
+        logger.info(f"Authenticated to Google Sheets using {self.service_account_path}")
+
+        # Open the spreadsheet
+        spreadsheet = client.open_by_key(self.spreadsheet_id)
+        logger.info(f"Opened spreadsheet: {spreadsheet.title}")
+
+        self._connections[cache_key] = (client, spreadsheet)
+        return client, spreadsheet
+
+    @classmethod
+    def clear_connection_cache(cls) -> None:
+        """Drop cached clients so the next manager authenticates again."""
+        cls._connections.clear()
+
+    @_sheets_retry
     def _ensure_worksheets(self) -> None:
-        """Ensure all required worksheets exist, creating them if necessary."""
-        existing_sheets = {ws.title for ws in self.spreadsheet.worksheets()}
+        """
+        Ensure all required worksheets exist, creating them if necessary.
+
+        Missing worksheets are added with one batchUpdate request and their
+        headers written with one values.batchUpdate request.
+        """
+        existing_sheets = {ws.title: ws for ws in self.spreadsheet.worksheets()}
+        missing = [key for key, sheet_name in WORKSHEETS.items() if sheet_name not in existing_sheets]
 
         for key, sheet_name in WORKSHEETS.items():
-            if sheet_name not in existing_sheets:
-                logger.info(f"Creating worksheet: {sheet_name}")
-                worksheet = self.spreadsheet.add_worksheet(title=sheet_name, rows=1, cols=1)
-                self._initialize_worksheet_headers(key, worksheet)
-            else:
-                worksheet = self.spreadsheet.worksheet(sheet_name)
-            self.worksheets[key] = worksheet
-
-    def _initialize_worksheet_headers(self, key: str, worksheet) -> None:
-        """Initialize headers for a specific worksheet."""
-        headers = self._get_headers_for_worksheet(key)
-        if headers:
-            try:
-                worksheet.append_row(headers)
-                logger.info(f"Added headers to worksheet: {WORKSHEETS[key]}")
-            except gspread.exceptions.APIError as e:
-                logger.warning(f"Failed to add headers: {e}")
+            if key not in missing:
+                self.worksheets[key] = existing_sheets[sheet_name]
+
+        if not missing:
+            return
+
+        logger.info(f"Creating worksheets: {', '.join(WORKSHEETS[key] for key in missing)}")
+        response = self.spreadsheet.batch_update({
+            "requests": [
+                {
+                    "addSheet": {
+                        "properties": {
+                            "title": WORKSHEETS[key],
+                            "sheetType": "GRID",
+                            "gridProperties": {
+                                "rowCount": 1,
+                                "columnCount": len(self._get_headers_for_worksheet(key)) or 1,
+                            },
+                        }
+                    }
+                }
+                for key in missing
+            ]
+        })
+        for key, reply in zip(missing, response["replies"]):
+            self.worksheets[key] = gspread.Worksheet(
+                self.spreadsheet, reply["addSheet"]["properties"], self.spreadsheet.id, self.spreadsheet.client
+            )
+
+        self._initialize_worksheet_headers(missing)
+
+    def _initialize_worksheet_headers(self, keys: list[str]) -> None:
+        """Write the header row of several new worksheets with a single request."""
+        data = [
+            {"range": f"'{WORKSHEETS[key]}'!A1", "values": [headers]}
+            for key in keys
+            if (headers := self._get_headers_for_worksheet(key))
+        ]
+        if not data:
+            return
+        try:
+            self.spreadsheet.values_batch_update({"valueInputOption": "RAW", "data": data})
+            logger.info(f"Added headers to worksheets: {', '.join(WORKSHEETS[key] for key in keys)}")
+        except gspread.exceptions.APIError as e:
+            logger.warning(f"Failed to add headers: {e}")
 
     def _get_headers_for_worksheet(self, key: str) -> list[str]:
         """Get appropriate headers for each worksheet type."""
@@ -147,11 +311,8 @@ class GoogleSheetsManager:
 
     # Read operations
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    @_locked
+    @_sheets_retry
     def read_specialists(self) -> list[SpecialistDTO]:
         """
         Read all specialists from the Sheets.
@@ -162,31 +323,88 @@ class GoogleSheetsManager:
         Raises:
             gspread.exceptions.APIError: When API calls fail after retries
         """
-        worksheet = self._get_worksheet_safe("specialists")
-        records = worksheet.get_all_records()
+        return self._parse_specialist_values(self._cached_values("specialists"))
+
+    def _parse_specialist_values(self, values: list[list]) -> list[SpecialistDTO]:
+        """Build SpecialistDTOs from raw worksheet values, skipping rows that fail to parse."""
+        if not values:
+            return []
+        header, *rows = values
+        index = {name: i for i, name in enumerate(header)}
+        columns = zip(
+            self._column_values(index, rows, "ID", 0),
+            self._column_values(index, rows, "ФИ"),
+            self._column_values(index, rows, "Специализация"),
+            self._column_values(index, rows, "Телефон"),
+            self._column_values(index, rows, "Email"),
+            self._column_values(index, rows, "Активен"),
+            self._parse_datetimes(self._column_values(index, rows, "Создано")),
+            self._parse_datetimes(self._column_values(index, rows, "Обновлено")),
+        )
         specialists = []
-        for record in records:
+        for id_, name, specialization, phone, email, active, created_at, updated_at in columns:
             try:
                 specialist = SpecialistDTO(
-                    id=int(record.get("ID", 0)) or None,
-                    name=record.get("ФИ", ""),
-                    specialization=record.get("Специализация", ""),
-                    phone=record.get("Телефон") or None,
-                    email=record.get("Email") or None,
-                    is_active=record.get("Активен", "").lower() in ("да", "true", "1"),
-                    created_at=self._parse_datetime(record.get("Создано")),
-                    updated_at=self._parse_datetime(record.get("Обновлено")),
+                    id=int(id_) or None,
+                    name=name,
+                    specialization=specialization,
+                    phone=phone or None,
+                    email=email or None,
+                    is_active=active.lower() in ("да", "true", "1"),
+                    created_at=created_at,
+                    updated_at=updated_at,
                 )
                 specialists.append(specialist)
             except Exception as e:
                 logger.warning(f"Failed to parse specialist record: {e}")
         return specialists
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    def iter_specialists(self, chunk_size: int = SPECIALIST_PAGE_SIZE) -> Iterator[SpecialistDTO]:
+        """
+        Yield specialists page by page instead of reading the whole sheet at once.
+
+        Each page is one values.get request for chunk_size rows, made on the
+        caller's thread as the previous page runs out. Pages bypass the
+        worksheet cache.
+
+        Args:
+            chunk_size: Number of data rows per request
+
+        Yields:
+            SpecialistDTO objects in sheet order
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        # The first page also carries the header row
+        first_row, last_row = 1, chunk_size + 1
+        header = None
+        while True:
+            page = self._read_row_range("specialists", first_row, last_row)
+            # A short page means the sheet ends here
+            is_last = len(page) < last_row - first_row + 1
+
+            if header is None:
+                if not page:
+                    return
+                header, page = page[0], page[1:]
+            width = len(header)
+            page = [row + [""] * (width - len(row)) for row in page]
+            yield from self._parse_specialist_values([header, *page])
+
+            if is_last:
+                return
+            first_row, last_row = last_row + 1, last_row + chunk_size
+
+    @_locked
+    @_sheets_retry
+    def _read_row_range(self, key: str, first_row: int, last_row: int) -> list[list]:
+        """Read rows first_row..last_row (1-based, inclusive) of a worksheet with one request."""
+        response = self.spreadsheet.values_get(f"'{WORKSHEETS[key]}'!A{first_row}:Z{last_row}")
+        return response.get("values", [])
+
+    @_locked
+    @_sheets_retry
     def read_schedule(self) -> list[ScheduleDTO]:
         """
         Read all schedules from the Sheets.
@@ -195,25 +413,7 @@ class GoogleSheetsManager:
             List of ScheduleDTO objects
         """
         try:
-            worksheet = self._get_worksheet_safe("schedule")
-            records = worksheet.get_all_records()
-            schedules = []
-            for record in records:
-                try:
-                    schedule = ScheduleDTO(
-                        id=int(record.get("ID", 0)) or None,
-                        specialist_id=int(record.get("Специалист ID", 0)),
-                        day_of_week=int(record.get("День недели", 0)),
-                        start_time=record.get("Время начала", ""),
-                        end_time=record.get("Время конца", ""),
-                        is_available=record.get("Доступен", "").lower() in ("да", "true", "1"),
-                        created_at=self._parse_datetime(record.get("Создано")),
-                        updated_at=self._parse_datetime(record.get("Обновлено")),
-                    )
-                    schedules.append(schedule)
-                except Exception as e:
-                    logger.warning(f"Failed to parse schedule record: {e}")
-            return schedules
+            return self._parse_schedule_values(self._cached_values("schedule"))
         except gspread.exceptions.APIError as e:
             logger.error(f"Failed to read schedule: {e}")
             raise RecoverableExternalError(str(e), "Google Sheets")
@@ -221,11 +421,42 @@ class GoogleSheetsManager:
             logger.error(f"Error reading schedule: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    def _parse_schedule_values(self, values: list[list]) -> list[ScheduleDTO]:
+        """Build ScheduleDTOs from raw worksheet values, skipping rows that fail to parse."""
+        if not values:
+            return []
+        header, *rows = values
+        index = {name: i for i, name in enumerate(header)}
+        columns = zip(
+            self._column_values(index, rows, "ID", 0),
+            self._column_values(index, rows, "Специалист ID", 0),
+            self._column_values(index, rows, "День недели", 0),
+            self._column_values(index, rows, "Время начала"),
+            self._column_values(index, rows, "Время конца"),
+            self._column_values(index, rows, "Доступен"),
+            self._parse_datetimes(self._column_values(index, rows, "Создано")),
+            self._parse_datetimes(self._column_values(index, rows, "Обновлено")),
+        )
+        schedules = []
+        for id_, specialist_id, day, start, end, available, created_at, updated_at in columns:
+            try:
+                schedule = ScheduleDTO(
+                    id=int(id_) or None,
+                    specialist_id=int(specialist_id),
+                    day_of_week=int(day),
+                    start_time=start,
+                    end_time=end,
+                    is_available=available.lower() in ("да", "true", "1"),
+                    created_at=created_at,
+                    updated_at=updated_at,
+                )
+                schedules.append(schedule)
+            except Exception as e:
+                logger.warning(f"Failed to parse schedule record: {e}")
+        return schedules
+
+    @_locked
+    @_sheets_retry
     def read_bookings(self) -> list[BookingDTO]:
         """
         Read all bookings from the Sheets.
@@ -234,26 +465,7 @@ class GoogleSheetsManager:
             List of BookingDTO objects
         """
         try:
-            worksheet = self._get_worksheet_safe("bookings")
-            records = worksheet.get_all_records()
-            bookings = []
-            for record in records:
-                try:
-                    booking = BookingDTO(
-                        id=int(record.get("ID", 0)) or None,
-                        specialist_id=int(record.get("Специалист ID", 0)),
-                        client_name=record.get("Клиент", ""),
-                        booking_datetime=self._parse_datetime(record.get("Дата/Время")),
-                        duration_minutes=int(record.get("Длительность мин", 60)),
-                        notes=record.get("Заметки") or None,
-                        status=record.get("Статус", "confirmed"),
-                        created_at=self._parse_datetime(record.get("Создано")),
-                        updated_at=self._parse_datetime(record.get("Обновлено")),
-                    )
-                    bookings.append(booking)
-                except Exception as e:
-                    logger.warning(f"Failed to parse booking record: {e}")
-            return bookings
+            return self._parse_booking_values(self._cached_values("bookings"))
         except gspread.exceptions.APIError as e:
             logger.error(f"Failed to read bookings: {e}")
             raise RecoverableExternalError(str(e), "Google Sheets")
@@ -261,13 +473,83 @@ class GoogleSheetsManager:
             logger.error(f"Error reading bookings: {e}")
             raise
 
+    def _parse_booking_values(self, values: list[list]) -> list[BookingDTO]:
+        """Build BookingDTOs from raw worksheet values, skipping rows that fail to parse."""
+        if not values:
+            return []
+        header, *rows = values
+        index = {name: i for i, name in enumerate(header)}
+        columns = zip(
+            self._column_values(index, rows, "ID", 0),
+            self._column_values(index, rows, "Специалист ID", 0),
+            self._column_values(index, rows, "Клиент"),
+            self._parse_datetimes(self._column_values(index, rows, "Дата/Время")),
+            self._column_values(index, rows, "Длительность мин", 60),
+            self._column_values(index, rows, "Заметки"),
+            self._column_values(index, rows, "Статус", "confirmed"),
+            self._parse_datetimes(self._column_values(index, rows, "Создано")),
+            self._parse_datetimes(self._column_values(index, rows, "Обновлено")),
+        )
+        bookings = []
+        for (
+            id_, specialist_id, client_name, booking_datetime, duration,
+            notes, status, created_at, updated_at,
+        ) in columns:
+            try:
+                booking = BookingDTO(
+                    id=int(id_) or None,
+                    specialist_id=int(specialist_id),
+                    client_name=client_name,
+                    booking_datetime=booking_datetime,
+                    duration_minutes=int(duration),
+                    notes=notes or None,
+                    status=status,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                )
+                bookings.append(booking)
+            except Exception as e:
+                logger.warning(f"Failed to parse booking record: {e}")
+        return bookings
+
+    @staticmethod
+    def _column_values(index: dict[str, int], rows: list[list], name: str, default: Any = "") -> list:
+        """Get one column across all rows, or the default for each row if the column is absent."""
+        i = index.get(name)
+        if i is None:
+            return [default] * len(rows)
+        return [row[i] for row in rows]
+
+    @_locked
+    @_sheets_retry
+    def _batch_read_values(self, keys: list[str]) -> dict[str, list[list]]:
+        """
+        Read several worksheets with a single values.batchGet request.
+
+        The fetched values also refresh the worksheet cache.
+
+        Args:
+            keys: Worksheet keys to read
+
+        Returns:
+            Raw values (header row first) per worksheet key
+        """
+        ranges = [f"'{WORKSHEETS[key]}'!A:Z" for key in keys]
+        response = self.spreadsheet.values_batch_get(ranges)
+        now = time.monotonic()
+        values_by_key = {}
+        for key, value_range in zip(keys, response.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            if values:
+                # The API trims trailing empty cells; pad rows to the header width
+                width = len(values[0])
+                values = [row + [""] * (width - len(row)) for row in values]
+            self._values_cache[key] = (now, values)
+            values_by_key[key] = values
+        return values_by_key
+
     # Write operations
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
     def add_specialist(self, specialist: SpecialistDTO) -> SpecialistDTO:
         """
         Add a new specialist to the Sheets.
@@ -278,34 +560,38 @@ class GoogleSheetsManager:
         Returns:
             The added specialist with ID assigned
         """
-        worksheet = self._get_worksheet_safe("specialists")
+        return self.add_specialists([specialist])[0]
+
+    @_locked
+    @_sheets_retry
+    def add_specialists(self, specialists: list[SpecialistDTO]) -> list[SpecialistDTO]:
+        """
+        Add several specialists to the Sheets with a single append request.
+
+        Args:
+            specialists: SpecialistDTO objects to add
+
+        Returns:
+            The added specialists with timestamps assigned
+        """
         now = datetime.now(timezone.utc).isoformat()
-        row = [
-            specialist.id or "",
-            specialist.name,
-            specialist.specialization,
-            specialist.phone or "",
-            specialist.email or "",
-            "Да" if specialist.is_active else "Нет",
-            now,
-            now,
-        ]
-        worksheet.append_row(row)
-        specialist.created_at = self._parse_datetime(now)
-        specialist.updated_at = self._parse_datetime(now)
-        logger.info(f"Added specialist: {specialist.name}")
-        self._log_admin_action(
-            action_type="create",
-            resource_type="specialist",
-            description=f"Добавлен специалист: {specialist.name}",
-        )
-        return specialist
+        for specialist in specialists:
+            self._queue_append("specialists", self._specialist_row(specialist.id or "", specialist, now, now))
+        self._flush_unless_batched()
+
+        timestamp = self._parse_datetime(now)
+        for specialist in specialists:
+            specialist.created_at = timestamp
+            specialist.updated_at = timestamp
+            logger.info(f"Added specialist: {specialist.name}")
+            self._log_admin_action(
+                action_type="create",
+                resource_type="specialist",
+                description=f"Добавлен специалист: {specialist.name}",
+            )
+        self._flush_logs_unless_batched()
+        return specialists
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
     def update_specialist(self, specialist_id: int, specialist: SpecialistDTO) -> SpecialistDTO:
         """
         Update an existing specialist in the Sheets.
@@ -317,54 +603,76 @@ class GoogleSheetsManager:
         Returns:
             The updated specialist
         """
+        return self.update_specialists({specialist_id: specialist})[0]
+
+    @_locked
+    @_sheets_retry
+    def update_specialists(self, updates: dict[int, SpecialistDTO]) -> list[SpecialistDTO]:
+        """
+        Update several existing specialists with a single batch write request.
+
+        Args:
+            updates: Updated SpecialistDTO objects keyed by specialist ID
+
+        Returns:
+            The updated specialists
+
+        Raises:
+            SheetsError: If any of the IDs is not in the sheet; nothing is written then
+        """
         try:
-            worksheet = self._get_worksheet_safe("specialists")
-            records = worksheet.get_all_records()
+            values, row_indexes = self._locate_rows("specialists", updates)
             now = datetime.now(timezone.utc).isoformat()
 
-            for idx, record in enumerate(records):
-                if int(record.get("ID", 0)) == specialist_id:
-                    row_idx = idx + 2  # +1 for header, +1 for 1-based indexing
-                    row = [
-                        specialist_id,
-                        specialist.name,
-                        specialist.specialization,
-                        specialist.phone or "",
-                        specialist.email or "",
-                        "Да" if specialist.is_active else "Нет",
-                        record.get("Создано", now),
-                        now,
-                    ]
-                    worksheet.delete_rows(row_idx, row_idx)
-                    worksheet.insert_row(row, row_idx)
-                    specialist.updated_at = self._parse_datetime(now)
-                    logger.info(f"Updated specialist: {specialist.name}")
-                    self._log_admin_action(
-                        action_type="update",
-                        resource_type="specialist",
-                        resource_id=specialist_id,
-                        description=f"Обновлен специалист: {specialist.name}",
-                    )
-                    return specialist
-
-            logger.warning(f"Specialist with ID {specialist_id} not found")
-            raise SheetsError(f"Specialist with ID {specialist_id} not found")
+            missing = [specialist_id for specialist_id, idx in row_indexes.items() if idx is None]
+            if missing:
+                logger.warning(f"Specialists with IDs {missing} not found")
+                raise SheetsError(
+                    f"Specialist with ID {', '.join(map(str, missing))} not found"
+                )
+
+            created_col = values[0].index("Создано") if "Создано" in values[0] else None
+            rows = {}
+            for specialist_id, specialist in updates.items():
+                current = values[row_indexes[specialist_id] - 1]
+                rows[specialist_id] = self._specialist_row(
+                    specialist_id,
+                    specialist,
+                    current[created_col] if created_col is not None else now,
+                    now,
+                )
+
+            # Overwrite every row in place with a single write request
+            for specialist_id, row in rows.items():
+                self._queue_write("specialists", row_indexes[specialist_id], row)
+            self._flush_unless_batched()
+
+            timestamp = self._parse_datetime(now)
+            for specialist_id, specialist in updates.items():
+                values[row_indexes[specialist_id] - 1] = rows[specialist_id]
+                specialist.updated_at = timestamp
+                logger.info(f"Updated specialist: {specialist.name}")
+                self._log_admin_action(
+                    action_type="update",
+                    resource_type="specialist",
+                    resource_id=specialist_id,
+                    description=f"Обновлен специалист: {specialist.name}",
+                )
+            self._flush_logs_unless_batched()
+            return list(updates.values())
 
         except gspread.exceptions.APIError as e:
-            logger.error(f"Failed to update specialist: {e}")
-            self._log_error("api_error", f"Failed to update specialist: {e}")
+            logger.error(f"Failed to update specialists: {e}")
+            self._log_error("api_error", f"Failed to update specialists: {e}")
             raise RecoverableExternalError(str(e), "Google Sheets")
         except Exception as e:
-            logger.error(f"Error updating specialist: {e}")
+            logger.error(f"Error updating specialists: {e}")
             if not isinstance(e, SheetsError):
                 self._log_error("unexpected_error", str(e))
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    @_locked
+    @_sheets_retry
     def delete_specialist(self, specialist_id: int) -> bool:
         """
         Delete a specialist from the Sheets.
@@ -377,20 +685,24 @@ class GoogleSheetsManager:
         """
         try:
             worksheet = self._get_worksheet_safe("specialists")
-            records = worksheet.get_all_records()
-
-            for idx, record in enumerate(records):
-                if int(record.get("ID", 0)) == specialist_id:
-                    row_idx = idx + 2  # +1 for header, +1 for 1-based indexing
-                    worksheet.delete_rows(row_idx, row_idx)
-                    logger.info(f"Deleted specialist with ID: {specialist_id}")
-                    self._log_admin_action(
-                        action_type="delete",
-                        resource_type="specialist",
-                        resource_id=specialist_id,
-                        description=f"Удален специалист с ID: {specialist_id}",
-                    )
-                    return True
+            values, row_indexes = self._locate_rows("specialists", [specialist_id])
+
+            row_idx = row_indexes[specialist_id]
+            if row_idx is not None:
+                # Queued writes address rows by number, so land them before rows shift
+                self.flush_pending_writes()
+                worksheet.delete_rows(row_idx, row_idx)
+                del values[row_idx - 1]
+                self._shift_row_index("specialists", values, row_idx)
+                logger.info(f"Deleted specialist with ID: {specialist_id}")
+                self._log_admin_action(
+                    action_type="delete",
+                    resource_type="specialist",
+                    resource_id=specialist_id,
+                    description=f"Удален специалист с ID: {specialist_id}",
+                )
+                self._flush_logs_unless_batched()
+                return True
 
             logger.warning(f"Specialist with ID {specialist_id} not found for deletion")
             return False
@@ -404,11 +716,6 @@ class GoogleSheetsManager:
             self._log_error("unexpected_error", str(e))
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
     def add_booking(self, booking: BookingDTO) -> BookingDTO:
         """
         Add a new booking to the Sheets.
@@ -419,44 +726,57 @@ class GoogleSheetsManager:
         Returns:
             The added booking with ID assigned
         """
+        return self.add_bookings([booking])[0]
+
+    @_locked
+    @_sheets_retry
+    def add_bookings(self, bookings: list[BookingDTO]) -> list[BookingDTO]:
+        """
+        Add several bookings to the Sheets with a single append request.
+
+        Args:
+            bookings: BookingDTO objects to add
+
+        Returns:
+            The added bookings with timestamps assigned
+        """
         try:
-            worksheet = self._get_worksheet_safe("bookings")
             now = datetime.now(timezone.utc).isoformat()
-            row = [
-                booking.id or "",
-                booking.specialist_id,
-                booking.client_name,
-                booking.booking_datetime.isoformat() if booking.booking_datetime else "",
-                booking.duration_minutes,
-                booking.notes or "",
-                booking.status,
-                now,
-                now,
-            ]
-            worksheet.append_row(row)
-            booking.created_at = self._parse_datetime(now)
-            booking.updated_at = self._parse_datetime(now)
-            logger.info(f"Added booking for client: {booking.client_name}")
-            self._log_admin_action(
-                action_type="create",
-                resource_type="booking",
-                description=f"Добавлена запись для {booking.client_name}",
-            )
-            return booking
+            for booking in bookings:
+                self._queue_append("bookings", [
+                    booking.id or "",
+                    booking.specialist_id,
+                    booking.client_name,
+                    booking.booking_datetime.isoformat() if booking.booking_datetime else "",
+                    booking.duration_minutes,
+                    booking.notes or "",
+                    booking.status,
+                    now,
+                    now,
+                ])
+            self._flush_unless_batched()
+
+            timestamp = self._parse_datetime(now)
+            for booking in bookings:
+                booking.created_at = timestamp
+                booking.updated_at = timestamp
+                logger.info(f"Added booking for client: {booking.client_name}")
+                self._log_admin_action(
+                    action_type="create",
+                    resource_type="booking",
+                    description=f"Добавлена запись для {booking.client_name}",
+                )
+            self._flush_logs_unless_batched()
+            return bookings
         except gspread.exceptions.APIError as e:
-            logger.error(f"Failed to add booking: {e}")
-            self._log_error("api_error", f"Failed to add booking: {e}")
+            logger.error(f"Failed to add bookings: {e}")
+            self._log_error("api_error", f"Failed to add bookings: {e}")
             raise RecoverableExternalError(str(e), "Google Sheets")
         except Exception as e:
-            logger.error(f"Error adding booking: {e}")
+            logger.error(f"Error adding bookings: {e}")
             self._log_error("unexpected_error", str(e))
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
     def add_day_off(self, day_off: DayOffDTO) -> DayOffDTO:
         """
         Add a day off record to the Sheets.
@@ -467,43 +787,278 @@ class GoogleSheetsManager:
         Returns:
             The added day off record
         """
+        return self.add_days_off([day_off])[0]
+
+    @_locked
+    @_sheets_retry
+    def add_days_off(self, days_off: list[DayOffDTO]) -> list[DayOffDTO]:
+        """
+        Add several day off records to the Sheets with a single append request.
+
+        Args:
+            days_off: DayOffDTO objects to add
+
+        Returns:
+            The added day off records
+        """
         try:
-            worksheet = self._get_worksheet_safe("days_off")
             now = datetime.now(timezone.utc).isoformat()
-            row = [
-                day_off.id or "",
-                day_off.specialist_id,
-                day_off.date,
-                day_off.reason or "",
-                now,
-            ]
-            worksheet.append_row(row)
-            day_off.created_at = self._parse_datetime(now)
-            logger.info(f"Added day off for specialist ID: {day_off.specialist_id}")
-            self._log_admin_action(
-                action_type="create",
-                resource_type="day_off",
-                resource_id=day_off.specialist_id,
-                description=f"Добавлен выходной день: {day_off.date}",
-            )
-            return day_off
+            for day_off in days_off:
+                self._queue_append("days_off", [
+                    day_off.id or "",
+                    day_off.specialist_id,
+                    day_off.date,
+                    day_off.reason or "",
+                    now,
+                ])
+            self._flush_unless_batched()
+
+            timestamp = self._parse_datetime(now)
+            for day_off in days_off:
+                day_off.created_at = timestamp
+                logger.info(f"Added day off for specialist ID: {day_off.specialist_id}")
+                self._log_admin_action(
+                    action_type="create",
+                    resource_type="day_off",
+                    resource_id=day_off.specialist_id,
+                    description=f"Добавлен выходной день: {day_off.date}",
+                )
+            self._flush_logs_unless_batched()
+            return days_off
         except gspread.exceptions.APIError as e:
-            logger.error(f"Failed to add day off: {e}")
-            self._log_error("api_error", f"Failed to add day off: {e}")
+            logger.error(f"Failed to add days off: {e}")
+            self._log_error("api_error", f"Failed to add days off: {e}")
             raise RecoverableExternalError(str(e), "Google Sheets")
         except Exception as e:
-            logger.error(f"Error adding day off: {e}")
+            logger.error(f"Error adding days off: {e}")
             self._log_error("unexpected_error", str(e))
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
+    @staticmethod
+    def _specialist_row(specialist_id: Any, specialist: SpecialistDTO, created_at: str, updated_at: str) -> list:
+        """Lay out a specialist as a Specialists worksheet row, in header order."""
+        return [
+            specialist_id,
+            specialist.name,
+            specialist.specialization,
+            specialist.phone or "",
+            specialist.email or "",
+            "Да" if specialist.is_active else "Нет",
+            created_at,
+            updated_at,
+        ]
+
+    def _queue_append(self, key: str, row: list) -> None:
+        """Queue a row to be appended to a worksheet on the next flush."""
+        self._pending_appends.setdefault(key, []).append(row)
+
+    def _queue_write(self, key: str, row_idx: int, row: list) -> None:
+        """Queue an overwrite of a sheet row, replacing any earlier queued write to it."""
+        self._write_log[(key, row_idx)] = row
+
+    def _flush_unless_batched(self) -> None:
+        """Flush queued writes now, unless a batched() block will flush them on exit."""
+        if not self._batch_depth:
+            self.flush_pending_writes()
+
+    def _flush_logs_unless_batched(self) -> None:
+        """Write queued log rows now, unless a batched() block will write them on exit."""
+        if not self._batch_depth:
+            self._flush_logs_now()
+
+    @contextmanager
+    def batched(self) -> Iterator["GoogleSheetsManager"]:
+        """
+        Defer writes made inside the block and flush them together on exit.
+
+        Appends go out as one request per worksheet and row overwrites as one
+        batch update per worksheet, with repeated writes to a row merged. Write
+        errors therefore surface when the block exits. Blocks may be nested; the
+        outermost one flushes.
+
+        The manager's lock is held for the whole block, so writes from other
+        threads wait rather than joining the batch.
+
+        Yields:
+            This manager
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush_pending_writes()
+
+    @_locked
+    def flush_pending_writes(self) -> None:
+        """
+        Write all queued rows: one batch update per worksheet for row overwrites
+        and one append request per worksheet for new rows.
+
+        Writes are taken off the queue before the request is sent, so a failed
+        flush raises to the caller instead of leaving rows to be written twice.
+        Queued admin log and error rows are written afterwards.
+        """
+        updates_by_key: dict[str, list[dict]] = {}
+        for (key, row_idx), row in self._write_log.items():
+            updates_by_key.setdefault(key, []).append({
+                "range": f"A{row_idx}:{rowcol_to_a1(row_idx, len(row))}",
+                "values": [row],
+            })
+        self._write_log.clear()
+        for key, updates in updates_by_key.items():
+            self._get_worksheet_safe(key).batch_update(updates)
+
+        for key in list(self._pending_appends):
+            rows = self._pending_appends.pop(key)
+            self._get_worksheet_safe(key).append_rows(rows)
+            cached = self._values_cache.get(key)
+            if cached is not None:
+                if cached[1]:
+                    cached[1].extend(rows)
+                else:
+                    # Without a header row the cached values cannot be extended safely
+                    self.invalidate(key)
+
+        # Log rows queued by earlier operations ride along with this flush
+        self._flush_logs_now()
+
+    def _cached_values(self, key: str, ttl: float = RECORD_CACHE_TTL) -> list[list]:
+        """
+        Get raw worksheet values (header row first), reading the sheet only when
+        the cached copy has expired.
+
+        Writes made through this manager edit the cached rows in place, so they stay
+        coherent with them; changes made elsewhere show up once the TTL runs out.
+
+        Args:
+            key: Worksheet key
+            ttl: Maximum age of the cached values in seconds
+
+        Returns:
+            List of rows, each a list of cell values
+        """
+        cached = self._values_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        values = self._get_worksheet_safe(key).get_all_values()
+        self._values_cache[key] = (now, values)
+        return values
+
+    @_locked
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached values so the next read goes to the sheet.
+
+        Args:
+            key: Worksheet key to invalidate, or None for all worksheets
+        """
+        if key is None:
+            self._values_cache.clear()
+            self._row_indexes.clear()
+        else:
+            self._values_cache.pop(key, None)
+            self._row_indexes.pop(key, None)
+
+    def _locate_rows(self, key: str, record_ids) -> tuple[list[list], dict[int, Optional[int]]]:
+        """
+        Find the sheet rows holding record IDs, checked against the sheet before a write.
+
+        Rows are looked up in the cached values, then the worksheet's live ID column
+        is read to confirm the lookup. If rows were inserted or deleted elsewhere
+        since the values were cached, the worksheet is read again and the ID-to-row
+        map rebuilt from it, so writes never address a row taken from a stale copy
+        and records added elsewhere are not reported missing.
+
+        Args:
+            key: Worksheet key
+            record_ids: IDs to look for in the "ID" column
+
+        Returns:
+            The worksheet values the rows were found in, and the sheet row per ID
+            (None where no row has that ID)
+        """
+        values = self._cached_values(key)
+        rows = {record_id: self._find_row_index(key, values, record_id) for record_id in record_ids}
+        if not self._rows_match_sheet(key, values, rows):
+            logger.info(f"Cached rows of {key} are out of date, reading the worksheet again")
+            self.invalidate(key)
+            values = self._cached_values(key)
+            rows = {record_id: self._find_row_index(key, values, record_id) for record_id in record_ids}
+        return values, rows
+
+    def _rows_match_sheet(self, key: str, values: list[list], rows: dict[int, Optional[int]]) -> bool:
+        """
+        Check row hints with one read of the live ID column: each ID must sit in the
+        row it was found in, and IDs that were not found must not be in the sheet.
+        """
+        if not rows or not values or "ID" not in values[0]:
+            return True
+        live_ids = self._get_worksheet_safe(key).col_values(values[0].index("ID") + 1)
+        live_rows = self._build_row_index([["ID"], *([value] for value in live_ids[1:])])
+        return all(live_rows.get(record_id) == row for record_id, row in rows.items())
+
+    def _find_row_index(self, key: str, values: list[list], record_id: int) -> Optional[int]:
+        """
+        Find the 1-based sheet row holding a record ID in the given values.
+
+        The ID-to-row map is built once per cached values list and rebuilt only
+        when rows are added or the values are read again. It only knows about this
+        manager's own changes, so the row is a hint; writes locate rows through
+        _locate_rows, which confirms them against the sheet.
+
+        Args:
+            key: Worksheet key the values belong to
+            values: Raw worksheet values, header row first
+            record_id: ID to look for in the "ID" column
+
+        Returns:
+            Sheet row number, or None if no row has that ID
+        """
+        entry = self._row_indexes.get(key)
+        if entry is None or entry[0] is not values or entry[1] != len(values):
+            entry = (values, len(values), self._build_row_index(values))
+            self._row_indexes[key] = entry
+        return entry[2].get(record_id)
+
+    @staticmethod
+    def _build_row_index(values: list[list]) -> dict[int, int]:
+        """Map each record ID to its 1-based sheet row, keeping the first row for a repeated ID."""
+        index: dict[int, int] = {}
+        if not values or "ID" not in values[0]:
+            return index
+        id_col = values[0].index("ID")
+        for idx, row in enumerate(values[1:], start=2):  # row 1 is the header
+            try:
+                index.setdefault(int(row[id_col]), idx)
+            except (ValueError, TypeError):
+                continue
+        return index
+
+    def _shift_row_index(self, key: str, values: list[list], deleted_row: int) -> None:
+        """Update the ID-to-row map after this manager deleted a row from the sheet and from values."""
+        entry = self._row_indexes.get(key)
+        if entry is None or entry[0] is not values:
+            return
+        index = {
+            record_id: row - 1 if row > deleted_row else row
+            for record_id, row in entry[2].items()
+            if row != deleted_row
+        }
+        self._row_indexes[key] = (values, len(values), index)
+
+    @_locked
     def log_admin_action(self, action: AdminActionDTO) -> AdminActionDTO:
         """
-        Log an admin action to the Sheets.
+        Log an admin action to the Sheets admin log.
+
+        The row is written before this returns, unless called inside a batched()
+        block: then it is written when the block exits, or earlier once
+        ADMIN_LOG_BATCH_SIZE rows are waiting. A failed write is logged and the
+        row dropped.
 
         Args:
             action: AdminActionDTO object to log
@@ -511,13 +1066,15 @@ class GoogleSheetsManager:
         Returns:
             The logged action
         """
-        return self._log_admin_action(
+        logged = self._log_admin_action(
             action_type=action.action_type,
             resource_type=action.resource_type,
             resource_id=action.resource_id,
             description=action.description,
             performed_by=action.performed_by,
         )
+        self._flush_logs_unless_batched()
+        return logged
 
     def _log_admin_action(
         self,
@@ -540,43 +1097,79 @@ class GoogleSheetsManager:
         Returns:
             The logged action
         """
-        try:
-            worksheet = self._get_worksheet_safe("admin_logs")
-            now = datetime.now(timezone.utc).isoformat()
-            row = [
-                "",  # ID will be auto-assigned
-                action_type,
-                resource_type,
-                resource_id or "",
-                description,
-                performed_by or "system",
-                now,
-            ]
-            worksheet.append_row(row)
-            logger.debug(f"Logged admin action: {action_type} - {description}")
-            return AdminActionDTO(
-                action_type=action_type,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                description=description,
-                performed_by=performed_by or "system",
-                created_at=self._parse_datetime(now),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to log admin action: {e}")
-            return AdminActionDTO(
-                action_type=action_type,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                description=description,
-                performed_by=performed_by or "system",
-            )
+        now = datetime.now(timezone.utc).isoformat()
+        row = [
+            "",  # ID will be auto-assigned
+            action_type,
+            resource_type,
+            resource_id or "",
+            description,
+            performed_by or "system",
+            now,
+        ]
+        # Queued so a batch of writes logs its rows with one request; callers flush
+        self._log_queue.put(row)
+        if self._log_queue.qsize() >= ADMIN_LOG_BATCH_SIZE:
+            self._flush_logs_now()
+        logger.debug(f"Queued admin action: {action_type} - {description}")
+        return AdminActionDTO(
+            action_type=action_type,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            description=description,
+            performed_by=performed_by or "system",
+            created_at=self._parse_datetime(now),
+        )
+
+    @_locked
+    def _flush_logs_now(self) -> None:
+        """
+        Write queued admin log and error rows, one append request per worksheet.
+
+        Admin log rows that fail to write are dropped. Error rows go back to the
+        buffer for the next flush, so errors are not lost while Sheets is down,
+        and the next time-based attempt waits ERROR_FLUSH_INTERVAL again.
+        Runs on the caller's thread, under the manager's lock like every other
+        Sheets call.
+        """
+        rows = []
+        while True:
+            try:
+                rows.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            try:
+                self._get_worksheet_safe("admin_logs").append_rows(rows)
+                logger.debug(f"Wrote {len(rows)} admin log rows")
+            except Exception as e:
+                logger.warning(f"Failed to log admin actions: {e}")
+
+        with self._error_buffer_lock:
+            error_rows = list(self._error_buffer)
+            self._error_buffer.clear()
+            self._error_buffer_since = None
+        if error_rows:
+            try:
+                self._get_worksheet_safe("errors").append_rows(error_rows)
+                logger.debug(f"Wrote {len(error_rows)} error log rows")
+            except Exception as e:
+                logger.warning(f"Failed to log errors to sheets: {e}")
+                with self._error_buffer_lock:
+                    # Put the rows back ahead of newer ones, keeping the newest if full
+                    pending = error_rows + list(self._error_buffer)
+                    dropped = len(pending) - ERROR_BUFFER_SIZE
+                    if dropped > 0:
+                        logger.warning(f"Error log buffer full, dropped {dropped} oldest unwritten rows")
+                    self._error_buffer.clear()
+                    self._error_buffer.extend(pending)
+                    # Wait a full interval before the next time-based attempt
+                    self._error_buffer_since = time.monotonic()
+
+    def close(self) -> None:
+        """Write any log and error rows still queued; call on shutdown."""
+        self._flush_logs_now()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((gspread.exceptions.APIError, OSError)),
-    )
     def log_error(self, error: ErrorLogDTO) -> ErrorLogDTO:
         """
         Log an error to the Sheets.
@@ -604,6 +1197,9 @@ class GoogleSheetsManager:
         """
         Internal method to log errors.
 
+        Rows are buffered and written with the next flush, or by the first error
+        logged once the oldest buffered row is ERROR_FLUSH_INTERVAL seconds old.
+
         Args:
             error_type: Type of error
             message: Error message
@@ -613,34 +1209,35 @@ class GoogleSheetsManager:
         Returns:
             The logged error
         """
-        try:
-            worksheet = self._get_worksheet_safe("errors")
-            now = datetime.now(timezone.utc).isoformat()
-            row = [
-                "",  # ID will be auto-assigned
-                error_type,
-                message,
-                context or "",
-                traceback or "",
-                now,
-            ]
-            worksheet.append_row(row)
-            logger.debug(f"Logged error: {error_type} - {message}")
-            return ErrorLogDTO(
-                error_type=error_type,
-                message=message,
-                context=context,
-                traceback=traceback,
-                created_at=self._parse_datetime(now),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to log error to sheets: {e}")
-            return ErrorLogDTO(
-                error_type=error_type,
-                message=message,
-                context=context,
-                traceback=traceback,
-            )
+        now = datetime.now(timezone.utc).isoformat()
+        row = [
+            "",  # ID will be auto-assigned
+            error_type,
+            message,
+            context or "",
+            traceback or "",
+            now,
+        ]
+        # Buffered rather than written here: the error may well be Sheets itself
+        with self._error_buffer_lock:
+            if len(self._error_buffer) == ERROR_BUFFER_SIZE:
+                logger.warning("Error log buffer full, dropped the oldest unwritten row")
+            self._error_buffer.append(row)
+            now_monotonic = time.monotonic()
+            if self._error_buffer_since is None:
+                self._error_buffer_since = now_monotonic
+            due = now_monotonic - self._error_buffer_since >= ERROR_FLUSH_INTERVAL
+        logger.debug(f"Buffered error: {error_type} - {message}")
+        if due:
+            # Processes that only read or pull never flush writes, so age bounds the wait
+            self._flush_logs_now()
+        return ErrorLogDTO(
+            error_type=error_type,
+            message=message,
+            context=context,
+            traceback=traceback,
+            created_at=self._parse_datetime(now),
+        )
 
     # Utility methods
 
@@ -658,11 +1255,13 @@ class GoogleSheetsManager:
         if not value:
             return None
         try:
-            # Try ISO format first
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            # Try ISO format first; fromisoformat is C-coded and far cheaper than strptime
+            if value[-1] == "Z":
+                value = value[:-1] + "+00:00"
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
             # Try other common formats
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d/%m/%Y"]:
+            for fmt in DATETIME_FORMATS:
                 try:
                     return datetime.strptime(value, fmt)
                 except ValueError:
@@ -670,8 +1269,37 @@ class GoogleSheetsManager:
             logger.warning(f"Could not parse datetime: {value}")
             return None
 
+    @classmethod
+    def _parse_datetimes(cls, values: list) -> list[Optional[datetime]]:
+        """
+        Parse a column of datetime strings in one pass.
+
+        Values fromisoformat accepts are parsed inline; anything else goes
+        through _parse_datetime, so results match parsing value by value.
+
+        Args:
+            values: String values to parse
+
+        Returns:
+            Parsed datetimes, None where a value is empty or unparseable
+        """
+        fromisoformat = datetime.fromisoformat
+        parse_one = cls._parse_datetime
+        parsed = []
+        append = parsed.append
+        for value in values:
+            if not value:
+                append(None)
+                continue
+            try:
+                append(fromisoformat(value))
+            except (ValueError, TypeError):
+                append(parse_one(value))
+        return parsed
+
     # Sync operations
 
+    @_locked
     def sync_push_changes(self, local_specialists: list[SpecialistDTO], local_bookings: list[BookingDTO]) -> SyncState:
         """
         Push local changes to Google Sheets.
@@ -684,11 +1312,16 @@ class GoogleSheetsManager:
             SyncState object with sync statistics
         """
         self.sync_state = SyncState()
+        # Reconcile against what is in the sheet now, not a cached read
+        self.invalidate()
 
         try:
+            # Read both remote worksheets with one batched request
+            values = self._batch_read_values(["specialists", "bookings"])
+
             # Sync specialists
             try:
-                remote_specialists = self.read_specialists()
+                remote_specialists = self._parse_specialist_values(values.get("specialists", []))
                 self._sync_specialists(local_specialists, remote_specialists)
             except RecoverableExternalError as e:
                 logger.error(f"Failed to sync specialists: {e}")
@@ -697,7 +1330,7 @@ class GoogleSheetsManager:
 
             # Sync bookings
             try:
-                remote_bookings = self.read_bookings()
+                remote_bookings = self._parse_booking_values(values.get("bookings", []))
                 self._sync_bookings(local_bookings, remote_bookings)
             except RecoverableExternalError as e:
                 logger.error(f"Failed to sync bookings: {e}")
@@ -714,6 +1347,7 @@ class GoogleSheetsManager:
             self._log_error("sync_error", f"Unexpected sync error: {str(e)}")
             return self.sync_state
 
+    @_locked
     def sync_pull_changes(self) -> SyncState:
         """
         Pull remote changes from Google Sheets.
@@ -723,28 +1357,28 @@ class GoogleSheetsManager:
         """
         self.sync_state = SyncState()
 
+        modified_time = self._fetch_modified_time()
+        if modified_time is not None and modified_time == self._last_pull_modified_time:
+            logger.info("Spreadsheet unchanged since the last pull, skipping the read")
+            self.sync_state.last_synced = datetime.now(timezone.utc)
+            return self.sync_state
+
+        self.invalidate()
+
         try:
-            # Pull specialists
-            try:
-                specialists = self.read_specialists()
-                self.sync_state.items_pulled += len(specialists)
-                logger.info(f"Pulled {len(specialists)} specialists from Sheets")
-            except RecoverableExternalError as e:
-                logger.error(f"Failed to pull specialists: {e}")
-                self.sync_state.errors.append(f"Failed to pull specialists: {str(e)}")
-                self._log_error("sync_error", f"Failed to pull specialists: {str(e)}")
+            # Pull specialists and bookings with one batched read
+            values = self._batch_read_values(["specialists", "bookings"])
 
-            # Pull bookings
-            try:
-                bookings = self.read_bookings()
-                self.sync_state.items_pulled += len(bookings)
-                logger.info(f"Pulled {len(bookings)} bookings from Sheets")
-            except RecoverableExternalError as e:
-                logger.error(f"Failed to pull bookings: {e}")
-                self.sync_state.errors.append(f"Failed to pull bookings: {str(e)}")
-                self._log_error("sync_error", f"Failed to pull bookings: {str(e)}")
+            specialists = self._parse_specialist_values(values.get("specialists", []))
+            self.sync_state.items_pulled += len(specialists)
+            logger.info(f"Pulled {len(specialists)} specialists from Sheets")
+
+            bookings = self._parse_booking_values(values.get("bookings", []))
+            self.sync_state.items_pulled += len(bookings)
+            logger.info(f"Pulled {len(bookings)} bookings from Sheets")
 
             self.sync_state.last_synced = datetime.now(timezone.utc)
+            self._last_pull_modified_time = modified_time
             logger.info(f"Pull sync completed: {self.sync_state.items_pulled} items pulled")
             return self.sync_state
 
@@ -754,45 +1388,100 @@ class GoogleSheetsManager:
             self._log_error("sync_error", f"Unexpected sync error: {str(e)}")
             return self.sync_state
 
+    def _fetch_modified_time(self) -> Optional[str]:
+        """
+        Get the spreadsheet's last modification time from the Drive API.
+
+        The Sheets API exposes no revision ID, and this is a small metadata
+        request compared with reading the worksheets.
+
+        Returns:
+            The modifiedTime string, or None if it could not be fetched
+        """
+        try:
+            return self.spreadsheet.get_lastUpdateTime()
+        except Exception as e:
+            logger.debug(f"Could not fetch spreadsheet modified time: {e}")
+            return None
+
+    async def sync_push_changes_async(
+        self, local_specialists: list[SpecialistDTO], local_bookings: list[BookingDTO]
+    ) -> SyncState:
+        """
+        Push local changes to Google Sheets without blocking the event loop.
+
+        gspread is synchronous, so the sync runs in a worker thread. It waits for the
+        manager's lock, so overlapping syncs and direct calls run one at a time.
+
+        Args:
+            local_specialists: List of specialists to sync
+            local_bookings: List of bookings to sync
+
+        Returns:
+            SyncState object with sync statistics
+        """
+        return await asyncio.to_thread(self.sync_push_changes, local_specialists, local_bookings)
+
+    async def sync_pull_changes_async(self) -> SyncState:
+        """
+        Pull remote changes from Google Sheets without blocking the event loop.
+
+        gspread is synchronous, so the sync runs in a worker thread. It waits for the
+        manager's lock, so overlapping syncs and direct calls run one at a time.
+
+        Returns:
+            SyncState object with sync statistics
+        """
+        return await asyncio.to_thread(self.sync_pull_changes)
+
     def _sync_specialists(self, local: list[SpecialistDTO], remote: list[SpecialistDTO]) -> None:
         """Reconcile specialists between local and remote."""
         local_by_id = {s.id: s for s in local if s.id}
         remote_by_id = {s.id: s for s in remote if s.id}
 
-        # Add new specialists (local only)
-        for specialist in local:
-            if specialist.id and specialist.id not in remote_by_id:
-                try:
-                    self.add_specialist(specialist)
-                    self.sync_state.items_pushed += 1
-                except RecoverableExternalError as e:
-                    logger.error(f"Failed to add specialist: {e}")
-                    self.sync_state.errors.append(f"Failed to add specialist {specialist.name}: {str(e)}")
-
-        # Update existing specialists
-        for specialist_id, specialist in local_by_id.items():
-            if specialist_id in remote_by_id:
-                remote = remote_by_id[specialist_id]
-                if specialist.updated_at and remote.updated_at:
-                    if specialist.updated_at > remote.updated_at:
-                        try:
-                            self.update_specialist(specialist_id, specialist)
-                            self.sync_state.items_pushed += 1
-                        except RecoverableExternalError as e:
-                            logger.error(f"Failed to update specialist: {e}")
-                            self.sync_state.errors.append(f"Failed to update specialist {specialist.name}: {str(e)}")
+        # Add new specialists (local only) in one append request
+        new_specialists = [s for s in local if s.id and s.id not in remote_by_id]
+        if new_specialists:
+            try:
+                self.add_specialists(new_specialists)
+                self.sync_state.items_pushed += len(new_specialists)
+            except RecoverableExternalError as e:
+                logger.error(f"Failed to add specialists: {e}")
+                self.sync_state.errors.append(
+                    f"Failed to add specialists {', '.join(s.name for s in new_specialists)}: {str(e)}"
+                )
+
+        # Update specialists changed locally since the remote copy, in one write request
+        updates = {
+            specialist_id: specialist
+            for specialist_id, specialist in local_by_id.items()
+            if specialist_id in remote_by_id
+            and specialist.updated_at
+            and remote_by_id[specialist_id].updated_at
+            and specialist.updated_at > remote_by_id[specialist_id].updated_at
+        }
+        if updates:
+            try:
+                self.update_specialists(updates)
+                self.sync_state.items_pushed += len(updates)
+            except RecoverableExternalError as e:
+                logger.error(f"Failed to update specialists: {e}")
+                self.sync_state.errors.append(
+                    f"Failed to update specialists {', '.join(s.name for s in updates.values())}: {str(e)}"
+                )
 
     def _sync_bookings(self, local: list[BookingDTO], remote: list[BookingDTO]) -> None:
         """Reconcile bookings between local and remote."""
-        local_by_id = {b.id: b for b in local if b.id}
         remote_by_id = {b.id: b for b in remote if b.id}
 
-        # Add new bookings (local only)
-        for booking in local:
-            if booking.id and booking.id not in remote_by_id:
-                try:
-                    self.add_booking(booking)
-                    self.sync_state.items_pushed += 1
-                except RecoverableExternalError as e:
-                    logger.error(f"Failed to add booking: {e}")
-                    self.sync_state.errors.append(f"Failed to add booking for {booking.client_name}: {str(e)}")
+        # Add new bookings (local only) in one append request
+        new_bookings = [b for b in local if b.id and b.id not in remote_by_id]
+        if new_bookings:
+            try:
+                self.add_bookings(new_bookings)
+                self.sync_state.items_pushed += len(new_bookings)
+            except RecoverableExternalError as e:
+                logger.error(f"Failed to add bookings: {e}")
+                self.sync_state.errors.append(
+                    f"Failed to add bookings for {', '.join(b.client_name for b in new_bookings)}: {str(e)}"
+                )
@@ -188,6 +188,12 @@ class PlatformAdapter(ABC):
         """
         pass
     
+    async def close(self) -> None:
+        """Release resources held by the adapter, such as pooled HTTP connections.
+        
+        The default has nothing to release; adapters owning clients override it.
+        """
+    
     def get_platform_name(self) -> str:
         """Get platform name."""
         return self.platform_name
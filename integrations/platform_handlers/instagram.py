@@ -2,13 +2,19 @@
 
 import hashlib
 import hmac
+import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime, timezone
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from integrations.platform_handlers.base import (
     PlatformAdapter,
     Message,
@@ -19,6 +25,14 @@ from services.notifications.notifier import Notifier, NotificationEvent
 
 logger = logging.getLogger(__name__)
 
+# Attachment type -> (message type, media type); anything else is a document
+_ATTACHMENT_TYPE_MAP = {
+    "image": (MessageType.IMAGE, "image"),
+    "video": (MessageType.VIDEO, "video"),
+    "audio": (MessageType.VOICE, "audio"),
+}
+_DOCUMENT_ATTACHMENT = (MessageType.DOCUMENT, "document")
+
 
 class InstagramAdapter(PlatformAdapter):
     """Instagram platform adapter using Facebook Graph API."""
@@ -29,6 +43,7 @@ class InstagramAdapter(PlatformAdapter):
         app_secret: Optional[str] = None,
         verify_token: Optional[str] = None,
         notifier: Optional[Notifier] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize Instagram adapter.
         
@@ -37,6 +52,7 @@ class InstagramAdapter(PlatformAdapter):
             app_secret: Facebook App secret for webhook validation
             verify_token: Verify token for webhook subscription handshake
             notifier: Notifier instance for admin alerts
+            client: Shared HTTP client (created lazily if not provided)
         """
         super().__init__("instagram")
         self.page_access_token = page_access_token
@@ -44,11 +60,34 @@ class InstagramAdapter(PlatformAdapter):
         self.verify_token = verify_token
         self.notifier = notifier
         self.api_base = "https://graph.facebook.com/v18.0"
+        self._client = client
+        
+        # Keyed HMAC state, copied per webhook instead of re-keying each time
+        self._hmac_template = (
+            hmac.new(app_secret.encode("utf-8"), digestmod=hashlib.sha256)
+            if app_secret else None
+        )
         
         if not all([page_access_token, app_secret]):
             logger.warning("Instagram adapter initialized without credentials")
             self.is_available = False
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client.
+        
+        Returns:
+            AsyncClient reused across Graph API calls
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=2, max=10),
@@ -83,13 +122,12 @@ class InstagramAdapter(PlatformAdapter):
             }
             params = {"access_token": self.page_access_token}
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    params=params,
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                url,
+                json=data,
+                params=params,
+            )
+            response.raise_for_status()
             
             logger.debug(f"Sent Instagram message to {recipient_id}")
             return True
@@ -151,13 +189,12 @@ class InstagramAdapter(PlatformAdapter):
             }
             params = {"access_token": self.page_access_token}
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    params=params,
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                url,
+                json=data,
+                params=params,
+            )
+            response.raise_for_status()
             
             # Send caption as separate message if provided
             if caption:
@@ -202,13 +239,12 @@ class InstagramAdapter(PlatformAdapter):
             }
             params = {"access_token": self.page_access_token}
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    params=params,
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                url,
+                json=data,
+                params=params,
+            )
+            response.raise_for_status()
             
             return True
             
@@ -237,19 +273,23 @@ class InstagramAdapter(PlatformAdapter):
     
     def parse_webhook(
         self,
-        payload: Dict[str, Any],
+        payload: Union[Dict[str, Any], bytes, str],
         headers: Optional[Dict[str, str]] = None
     ) -> Optional[Message]:
         """Parse Instagram webhook payload.
         
         Args:
-            payload: Instagram webhook JSON payload
+            payload: Instagram webhook JSON payload (decoded or raw body)
             headers: HTTP headers from webhook request
             
         Returns:
             Parsed Message object or None if parsing failed
         """
         try:
+            # Decode raw request bodies straight from bytes
+            if isinstance(payload, (bytes, str)):
+                payload = orjson.loads(payload) if orjson is not None else json.loads(payload)
+            
             # Handle webhook verification challenge
             if "hub.challenge" in payload:
                 logger.info("Received Instagram webhook verification challenge")
@@ -260,15 +300,17 @@ class InstagramAdapter(PlatformAdapter):
             if not entries:
                 return None
             
-            for entry in entries:
-                messaging_events = entry.get("messaging", [])
-                
-                for event in messaging_events:
-                    # Parse message event
-                    if "message" in event:
-                        return self._parse_message_event(event)
-            
-            return None
+            # Only the first message event is parsed; stop scanning there
+            event = next(
+                (
+                    event
+                    for entry in entries
+                    for event in entry.get("messaging", ())
+                    if "message" in event
+                ),
+                None,
+            )
+            return self._parse_message_event(event) if event is not None else None
             
         except Exception as e:
             logger.error(f"Failed to parse Instagram webhook: {e}")
@@ -302,19 +344,9 @@ class InstagramAdapter(PlatformAdapter):
             attachment_type = attachment.get("type", "")
             payload = attachment.get("payload", {})
             media_url = payload.get("url")
-            
-            if attachment_type == "image":
-                message_type = MessageType.IMAGE
-                media_type = "image"
-            elif attachment_type == "video":
-                message_type = MessageType.VIDEO
-                media_type = "video"
-            elif attachment_type == "audio":
-                message_type = MessageType.VOICE
-                media_type = "audio"
-            else:
-                message_type = MessageType.DOCUMENT
-                media_type = "document"
+            message_type, media_type = _ATTACHMENT_TYPE_MAP.get(
+                attachment_type, _DOCUMENT_ATTACHMENT
+            )
         
         return Message(
             message_id=message_id,
@@ -354,7 +386,6 @@ class InstagramAdapter(PlatformAdapter):
         try:
             # Convert payload to bytes if needed
             if isinstance(payload, dict):
-                import json
                 payload_bytes = json.dumps(payload, separators=(',', ':')).encode("utf-8")
             elif isinstance(payload, str):
                 payload_bytes = payload.encode("utf-8")
@@ -362,18 +393,15 @@ class InstagramAdapter(PlatformAdapter):
                 payload_bytes = payload
             
             # Compute HMAC-SHA256 signature
-            expected_signature = hmac.new(
-                self.app_secret.encode("utf-8"),
-                payload_bytes,
-                hashlib.sha256
-            ).hexdigest()
+            mac = self._hmac_template.copy()
+            mac.update(payload_bytes)
             
             # Remove sha256= prefix from signature if present
             if signature.startswith("sha256="):
                 signature = signature[7:]
             
-            # Compare signatures
-            is_valid = hmac.compare_digest(expected_signature, signature)
+            # Compare raw digests; malformed hex raises ValueError below
+            is_valid = hmac.compare_digest(mac.digest(), bytes.fromhex(signature))
             
             if not is_valid:
                 raise WebhookValidationError("Invalid webhook signature")
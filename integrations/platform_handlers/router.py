@@ -1,6 +1,8 @@
 """Message routing layer for normalizing inbound messages."""
 
+import hashlib
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Callable, Awaitable
 from datetime import datetime, timezone
 
@@ -11,6 +13,14 @@ from core.i18n import detect_language
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _hashed_user_id(platform: str, platform_user_id: str) -> int:
+    """Hash a platform user ID to a stable integer (cached per user)."""
+    hash_value = hashlib.sha256(f"{platform}:{platform_user_id}".encode()).hexdigest()
+    # Convert first 8 hex chars to integer (max ~4 billion)
+    return int(hash_value[:8], 16)
+
+
 class MessageRouter:
     """Routes and normalizes inbound messages from multiple platforms."""
     
@@ -40,6 +50,14 @@ class MessageRouter:
         self.adapters[platform] = adapter
         logger.info(f"Registered {platform} adapter")
     
+    async def close(self) -> None:
+        """Close every registered adapter; call on application shutdown."""
+        for platform, adapter in self.adapters.items():
+            try:
+                await adapter.close()
+            except Exception as e:
+                logger.error(f"Failed to close {platform} adapter: {e}")
+    
     async def route_message(
         self,
         message: Message,
@@ -162,11 +180,7 @@ class MessageRouter:
         
         # For other platforms, hash to create consistent integer ID
         # In production, replace this with database lookup/creation
-        import hashlib
-        hash_input = f"{platform}:{platform_user_id}"
-        hash_value = hashlib.sha256(hash_input.encode()).hexdigest()
-        # Convert first 8 hex chars to integer (max ~4 billion)
-        user_id = int(hash_value[:8], 16)
+        user_id = _hashed_user_id(platform, str(platform_user_id))
         
         logger.debug(f"Mapped {platform}:{platform_user_id} to internal ID {user_id}")
         return user_id
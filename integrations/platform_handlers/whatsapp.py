@@ -1,5 +1,6 @@
 """WhatsApp platform adapter using Twilio API."""
 
+import base64
 import hashlib
 import hmac
 import logging
@@ -30,6 +31,7 @@ class WhatsAppAdapter(PlatformAdapter):
         auth_token: Optional[str] = None,
         from_number: Optional[str] = None,
         notifier: Optional[Notifier] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize WhatsApp adapter.
         
@@ -38,18 +40,42 @@ class WhatsAppAdapter(PlatformAdapter):
             auth_token: Twilio auth token
             from_number: WhatsApp-enabled Twilio number (format: whatsapp:+1234567890)
             notifier: Notifier instance for admin alerts
+            client: Shared HTTP client (created lazily if not provided)
         """
         super().__init__("whatsapp")
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.from_number = from_number
         self.notifier = notifier
+        self._client = client
+        
+        # Keyed HMAC state, copied per signature instead of re-keying each time
+        self._hmac_template = (
+            hmac.new(auth_token.encode("utf-8"), digestmod=hashlib.sha1)
+            if auth_token else None
+        )
         self.api_base = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}"
         
         if not all([account_sid, auth_token, from_number]):
             logger.warning("WhatsApp adapter initialized without credentials")
             self.is_available = False
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client.
+        
+        Returns:
+            AsyncClient reused across Twilio API calls
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=2, max=10),
@@ -86,13 +112,12 @@ class WhatsAppAdapter(PlatformAdapter):
                 "Body": text,
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    data=data,
-                    auth=(self.account_sid, self.auth_token),
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                url,
+                data=data,
+                auth=(self.account_sid, self.auth_token),
+            )
+            response.raise_for_status()
             
             logger.debug(f"Sent WhatsApp message to {recipient_id}")
             return True
@@ -149,13 +174,12 @@ class WhatsAppAdapter(PlatformAdapter):
             if caption:
                 data["Body"] = caption
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    data=data,
-                    auth=(self.account_sid, self.auth_token),
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                url,
+                data=data,
+                auth=(self.account_sid, self.auth_token),
+            )
+            response.raise_for_status()
             
             logger.debug(f"Sent WhatsApp {media_type} to {recipient_id}")
             return True
@@ -296,20 +320,7 @@ class WhatsAppAdapter(PlatformAdapter):
             return False
         
         try:
-            # Sort parameters and concatenate with URL
-            sorted_params = sorted(payload.items())
-            data_string = url + "".join([f"{k}{v}" for k, v in sorted_params])
-            
-            # Compute HMAC-SHA1 signature
-            expected_signature = hmac.new(
-                self.auth_token.encode("utf-8"),
-                data_string.encode("utf-8"),
-                hashlib.sha1
-            ).digest()
-            
-            # Encode as base64
-            import base64
-            expected_signature_b64 = base64.b64encode(expected_signature).decode("utf-8")
+            expected_signature_b64 = self._compute_signature(url, payload)
             
             # Compare signatures
             is_valid = hmac.compare_digest(expected_signature_b64, signature)
@@ -323,6 +334,23 @@ class WhatsAppAdapter(PlatformAdapter):
             logger.error(f"Webhook validation failed: {e}")
             raise WebhookValidationError(f"Webhook validation failed: {e}")
     
+    def _compute_signature(self, url: str, payload: Dict[str, Any]) -> str:
+        """Compute the Twilio request signature for a webhook.
+        
+        Args:
+            url: Full webhook URL
+            payload: Webhook form data
+            
+        Returns:
+            Base64-encoded HMAC-SHA1 of the URL followed by the sorted parameters
+        """
+        # Sort parameters and concatenate with URL
+        data_string = url + "".join(f"{k}{v}" for k, v in sorted(payload.items()))
+        
+        mac = self._hmac_template.copy()
+        mac.update(data_string.encode("utf-8"))
+        return base64.b64encode(mac.digest()).decode("utf-8")
+    
     async def _notify_admin_error(self, recipient_id: str, error: str) -> None:
         """Notify admin of adapter error.
         
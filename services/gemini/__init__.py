@@ -3,6 +3,7 @@
 from services.gemini.client import GeminiClient
 from services.gemini.analyzer import (
     GeminiAnalyzer,
+    AnalysisResult,
     RequestType,
     UrgencyLevel,
     ClassificationResult,
@@ -12,6 +13,7 @@ from services.gemini.analyzer import (
 __all__ = [
     "GeminiClient",
     "GeminiAnalyzer",
+    "AnalysisResult",
     "RequestType",
     "UrgencyLevel",
     "ClassificationResult",
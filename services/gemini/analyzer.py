@@ -1,10 +1,13 @@
 """AI-powered request analysis and response generation using Gemini."""
 
 import hashlib
+import heapq
 import json
 import logging
 import re
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Optional
 
@@ -13,12 +16,67 @@ try:
 except ImportError:
     genai = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from core.i18n import get_text
 from exceptions import GeminiError
 from services.gemini.client import GeminiClient
 
 logger = logging.getLogger(__name__)
 
+# Default maximum number of cached classifications per analyzer
+DEFAULT_CACHE_MAXSIZE = 5000
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _normalize_message(message: str) -> str:
+    """Normalize message text so trivially different phrasings share a cache key."""
+    text = _PUNCTUATION_RE.sub("", message.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _noop_notifier(service_name: str, error_msg: str) -> None:
+    """Notifier used when no callback is configured."""
+
+
+def _extract_json_object(text: str) -> Optional[dict]:
+    """Extract the first JSON object from text that may wrap it in prose.
+
+    The outermost-braces match covers the common case in one parse; if the
+    surrounding text contains stray braces, fall back to decoding from each
+    '{' in turn.
+    """
+    match = _JSON_OBJECT_RE.search(text)
+    if not match:
+        return None
+
+    try:
+        candidate = match.group()
+        data = orjson.loads(candidate) if orjson is not None else json.loads(candidate)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    start = match.start()
+    while start != -1:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
+
+    return None
+
 
 class RequestType(str, Enum):
     """Classification types for user requests."""
@@ -42,22 +100,24 @@ class UrgencyLevel(str, Enum):
     HIGH = "high"
 
 
+# Value -> member lookups for parsing model output without Enum() coercion
+_REQUEST_TYPES = {member.value: member for member in RequestType}
+_URGENCY_LEVELS = {member.value: member for member in UrgencyLevel}
+
+
+@dataclass(frozen=True)
 class ClassificationResult:
-    """Structured result of request classification."""
+    """Structured result of request classification.
 
-    def __init__(
-        self,
-        request_type: RequestType,
-        urgency: UrgencyLevel,
-        specialist_suggestion: Optional[str] = None,
-        confidence: float = 0.5,
-        reasoning: Optional[str] = None,
-    ):
-        self.request_type = request_type
-        self.urgency = urgency
-        self.specialist_suggestion = specialist_suggestion
-        self.confidence = confidence
-        self.reasoning = reasoning
+    Frozen because instances are shared between callers through the
+    classification cache.
+    """
+
+    request_type: RequestType
+    urgency: UrgencyLevel
+    specialist_suggestion: Optional[str] = None
+    confidence: float = 0.5
+    reasoning: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -79,18 +139,18 @@ class ResponseResult:
         self.error = error
 
 
-class CachedClassification:
-    """Container for cached classification with TTL."""
-
-    def __init__(self, result: ClassificationResult, ttl_seconds: int = 3600):
-        self.result = result
-        self.created_at = datetime.now(timezone.utc)
-        self.ttl_seconds = ttl_seconds
+class AnalysisResult:
+    """Combined classification, response and summary from a single request."""
 
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired."""
-        age = (datetime.now(timezone.utc) - self.created_at).total_seconds()
-        return age > self.ttl_seconds
+    def __init__(
+        self,
+        classification: ClassificationResult,
+        response: ResponseResult,
+        summary: ResponseResult,
+    ):
+        self.classification = classification
+        self.response = response
+        self.summary = summary
 
 
 class GeminiAnalyzer:
@@ -101,6 +161,8 @@ class GeminiAnalyzer:
         client: Optional[GeminiClient] = None,
         cache_ttl: int = 3600,
         notifier_callback: Optional[Callable[[str, str], None]] = None,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize the Gemini analyzer.
@@ -109,6 +171,9 @@ class GeminiAnalyzer:
             client: GeminiClient instance (creates new one if not provided)
             cache_ttl: Cache TTL in seconds (default 3600)
             notifier_callback: Function to call on hard failures (service_name, error_msg)
+            cache_maxsize: Maximum number of cached classifications; the least
+                recently used entry is evicted beyond this (default 5000)
+            clock: Monotonic time source for cache expiry (default time.monotonic)
         """
         try:
             self.client = client or GeminiClient()
@@ -117,44 +182,112 @@ class GeminiAnalyzer:
             raise GeminiError(f"Analyzer initialization failed: {e}")
 
         self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._clock = clock
         self.notifier_callback = notifier_callback
-        self._classification_cache: dict[str, CachedClassification] = {}
+        # key -> (result, monotonic expiry) in least-recently-used order; the heap
+        # orders keys by expiry so stale entries are evicted on insert instead of
+        # scanned on every read.
+        self._classification_cache: OrderedDict[
+            str, tuple[ClassificationResult, float]
+        ] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
 
     def _get_cache_key(self, message: str, language: str) -> str:
-        """Generate cache key from message hash and language."""
-        message_hash = hashlib.md5(message.encode()).hexdigest()
+        """Generate cache key from normalized message hash and language."""
+        normalized = _normalize_message(message)
+        message_hash = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
         return f"{message_hash}:{language}"
 
     def _get_from_cache(self, key: str) -> Optional[ClassificationResult]:
         """Retrieve from cache if exists and not expired."""
-        if key in self._classification_cache:
-            cached = self._classification_cache[key]
-            if not cached.is_expired():
-                logger.debug(f"Cache hit for key: {key}")
-                return cached.result
-            else:
-                logger.debug(f"Cache expired for key: {key}")
-                del self._classification_cache[key]
-        return None
+        entry = self._classification_cache.get(key)
+        if entry is None:
+            return None
+
+        result, expires_at = entry
+        if self._clock() > expires_at:
+            logger.debug(f"Cache expired for key: {key}")
+            del self._classification_cache[key]
+            return None
+
+        self._classification_cache.move_to_end(key)
+        logger.debug(f"Cache hit for key: {key}")
+        return result
 
     def _set_cache(self, key: str, result: ClassificationResult) -> None:
-        """Store in cache."""
-        self._classification_cache[key] = CachedClassification(result, self.cache_ttl)
+        """Store in cache, evicting expired and least recently used entries."""
+        now = self._clock()
+        self._evict_expired(now)
+
+        expires_at = now + self.cache_ttl
+        self._classification_cache[key] = (result, expires_at)
+        self._classification_cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        if len(self._classification_cache) > self.cache_maxsize:
+            evicted_key, _ = self._classification_cache.popitem(last=False)
+            logger.debug(f"Cache full, evicted key: {evicted_key}")
+
+        # Re-sets and LRU evictions leave stale heap records behind; rebuild the
+        # heap from live entries before it outgrows the cache
+        if len(self._expiry_heap) > 2 * self.cache_maxsize:
+            self._compact_expiry_heap()
         logger.debug(f"Cached classification for key: {key}")
 
+    def _evict_expired(self, now: float) -> None:
+        """Pop expired keys off the expiry heap and drop them from the cache."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._classification_cache.get(key)
+            # Skip heap records superseded by a later _set_cache for the same key
+            if entry is not None and entry[1] == expires_at:
+                del self._classification_cache[key]
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap with one record per cached key."""
+        self._expiry_heap = [
+            (expires_at, key) for key, (_, expires_at) in self._classification_cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
     def clear_cache(self) -> None:
         """Clear all cached classifications."""
         self._classification_cache.clear()
+        self._expiry_heap.clear()
         logger.info("Classification cache cleared")
 
     def _trigger_notifier(self, error_msg: str) -> None:
         """Trigger notifier callback on hard failures."""
-        if self.notifier_callback:
-            try:
-                self.notifier_callback("gemini", error_msg)
-                logger.info("Notifier callback triggered")
-            except Exception as e:
-                logger.error(f"Error in notifier callback: {e}")
+        try:
+            notify = self.notifier_callback or _noop_notifier
+            notify("gemini", error_msg)
+        except Exception as e:
+            logger.error(f"Error in notifier callback: {e}")
+
+    def _get_generative_model(
+        self,
+        language: str,
+        system_prompt: str,
+        temperature: float,
+        max_output_tokens: int,
+    ) -> Any:
+        """
+        Build a GenerativeModel for the prompt and generation settings.
+
+        Models are cheap to build and the system prompt usually embeds
+        per-request context, so a fresh one is built for every call; genai
+        keeps its own default client per process either way.
+        """
+        return genai.GenerativeModel(
+            self.client.get_model(language),
+            system_instruction=system_prompt,
+            generation_config=self.client.get_generation_config(
+                temperature=temperature, max_output_tokens=max_output_tokens
+            ),
+            safety_settings=self.client.get_safety_settings(),
+        )
 
     def classify_request(self, user_message: str, language: str = "ru") -> ClassificationResult:
         """
@@ -181,17 +314,10 @@ class GeminiAnalyzer:
         system_prompt = self._get_classification_prompt(language)
 
         try:
-            model = self.client.get_model(language)
-            generation_config = self.client.get_generation_config(
-                temperature=0.3, max_output_tokens=300
+            model = self._get_generative_model(
+                language, system_prompt, temperature=0.3, max_output_tokens=300
             )
-            
-            response = genai.GenerativeModel(
-                model,
-                system_instruction=system_prompt,
-                generation_config=generation_config,
-                safety_settings=self.client.get_safety_settings(),
-            ).generate_content(
+            response = model.generate_content(
                 user_message,
                 request_options={"timeout": self.client.get_request_timeout()},
             )
@@ -234,17 +360,10 @@ class GeminiAnalyzer:
         system_prompt = self._get_response_prompt(language, context)
 
         try:
-            model = self.client.get_model(language)
-            generation_config = self.client.get_generation_config(
-                temperature=0.7, max_output_tokens=500
+            model = self._get_generative_model(
+                language, system_prompt, temperature=0.7, max_output_tokens=500
             )
-            
-            response = genai.GenerativeModel(
-                model,
-                system_instruction=system_prompt,
-                generation_config=generation_config,
-                safety_settings=self.client.get_safety_settings(),
-            ).generate_content(
+            response = model.generate_content(
                 message,
                 request_options={"timeout": self.client.get_request_timeout()},
             )
@@ -277,17 +396,10 @@ class GeminiAnalyzer:
         system_prompt = self._get_summary_prompt(language)
 
         try:
-            model = self.client.get_model(language)
-            generation_config = self.client.get_generation_config(
-                temperature=0.5, max_output_tokens=300
+            model = self._get_generative_model(
+                language, system_prompt, temperature=0.5, max_output_tokens=300
             )
-            
-            response = genai.GenerativeModel(
-                model,
-                system_instruction=system_prompt,
-                generation_config=generation_config,
-                safety_settings=self.client.get_safety_settings(),
-            ).generate_content(
+            response = model.generate_content(
                 long_text,
                 request_options={"timeout": self.client.get_request_timeout()},
             )
@@ -306,6 +418,67 @@ class GeminiAnalyzer:
                 error=str(e),
             )
 
+    def analyze_all(
+        self,
+        message: str,
+        language: str = "ru",
+        context: Optional[dict[str, Any]] = None,
+    ) -> AnalysisResult:
+        """
+        Classify, answer and summarize a message with a single Gemini request.
+
+        Equivalent to calling classify_request, generate_response and
+        summarize_complaint, but pays for one round-trip instead of three.
+
+        Args:
+            message: User message to analyze
+            language: Language code ('ru' or 'kz')
+            context: Additional context (specialist info, bookings, etc.)
+
+        Returns:
+            AnalysisResult with classification, response and summary
+        """
+        system_prompt = self._get_analysis_prompt(language, context)
+
+        try:
+            model = self._get_generative_model(
+                language, system_prompt, temperature=0.5, max_output_tokens=800
+            )
+            response = model.generate_content(
+                message,
+                request_options={"timeout": self.client.get_request_timeout()},
+            )
+
+            result = self._parse_analysis_response(response.text, language)
+            self._set_cache(self._get_cache_key(message, language), result.classification)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to analyze message: {e}")
+            self._trigger_notifier(f"Analysis error: {str(e)}")
+
+            classification = self._get_from_cache(self._get_cache_key(message, language))
+            if classification is None:
+                classification = ClassificationResult(
+                    request_type=RequestType.GENERAL_INQUIRY,
+                    urgency=UrgencyLevel.MEDIUM,
+                    confidence=0.0,
+                    reasoning="Fallback due to API error",
+                )
+            return AnalysisResult(
+                classification=classification,
+                response=ResponseResult(
+                    text=get_text("gemini.fallback_response", language),
+                    is_fallback=True,
+                    error=str(e),
+                ),
+                summary=ResponseResult(
+                    text=get_text("gemini.fallback_summary", language),
+                    is_fallback=True,
+                    error=str(e),
+                ),
+            )
+
     def _get_classification_prompt(self, language: str) -> str:
         """Get system prompt for classification task."""
         if language == "kz":
@@ -359,24 +532,65 @@ class GeminiAnalyzer:
 - Проблемная область:
 - Требуемое действие:"""
 
+    def _get_analysis_prompt(self, language: str, context: Optional[dict] = None) -> str:
+        """Get system prompt for the combined classify/respond/summarize task."""
+        context_str = ""
+        if context:
+            context_str = f"\n\nКонтекст: {json.dumps(context, ensure_ascii=False, indent=2)}"
+
+        if language == "kz":
+            return f"""Сіз клиника әкімшісінің көмекшісіз.
+Пайдаланушының хабарламасын талдап, бір JSON нысанын қайтарыңыз:
+
+{{
+  "classification": {{
+    "request_type": одна из: appointment_booking, appointment_cancellation, appointment_rescheduling, schedule_inquiry, specialist_inquiry, complaint, feedback, general_inquiry, other
+    "urgency": одна из: low, medium, high
+    "specialist_suggestion": ұсынылған мамандық немесе null
+    "confidence": 0-ден 1-ге дейінгі сан
+    "reasoning": қысқа түсініктеме
+  }},
+  "response": пайдаланушыға сыпайы әрі ресми жауап,
+  "summary": хабарламаның 1-2 сөйлемдік қысқаша мазмұны
+}}{context_str}"""
+        else:  # Russian default
+            return f"""Вы помощник администратора клиники.
+Проанализируйте сообщение пользователя и верните один JSON-объект:
+
+{{
+  "classification": {{
+    "request_type": одна из: appointment_booking, appointment_cancellation, appointment_rescheduling, schedule_inquiry, specialist_inquiry, complaint, feedback, general_inquiry, other
+    "urgency": одна из: low, medium, high
+    "specialist_suggestion": рекомендуемая специальность или null
+    "confidence": число от 0 до 1
+    "reasoning": краткое обоснование
+  }},
+  "response": вежливый, официальный, но дружелюбный ответ пользователю,
+  "summary": краткое резюме сообщения в 1-2 предложения
+}}{context_str}"""
+
     def _parse_classification_response(
         self, response_text: str, language: str
     ) -> ClassificationResult:
         """Parse classification response from Gemini."""
-        try:
-            # Extract JSON from response
-            json_match = re.search(r"\{[\s\S]*\}", response_text)
-            if not json_match:
-                logger.warning(f"No JSON found in response: {response_text}")
-                return ClassificationResult(
-                    request_type=RequestType.GENERAL_INQUIRY,
-                    urgency=UrgencyLevel.MEDIUM,
-                )
+        # Extract JSON from response
+        data = _extract_json_object(response_text)
+        if data is None:
+            logger.warning(f"No JSON found in response: {response_text}")
+            return ClassificationResult(
+                request_type=RequestType.GENERAL_INQUIRY,
+                urgency=UrgencyLevel.MEDIUM,
+            )
 
-            data = json.loads(json_match.group())
+        return self._classification_from_dict(data)
 
-            request_type = RequestType(data.get("request_type", "other"))
-            urgency = UrgencyLevel(data.get("urgency", "medium"))
+    def _classification_from_dict(self, data: dict) -> ClassificationResult:
+        """Build a ClassificationResult from decoded classification JSON."""
+        try:
+            request_type = _REQUEST_TYPES.get(
+                data.get("request_type", "other"), RequestType.GENERAL_INQUIRY
+            )
+            urgency = _URGENCY_LEVELS.get(data.get("urgency", "medium"), UrgencyLevel.MEDIUM)
             specialist_suggestion = data.get("specialist_suggestion")
             confidence = float(data.get("confidence", 0.5))
             reasoning = data.get("reasoning")
@@ -389,10 +603,47 @@ class GeminiAnalyzer:
                 reasoning=reasoning,
             )
 
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             logger.error(f"Failed to parse classification response: {e}")
             return ClassificationResult(
                 request_type=RequestType.GENERAL_INQUIRY,
                 urgency=UrgencyLevel.MEDIUM,
                 reasoning="Parsing error",
             )
+
+    def _parse_analysis_response(self, response_text: str, language: str) -> AnalysisResult:
+        """Parse combined analysis response from Gemini."""
+        data = _extract_json_object(response_text)
+        if data is None:
+            logger.warning(f"No JSON found in analysis response: {response_text}")
+            data = {}
+
+        classification_data = data.get("classification")
+        if isinstance(classification_data, dict):
+            classification = self._classification_from_dict(classification_data)
+        else:
+            classification = ClassificationResult(
+                request_type=RequestType.GENERAL_INQUIRY,
+                urgency=UrgencyLevel.MEDIUM,
+                reasoning="Parsing error",
+            )
+
+        return AnalysisResult(
+            classification=classification,
+            response=self._text_field_result(data, "response", "gemini.fallback_response", language),
+            summary=self._text_field_result(data, "summary", "gemini.fallback_summary", language),
+        )
+
+    def _text_field_result(
+        self, data: dict, field: str, fallback_key: str, language: str
+    ) -> ResponseResult:
+        """Wrap a text field of the analysis JSON, falling back to locale text if absent."""
+        text = data.get(field)
+        if isinstance(text, str) and text.strip():
+            return ResponseResult(text=text.strip(), is_fallback=False)
+
+        return ResponseResult(
+            text=get_text(fallback_key, language),
+            is_fallback=True,
+            error=f"Missing '{field}' in analysis response",
+        )
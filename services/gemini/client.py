@@ -33,6 +33,23 @@ DEFAULT_SAFETY_SETTINGS = [
     {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
 ]
 
+# API key the process-wide genai configuration was last set up with.
+# genai.configure() discards the cached transport clients, so running it again
+# for the same key would force a new TLS/gRPC channel on the next request.
+_configured_api_key: Optional[str] = None
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure genai for the given key, reusing the existing channel if unchanged."""
+    global _configured_api_key
+
+    if _configured_api_key == api_key:
+        logger.debug("Reusing existing Gemini configuration")
+        return
+
+    genai.configure(api_key=api_key)
+    _configured_api_key = api_key
+
 
 class GeminiClient:
     """Google Gemini client wrapper with initialization and shared configuration."""
@@ -62,7 +79,7 @@ class GeminiClient:
             )
 
         try:
-            genai.configure(api_key=self.api_key)
+            _configure_genai(self.api_key)
             logger.info("Gemini client configured successfully")
         except Exception as e:
             logger.error(f"Failed to configure Gemini client: {e}")
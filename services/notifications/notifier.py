@@ -35,9 +35,9 @@ from services.notifications.templates import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class NotificationEvent:
-    """Represents a notification event."""
+    """Represents an immutable notification event."""
 
     event_type: str  # booking_created, booking_cancelled, complaint_received
     recipient_id: int
@@ -334,7 +334,7 @@ class Notifier:
         Returns:
             True if sent to at least one channel, False if all failed
         """
-        results = []
+        sends = []
 
         for channel_name in channels:
             if channel_name not in self.adapters:
@@ -347,21 +347,49 @@ class Notifier:
                 logger.warning(f"Adapter {channel_name} is unavailable")
                 continue
 
-            try:
-                success = await adapter.send(
-                    recipient_id,
-                    message,
-                    subject=subject,
+            sends.append(
+                self._send_via_adapter(
+                    channel_name, adapter, recipient_id, message, subject
                 )
-                results.append(success)
-            except Exception as e:
-                logger.error(
-                    f"Error sending to {channel_name} for {recipient_id}: {e}"
-                )
-                results.append(False)
+            )
+
+        # Channels are independent, so deliver to all of them concurrently
+        results = await asyncio.gather(*sends)
 
         return any(results) if results else False
 
+    async def _send_via_adapter(
+        self,
+        channel_name: str,
+        adapter: NotificationAdapter,
+        recipient_id: int,
+        message: str,
+        subject: Optional[str] = None,
+    ) -> bool:
+        """Send message through a single adapter, treating errors as failure.
+
+        Args:
+            channel_name: Channel name for logging
+            adapter: Adapter to send through
+            recipient_id: ID of recipient
+            message: Message to send
+            subject: Optional subject
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        try:
+            return await adapter.send(
+                recipient_id,
+                message,
+                subject=subject,
+            )
+        except Exception as e:
+            logger.error(
+                f"Error sending to {channel_name} for {recipient_id}: {e}"
+            )
+            return False
+
     async def _handle_failed_notification(
         self,
         event: NotificationEvent,
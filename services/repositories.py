@@ -53,6 +53,7 @@ class SpecialistRepository(BaseRepository):
                 now,
             ]
             worksheet.append_row(row)
+            self.sheets_manager.invalidate("specialists")
             
             # Log action
             self.sheets_manager.log_admin_action(
@@ -192,6 +193,7 @@ class DayOffRepository(BaseRepository):
                 now,
             ]
             worksheet.append_row(row)
+            self.sheets_manager.invalidate("days_off")
             
             # Log action
             self.sheets_manager.log_admin_action(
@@ -1,13 +1,119 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
 try:
     import pytest_asyncio
 except ImportError:
     pytest_asyncio = None
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    # pytest-asyncio builds its loops from the global policy
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+from services.notifications.adapters import (  # noqa: E402
+    TelegramAdapter,
+    WhatsAppAdapter,
+)
+
+
+def _mock_adapter(adapter_cls):
+    """Yield a mock-mode adapter and reset its state afterwards."""
+    adapter = adapter_cls()
+    adapter.enable_mock_mode()
+    yield adapter
+    adapter.clear_sent_messages()
+    adapter.is_available = True
+
+
+@pytest.fixture
+def telegram_mock():
+    """Telegram adapter in mock mode."""
+    yield from _mock_adapter(TelegramAdapter)
+
+
+@pytest.fixture
+def whatsapp_mock():
+    """WhatsApp adapter in mock mode."""
+    yield from _mock_adapter(WhatsAppAdapter)
+
+
+class AsyncRecorder:
+    """Minimal awaitable callback recording the first positional argument."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append(args[0] if args else None)
+
+
+class StubAdapter:
+    """Minimal platform adapter double recording parsed payloads and sends."""
+
+    def __init__(self, platform_name):
+        self.platform_name = platform_name
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and the configured parse result."""
+        self.parse_webhook_returns = None
+        self.parsed = []
+        self.sent = []
+        self.closed = False
+
+    def parse_webhook(self, payload, headers=None):
+        self.parsed.append(payload)
+        return self.parse_webhook_returns
+
+    async def send_message(self, recipient_id, text, **kwargs):
+        self.sent.append({"recipient_id": recipient_id, "text": text, **kwargs})
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="session")
+def stub_adapter():
+    """Factory for StubAdapter instances (cheaper than a spec'd MagicMock)."""
+    return StubAdapter
+
+
+@pytest.fixture
+def log_recorder():
+    """Async log callback that records each logged entry."""
+    return AsyncRecorder()
+
+
+@pytest.fixture(scope="session")
+def instagram_adapter():
+    """Instagram platform adapter with test credentials."""
+    from integrations.platform_handlers.instagram import InstagramAdapter as Adapter
+
+    return Adapter(
+        page_access_token="test_page_token",
+        app_secret="test_app_secret",
+        verify_token="test_verify_token"
+    )
+
+
+@pytest.fixture(scope="session")
+def instagram_adapter_no_creds():
+    """Instagram platform adapter without credentials."""
+    from integrations.platform_handlers.instagram import InstagramAdapter as Adapter
+
+    return Adapter()
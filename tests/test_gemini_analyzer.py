@@ -2,8 +2,8 @@
 
 import json
 import pytest
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, patch, call
-from datetime import datetime, timedelta, timezone
 
 from services.gemini.analyzer import (
     GeminiAnalyzer,
@@ -11,7 +11,6 @@ from services.gemini.analyzer import (
     UrgencyLevel,
     ClassificationResult,
     ResponseResult,
-    CachedClassification,
 )
 from services.gemini.client import GeminiClient
 from exceptions import GeminiError
@@ -49,6 +48,16 @@ class TestClassificationResult:
         assert result_dict["confidence"] == 0.7
 
 
+    def test_classification_result_is_immutable(self):
+        """Test cached classification results cannot be modified by callers."""
+        result = ClassificationResult(
+            request_type=RequestType.COMPLAINT,
+            urgency=UrgencyLevel.MEDIUM,
+        )
+        with pytest.raises(FrozenInstanceError):
+            result.urgency = UrgencyLevel.HIGH
+
+
 class TestResponseResult:
     """Tests for ResponseResult."""
 
@@ -71,30 +80,6 @@ class TestResponseResult:
         assert result.error == "API timeout"
 
 
-class TestCachedClassification:
-    """Tests for CachedClassification."""
-
-    def test_cache_not_expired(self):
-        """Test cache expiration check for fresh entry."""
-        result = ClassificationResult(
-            request_type=RequestType.GENERAL_INQUIRY,
-            urgency=UrgencyLevel.LOW,
-        )
-        cached = CachedClassification(result, ttl_seconds=3600)
-        assert not cached.is_expired()
-
-    def test_cache_expired(self):
-        """Test cache expiration check for old entry."""
-        result = ClassificationResult(
-            request_type=RequestType.GENERAL_INQUIRY,
-            urgency=UrgencyLevel.LOW,
-        )
-        cached = CachedClassification(result, ttl_seconds=1)
-        # Set created_at to past
-        cached.created_at = datetime.now(timezone.utc) - timedelta(seconds=2)
-        assert cached.is_expired()
-
-
 class TestGeminiAnalyzer:
     """Tests for GeminiAnalyzer."""
 
@@ -147,6 +132,17 @@ class TestGeminiAnalyzer:
             assert "ru" in key1
             assert "kz" in key2
 
+    @patch("services.gemini.client.genai")
+    def test_get_cache_key_normalizes_message(self, mock_genai):
+        """Test cache key ignores case, punctuation and extra whitespace."""
+        with patch.object(GeminiClient, "__init__", lambda x: None):
+            client = GeminiClient()
+            analyzer = GeminiAnalyzer(client=client)
+            key1 = analyzer._get_cache_key("Хочу записаться к врачу", "ru")
+            key2 = analyzer._get_cache_key("  хочу   записаться к врачу!! ", "ru")
+
+            assert key1 == key2
+
     @patch("services.gemini.client.genai")
     def test_cache_operations(self, mock_genai):
         """Test cache set and get operations."""
@@ -170,6 +166,66 @@ class TestGeminiAnalyzer:
             cached = analyzer._get_from_cache(key)
             assert cached == result
 
+    @patch("services.gemini.client.genai")
+    def test_set_cache_evicts_expired_entries(self, mock_genai):
+        """Test inserting into the cache drops entries whose TTL has elapsed."""
+        with patch.object(GeminiClient, "__init__", lambda x: None):
+            client = GeminiClient()
+            analyzer = GeminiAnalyzer(client=client, cache_ttl=10)
+
+            result = ClassificationResult(
+                request_type=RequestType.GENERAL_INQUIRY,
+                urgency=UrgencyLevel.LOW,
+            )
+            analyzer._clock = lambda: 100.0
+            analyzer._set_cache("old_key", result)
+            analyzer._clock = lambda: 200.0
+            analyzer._set_cache("new_key", result)
+
+            assert "old_key" not in analyzer._classification_cache
+            assert "new_key" in analyzer._classification_cache
+
+    @patch("services.gemini.client.genai")
+    def test_set_cache_evicts_least_recently_used_at_maxsize(self, mock_genai):
+        """Test the cache stays bounded by evicting the least recently used entry."""
+        with patch.object(GeminiClient, "__init__", lambda x: None):
+            client = GeminiClient()
+            analyzer = GeminiAnalyzer(client=client, cache_maxsize=2)
+
+            result = ClassificationResult(
+                request_type=RequestType.GENERAL_INQUIRY,
+                urgency=UrgencyLevel.LOW,
+            )
+            analyzer._set_cache("first", result)
+            analyzer._set_cache("second", result)
+            # Reading "first" makes "second" the least recently used entry
+            assert analyzer._get_from_cache("first") is result
+            analyzer._set_cache("third", result)
+
+            assert len(analyzer._classification_cache) == 2
+            assert analyzer._get_from_cache("second") is None
+            assert analyzer._get_from_cache("first") is result
+            assert analyzer._get_from_cache("third") is result
+
+    @patch("services.gemini.client.genai")
+    def test_expiry_heap_stays_bounded(self, mock_genai):
+        """Test re-sets and LRU evictions do not grow the expiry heap without bound."""
+        with patch.object(GeminiClient, "__init__", lambda x: None):
+            client = GeminiClient()
+            analyzer = GeminiAnalyzer(client=client, cache_maxsize=2)
+
+            result = ClassificationResult(
+                request_type=RequestType.GENERAL_INQUIRY,
+                urgency=UrgencyLevel.LOW,
+            )
+            for i in range(100):
+                analyzer._set_cache("hot", result)
+                analyzer._set_cache(f"cold_{i}", result)
+
+            assert len(analyzer._expiry_heap) <= 2 * analyzer.cache_maxsize
+            assert analyzer._get_from_cache("hot") is result
+            assert analyzer._get_from_cache("cold_99") is result
+
     @patch("services.gemini.client.genai")
     def test_clear_cache(self, mock_genai):
         """Test clearing classification cache."""
@@ -202,6 +258,19 @@ class TestGeminiAnalyzer:
             
             notifier.assert_called_once_with("gemini", "Test error message")
 
+    @patch("services.gemini.client.genai")
+    def test_trigger_notifier_uses_reassigned_callback(self, mock_genai):
+        """Test a callback assigned after construction is the one triggered."""
+        with patch.object(GeminiClient, "__init__", lambda x: None):
+            client = GeminiClient()
+            analyzer = GeminiAnalyzer(client=client, notifier_callback=None)
+            notifier = MagicMock()
+            analyzer.notifier_callback = notifier
+            
+            analyzer._trigger_notifier("Test error message")
+            
+            notifier.assert_called_once_with("gemini", "Test error message")
+
     @patch("services.gemini.client.genai")
     def test_trigger_notifier_without_callback(self, mock_genai):
         """Test analyzer works without notifier callback."""
@@ -529,3 +598,57 @@ class TestGeminiAnalyzer:
         
         assert result.request_type == RequestType.COMPLAINT
         assert result.urgency == UrgencyLevel.MEDIUM
+
+    @patch.object(GeminiClient, "__init__", lambda x: None)
+    def test_parse_classification_response_json_followed_by_braces(self):
+        """Test parsing JSON when the trailing text contains stray braces."""
+        client = GeminiClient()
+        analyzer = GeminiAnalyzer(client=client)
+        
+        response_text = f"""Result: {json.dumps({
+            "request_type": "feedback",
+            "urgency": "low",
+        })}
+        Note: fields like {{reasoning}} were omitted."""
+        
+        result = analyzer._parse_classification_response(response_text, "ru")
+        
+        assert result.request_type == RequestType.FEEDBACK
+        assert result.urgency == UrgencyLevel.LOW
+
+    @patch.object(GeminiClient, "__init__", lambda x: None)
+    def test_parse_classification_response_unknown_values(self):
+        """Test unknown enum values fall back without discarding other fields."""
+        client = GeminiClient()
+        analyzer = GeminiAnalyzer(client=client)
+        
+        response_text = json.dumps({
+            "request_type": "teleportation",
+            "urgency": "critical",
+            "confidence": 0.6,
+        })
+        
+        result = analyzer._parse_classification_response(response_text, "ru")
+        
+        assert result.request_type == RequestType.GENERAL_INQUIRY
+        assert result.urgency == UrgencyLevel.MEDIUM
+        assert result.confidence == 0.6
+
+    @patch.object(GeminiClient, "__init__", lambda x: None)
+    def test_parse_analysis_response_missing_fields(self):
+        """Test combined analysis parsing falls back per missing field."""
+        client = GeminiClient()
+        analyzer = GeminiAnalyzer(client=client)
+        
+        response_text = json.dumps({
+            "classification": {"request_type": "complaint", "urgency": "high"},
+            "response": "We are sorry to hear that.",
+        })
+        
+        result = analyzer._parse_analysis_response(response_text, "ru")
+        
+        assert result.classification.request_type == RequestType.COMPLAINT
+        assert result.response.text == "We are sorry to hear that."
+        assert result.response.is_fallback is False
+        assert result.summary.is_fallback is True
+        assert len(result.summary.text) > 0
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+import services.gemini.client as client_module
 from services.gemini.client import (
     GeminiClient,
     MODELS,
@@ -12,6 +13,12 @@ from services.gemini.client import (
 from exceptions import GeminiInitializationError
 
 
+@pytest.fixture(autouse=True)
+def reset_configured_api_key(monkeypatch):
+    """Start every test with an unconfigured genai module."""
+    monkeypatch.setattr(client_module, "_configured_api_key", None)
+
+
 class TestGeminiClient:
     """Tests for GeminiClient."""
 
@@ -52,6 +59,29 @@ class TestGeminiClient:
         with pytest.raises(GeminiInitializationError):
             GeminiClient(api_key="test-key")
 
+    @patch("services.gemini.client.genai")
+    def test_same_api_key_configures_once(self, mock_genai):
+        """Test clients sharing an API key reuse the existing configuration."""
+        GeminiClient(api_key="test-key")
+        GeminiClient(api_key="test-key")
+        mock_genai.configure.assert_called_once_with(api_key="test-key")
+
+    @patch("services.gemini.client.genai")
+    def test_different_api_key_reconfigures(self, mock_genai):
+        """Test switching API keys reconfigures genai."""
+        GeminiClient(api_key="key-one")
+        GeminiClient(api_key="key-two")
+        assert mock_genai.configure.call_count == 2
+
+    @patch("services.gemini.client.genai")
+    def test_failed_configure_is_retried(self, mock_genai):
+        """Test a failed configuration is not remembered as applied."""
+        mock_genai.configure.side_effect = [Exception("Configuration failed"), None]
+        with pytest.raises(GeminiInitializationError):
+            GeminiClient(api_key="test-key")
+        GeminiClient(api_key="test-key")
+        assert mock_genai.configure.call_count == 2
+
     @patch("services.gemini.client.genai")
     def test_get_model_russian(self, mock_genai):
         """Test get_model returns correct model for Russian."""
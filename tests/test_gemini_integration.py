@@ -14,234 +14,238 @@ from services.gemini import (
 from exceptions import GeminiInitializationError, GeminiError
 
 
-class TestGeminiIntegration:
-    """Integration tests for complete Gemini service workflows."""
-
-    @patch("services.gemini.client.genai")
-    def test_analyzer_complete_workflow(self, mock_genai):
-        """Test complete workflow: init -> classify -> response -> summary."""
-        # Setup
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
-
-            notifier = MagicMock()
-            analyzer = GeminiAnalyzer(
-                client=client,
-                cache_ttl=3600,
-                notifier_callback=notifier,
-            )
-
-            # Mock responses
-            mock_response_classify = MagicMock()
-            mock_response_classify.text = json.dumps({
-                "request_type": "appointment_booking",
-                "urgency": "high",
-                "confidence": 0.95,
-            })
-
-            mock_response_generate = MagicMock()
-            mock_response_generate.text = "You can book through our website."
-
-            mock_response_summary = MagicMock()
-            mock_response_summary.text = "Patient wants faster booking process."
-
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.side_effect = [
-                mock_response_classify,
-                mock_response_generate,
-                mock_response_summary,
-            ]
-
-            # Execute
-            classification = analyzer.classify_request(
-                "I want to book an appointment tomorrow", "ru"
-            )
-            response = analyzer.generate_response("How do I book?", language="ru")
-            summary = analyzer.summarize_complaint(
-                "The booking process is too complicated...", "ru"
-            )
-
-            # Assert
-            assert classification.request_type == RequestType.APPOINTMENT_BOOKING
-            assert classification.urgency == UrgencyLevel.HIGH
-            assert response.text == "You can book through our website."
-            assert response.is_fallback is False
-            assert summary.text == "Patient wants faster booking process."
-            assert summary.is_fallback is False
-
-            # Notifier should not be called for successful operations
-            notifier.assert_not_called()
-
-    @patch("services.gemini.client.genai")
-    def test_analyzer_handles_api_errors_gracefully(self, mock_genai):
-        """Test analyzer handles API errors without crashing."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
-
-            notifier = MagicMock()
-            analyzer = GeminiAnalyzer(client=client, notifier_callback=notifier)
-
-            # Mock API error
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.side_effect = Exception("API timeout")
-
-            # All three operations should fail gracefully
-            classification = analyzer.classify_request("test", "ru")
-            assert classification.confidence == 0.0
-            assert classification.request_type == RequestType.GENERAL_INQUIRY
-
-            response = analyzer.generate_response("test", language="ru")
-            assert response.is_fallback is True
-            assert len(response.text) > 0
-
-            summary = analyzer.summarize_complaint("test", "ru")
-            assert summary.is_fallback is True
-            assert len(summary.text) > 0
-
-            # Notifier should be called 3 times
-            assert notifier.call_count == 3
-
-    @patch("services.gemini.client.genai")
-    def test_caching_reduces_api_calls(self, mock_genai):
-        """Test caching reduces API calls for duplicate messages."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
+@pytest.fixture
+def mock_genai():
+    """Patch the genai module used by the analyzer to build models."""
+    with patch("services.gemini.analyzer.genai") as mock:
+        yield mock
 
-            analyzer = GeminiAnalyzer(client=client)
 
-            mock_response = MagicMock()
-            mock_response.text = json.dumps({
-                "request_type": "appointment_booking",
-                "urgency": "medium",
-                "confidence": 0.8,
-            })
+@pytest.fixture
+def mock_model(mock_genai):
+    """Model instance returned by every genai.GenerativeModel(...) call."""
+    return mock_genai.GenerativeModel.return_value
 
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.return_value = mock_response
 
-            message = "I want to book an appointment"
+@pytest.fixture
+def gemini_client():
+    """GeminiClient with configuration getters stubbed out."""
+    with patch.object(GeminiClient, "__init__", lambda x: None):
+        client = GeminiClient()
+    client.get_model = MagicMock(return_value="gemini-pro")
+    client.get_generation_config = MagicMock(return_value={})
+    client.get_safety_settings = MagicMock(return_value=[])
+    client.get_request_timeout = MagicMock(return_value=30)
+    return client
 
-            # First call - API call made
-            result1 = analyzer.classify_request(message, "ru")
-            assert mock_model.generate_content.call_count == 1
 
-            # Second call - should use cache, no additional API call
-            result2 = analyzer.classify_request(message, "ru")
-            assert mock_model.generate_content.call_count == 1
+@pytest.fixture
+def analyzer(gemini_client):
+    """Analyzer wired to the stubbed client."""
+    return GeminiAnalyzer(client=gemini_client)
 
-            # Results should be identical
-            assert result1.request_type == result2.request_type
-            assert result1.confidence == result2.confidence
 
-            # Different language should trigger new API call
-            result3 = analyzer.classify_request(message, "kz")
-            assert mock_model.generate_content.call_count == 2
+class TestGeminiIntegration:
+    """Integration tests for complete Gemini service workflows."""
 
-    @patch("services.gemini.client.genai")
-    def test_multiple_languages_support(self, mock_genai):
-        """Test analyzer supports both Russian and Kazakh."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
-
-            analyzer = GeminiAnalyzer(client=client)
-
-            # Setup responses
-            mock_response = MagicMock()
-            mock_response.text = json.dumps({
+    def test_analyzer_complete_workflow(self, gemini_client, mock_model):
+        """Test complete workflow: init -> classify -> response -> summary."""
+        notifier = MagicMock()
+        analyzer = GeminiAnalyzer(
+            client=gemini_client,
+            cache_ttl=3600,
+            notifier_callback=notifier,
+        )
+
+        # Mock responses: classify, generate, summarize - in call order
+        response_texts = (
+            json.dumps({
                 "request_type": "appointment_booking",
                 "urgency": "high",
-                "confidence": 0.9,
-            })
+                "confidence": 0.95,
+            }),
+            "You can book through our website.",
+            "Patient wants faster booking process.",
+        )
+        mock_model.generate_content.side_effect = (
+            MagicMock(text=text) for text in response_texts
+        )
+
+        # Execute
+        classification = analyzer.classify_request(
+            "I want to book an appointment tomorrow", "ru"
+        )
+        response = analyzer.generate_response("How do I book?", language="ru")
+        summary = analyzer.summarize_complaint(
+            "The booking process is too complicated...", "ru"
+        )
+
+        # Assert
+        assert classification.request_type == RequestType.APPOINTMENT_BOOKING
+        assert classification.urgency == UrgencyLevel.HIGH
+        assert response.text == "You can book through our website."
+        assert response.is_fallback is False
+        assert summary.text == "Patient wants faster booking process."
+        assert summary.is_fallback is False
+
+        # Notifier should not be called for successful operations
+        notifier.assert_not_called()
+
+    def test_analyze_all_single_request(self, gemini_client, mock_model):
+        """Test combined analysis returns all three results from one API call."""
+        notifier = MagicMock()
+        analyzer = GeminiAnalyzer(client=gemini_client, notifier_callback=notifier)
+
+        mock_response = MagicMock()
+        mock_response.text = json.dumps({
+            "classification": {
+                "request_type": "appointment_booking",
+                "urgency": "high",
+                "confidence": 0.95,
+            },
+            "response": "You can book through our website.",
+            "summary": "Patient wants to book an appointment.",
+        })
+        mock_model.generate_content.side_effect = [mock_response]
+
+        message = "I want to book an appointment tomorrow"
+        result = analyzer.analyze_all(message, "ru")
+
+        assert mock_model.generate_content.call_count == 1
+        assert result.classification.request_type == RequestType.APPOINTMENT_BOOKING
+        assert result.classification.urgency == UrgencyLevel.HIGH
+        assert result.response.text == "You can book through our website."
+        assert result.response.is_fallback is False
+        assert result.summary.text == "Patient wants to book an appointment."
+        assert result.summary.is_fallback is False
+        notifier.assert_not_called()
+
+        # Classification is cached for later classify_request calls
+        cached = analyzer.classify_request(message, "ru")
+        assert cached.request_type == RequestType.APPOINTMENT_BOOKING
+        assert mock_model.generate_content.call_count == 1
+
+    def test_analyze_all_handles_api_errors(self, gemini_client, mock_model):
+        """Test combined analysis falls back on API error with one notification."""
+        notifier = MagicMock()
+        analyzer = GeminiAnalyzer(client=gemini_client, notifier_callback=notifier)
+        mock_model.generate_content.side_effect = Exception("API timeout")
+
+        result = analyzer.analyze_all("test", "ru")
+
+        assert result.classification.request_type == RequestType.GENERAL_INQUIRY
+        assert result.classification.confidence == 0.0
+        assert result.response.is_fallback is True
+        assert result.summary.is_fallback is True
+        assert len(result.response.text) > 0
+        notifier.assert_called_once()
+
+    def test_analyzer_handles_api_errors_gracefully(self, gemini_client, mock_model):
+        """Test analyzer handles API errors without crashing."""
+        notifier = MagicMock()
+        analyzer = GeminiAnalyzer(client=gemini_client, notifier_callback=notifier)
 
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.return_value = mock_response
+        # Mock API error
+        mock_model.generate_content.side_effect = Exception("API timeout")
 
-            # Test Russian
-            result_ru = analyzer.classify_request("Хочу записаться", "ru")
-            assert result_ru.request_type == RequestType.APPOINTMENT_BOOKING
+        # All three operations should fail gracefully
+        classification = analyzer.classify_request("test", "ru")
+        assert classification.confidence == 0.0
+        assert classification.request_type == RequestType.GENERAL_INQUIRY
 
-            # Verify model was called for Russian
-            mock_model.generate_content.assert_called()
-            calls_before = mock_model.generate_content.call_count
+        response = analyzer.generate_response("test", language="ru")
+        assert response.is_fallback is True
+        assert len(response.text) > 0
 
-            # Test Kazakh
-            result_kz = analyzer.classify_request("Ішемін тіңшелік беру", "kz")
-            assert result_kz.request_type == RequestType.APPOINTMENT_BOOKING
+        summary = analyzer.summarize_complaint("test", "ru")
+        assert summary.is_fallback is True
+        assert len(summary.text) > 0
 
-            # New API call should be made for different language
-            assert mock_model.generate_content.call_count > calls_before
+        # Notifier should be called 3 times
+        assert notifier.call_count == 3
 
-    @patch("services.gemini.client.genai")
-    def test_context_injection_in_response(self, mock_genai):
-        """Test context is properly injected into response generation."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
+    def test_caching_reduces_api_calls(self, analyzer, mock_model):
+        """Test caching reduces API calls for duplicate messages."""
+        mock_response = MagicMock()
+        mock_response.text = json.dumps({
+            "request_type": "appointment_booking",
+            "urgency": "medium",
+            "confidence": 0.8,
+        })
+        mock_model.generate_content.return_value = mock_response
 
-            analyzer = GeminiAnalyzer(client=client)
+        message = "I want to book an appointment"
 
-            mock_response = MagicMock()
-            mock_response.text = "Your appointment is confirmed."
+        # First call - API call made
+        result1 = analyzer.classify_request(message, "ru")
+        assert mock_model.generate_content.call_count == 1
 
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.return_value = mock_response
+        # Second call - should use cache, no additional API call
+        result2 = analyzer.classify_request(message, "ru")
+        assert mock_model.generate_content.call_count == 1
 
-            context = {
-                "clinic_name": "VITA",
-                "available_specialists": ["Cardiologist", "Dermatologist"],
-            }
+        # Results should be identical
+        assert result1.request_type == result2.request_type
+        assert result1.confidence == result2.confidence
 
-            result = analyzer.generate_response(
-                "Confirm my appointment", context=context, language="ru"
-            )
+        # Different language should trigger new API call
+        result3 = analyzer.classify_request(message, "kz")
+        assert mock_model.generate_content.call_count == 2
 
-            assert result.text == "Your appointment is confirmed."
-            assert not result.is_fallback
+    def test_multiple_languages_support(self, analyzer, mock_model):
+        """Test analyzer supports both Russian and Kazakh."""
+        # Setup responses
+        mock_response = MagicMock()
+        mock_response.text = json.dumps({
+            "request_type": "appointment_booking",
+            "urgency": "high",
+            "confidence": 0.9,
+        })
+        mock_model.generate_content.return_value = mock_response
+
+        # Test Russian
+        result_ru = analyzer.classify_request("Хочу записаться", "ru")
+        assert result_ru.request_type == RequestType.APPOINTMENT_BOOKING
+
+        # Verify model was called for Russian
+        mock_model.generate_content.assert_called()
+        calls_before = mock_model.generate_content.call_count
+
+        # Test Kazakh
+        result_kz = analyzer.classify_request("Ішемін тіңшелік беру", "kz")
+        assert result_kz.request_type == RequestType.APPOINTMENT_BOOKING
+
+        # New API call should be made for different language
+        assert mock_model.generate_content.call_count > calls_before
+
+    def test_context_injection_in_response(self, analyzer, mock_genai, mock_model):
+        """Test context is properly injected into response generation."""
+        mock_response = MagicMock()
+        mock_response.text = "Your appointment is confirmed."
+        mock_model.generate_content.return_value = mock_response
 
-            # Verify GenerativeModel was called with proper system instruction
-            mock_genai.GenerativeModel.assert_called()
-            call_kwargs = mock_genai.GenerativeModel.call_args[1]
-            assert "system_instruction" in call_kwargs
+        context = {
+            "clinic_name": "VITA",
+            "available_specialists": ["Cardiologist", "Dermatologist"],
+        }
 
-    @patch("services.gemini.client.genai")
-    def test_json_parsing_with_wrapped_response(self, mock_genai):
-        """Test parsing JSON wrapped in explanatory text."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            client.get_model = MagicMock(return_value="gemini-pro")
-            client.get_generation_config = MagicMock(return_value={})
-            client.get_safety_settings = MagicMock(return_value=[])
-            client.get_request_timeout = MagicMock(return_value=30)
+        result = analyzer.generate_response(
+            "Confirm my appointment", context=context, language="ru"
+        )
 
-            analyzer = GeminiAnalyzer(client=client)
+        assert result.text == "Your appointment is confirmed."
+        assert not result.is_fallback
 
-            # Response with wrapped JSON
-            mock_response = MagicMock()
-            mock_response.text = f"""Based on the message, here's the analysis:
+        # Verify GenerativeModel was called with proper system instruction
+        mock_genai.GenerativeModel.assert_called()
+        call_kwargs = mock_genai.GenerativeModel.call_args[1]
+        assert "system_instruction" in call_kwargs
+
+    def test_json_parsing_with_wrapped_response(self, analyzer, mock_model):
+        """Test parsing JSON wrapped in explanatory text."""
+        # Response with wrapped JSON
+        mock_response = MagicMock()
+        mock_response.text = f"""Based on the message, here's the analysis:
 
 {json.dumps({
     "request_type": "complaint",
@@ -250,36 +254,31 @@ class TestGeminiIntegration:
 })}
 
 The user seems dissatisfied with the service."""
+        mock_model.generate_content.return_value = mock_response
 
-            mock_model = MagicMock()
-            mock_genai.GenerativeModel.return_value = mock_model
-            mock_model.generate_content.return_value = mock_response
+        result = analyzer.classify_request("I'm unhappy with the wait time", "ru")
 
-            result = analyzer.classify_request("I'm unhappy with the wait time", "ru")
+        assert result.request_type == RequestType.COMPLAINT
+        assert result.urgency == UrgencyLevel.HIGH
+        assert result.confidence == 0.85
 
-            assert result.request_type == RequestType.COMPLAINT
-            assert result.urgency == UrgencyLevel.HIGH
-            assert result.confidence == 0.85
-
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, gemini_client):
         """Test cache entries expire after TTL."""
-        with patch.object(GeminiClient, "__init__", lambda x: None):
-            client = GeminiClient()
-            analyzer = GeminiAnalyzer(client=client, cache_ttl=1)
-
-            result = ClassificationResult(
-                request_type=RequestType.GENERAL_INQUIRY,
-                urgency=UrgencyLevel.LOW,
-            )
-            key = "test_key"
-
-            # Store in cache
-            analyzer._set_cache(key, result)
-            assert analyzer._get_from_cache(key) is not None
-
-            # Simulate expiration
-            import time
-            time.sleep(1.1)
-
-            # Should be expired
-            assert analyzer._get_from_cache(key) is None
+        analyzer = GeminiAnalyzer(client=gemini_client, cache_ttl=1)
+
+        result = ClassificationResult(
+            request_type=RequestType.GENERAL_INQUIRY,
+            urgency=UrgencyLevel.LOW,
+        )
+        key = "test_key"
+
+        # Store in cache
+        analyzer._set_cache(key, result)
+        assert analyzer._get_from_cache(key) is not None
+
+        # Simulate expiration by moving the analyzer's clock past the TTL
+        now = analyzer._clock()
+        analyzer._clock = lambda: now + 2.0
+
+        # Should be expired
+        assert analyzer._get_from_cache(key) is None
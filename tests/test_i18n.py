@@ -7,16 +7,29 @@ from core.i18n import (
     get_text,
     detect_language,
     clear_cache,
-    _get_nested_value,
+    _flatten,
+    _load_locale,
     _safe_format,
     SUPPORTED_LANGUAGES,
     DEFAULT_LANGUAGE,
 )
 
 
-@pytest.fixture(autouse=True)
+LOCALES_PATH = Path(__file__).parent.parent / "locales"
+
+
+@pytest.fixture(scope="session")
+def locale_bundle():
+    """Raw locale files, read and parsed once per test session."""
+    return {
+        lang: json.loads((LOCALES_PATH / f"{lang}.json").read_text(encoding="utf-8"))
+        for lang in SUPPORTED_LANGUAGES
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
 def clear_locale_cache():
-    """Clear locale cache before and after each test."""
+    """Clear locale cache before and after this module's tests."""
     clear_cache()
     yield
     clear_cache()
@@ -36,34 +49,24 @@ def sample_locale_data():
     }
 
 
-class TestGetNestedValue:
-    """Tests for _get_nested_value helper function."""
-    
-    def test_get_top_level_key(self, sample_locale_data):
-        """Test getting a top-level key."""
-        result = _get_nested_value(sample_locale_data, "greetings")
-        assert result == sample_locale_data["greetings"]
-    
-    def test_get_nested_key(self, sample_locale_data):
-        """Test getting a nested key with dot notation."""
-        result = _get_nested_value(sample_locale_data, "greetings.welcome")
-        assert result == "Welcome to VITA!"
-    
-    def test_get_deeply_nested_key(self):
-        """Test getting a deeply nested key."""
-        data = {"level1": {"level2": {"level3": "deep value"}}}
-        result = _get_nested_value(data, "level1.level2.level3")
-        assert result == "deep value"
-    
-    def test_missing_key_returns_none(self, sample_locale_data):
-        """Test that missing key returns None."""
-        result = _get_nested_value(sample_locale_data, "nonexistent")
-        assert result is None
-    
-    def test_missing_nested_key_returns_none(self, sample_locale_data):
-        """Test that missing nested key returns None."""
-        result = _get_nested_value(sample_locale_data, "greetings.nonexistent")
-        assert result is None
+class TestFlatten:
+    """Tests for _flatten helper function."""
+    
+    def test_flatten_matches_nested_lookup(self, sample_locale_data):
+        """Test that every flattened path resolves like the nested walk."""
+        flat = _flatten(sample_locale_data)
+        assert flat["greetings.welcome"] == "Welcome to VITA!"
+        assert flat["errors.general"] == "An error occurred"
+        for path, value in flat.items():
+            current = sample_locale_data
+            for part in path.split("."):
+                current = current[part]
+            assert current == value
+    
+    def test_flatten_keeps_sections(self, sample_locale_data):
+        """Test that intermediate sections are addressable too."""
+        flat = _flatten(sample_locale_data)
+        assert flat["greetings"] == sample_locale_data["greetings"]
 
 
 class TestSafeFormat:
@@ -82,6 +85,12 @@ class TestSafeFormat:
         assert "John" in result
         assert "{count}" in result
     
+    def test_format_with_several_missing_placeholders(self):
+        """Test that every missing placeholder is preserved in one pass."""
+        text = "{greeting}, {name}! {count} new, {unread} unread."
+        result = _safe_format(text, name="John", count=3)
+        assert result == "{greeting}, John! 3 new, {unread} unread."
+    
     def test_format_without_placeholders(self):
         """Test formatting text without placeholders."""
         text = "Simple text"
@@ -98,18 +107,11 @@ class TestSafeFormat:
 class TestGetText:
     """Tests for get_text function."""
     
-    def test_get_russian_text(self):
-        """Test getting Russian text."""
-        text = get_text("greetings.welcome", "ru")
+    @pytest.mark.parametrize("language", ["ru", "kz", "RU", "KZ", "en", None])
+    def test_get_welcome_text(self, language):
+        """Test getting text for supported, mixed-case, unsupported and missing codes."""
+        text = get_text("greetings.welcome", language)
         assert isinstance(text, str)
-        assert len(text) > 0
-        assert "VITA" in text
-    
-    def test_get_kazakh_text(self):
-        """Test getting Kazakh text."""
-        text = get_text("greetings.welcome", "kz")
-        assert isinstance(text, str)
-        assert len(text) > 0
         assert "VITA" in text
     
     def test_get_text_with_placeholder(self):
@@ -128,12 +130,6 @@ class TestGetText:
         assert isinstance(text, str)
         assert len(text) > 0
     
-    def test_unsupported_language_fallback(self):
-        """Test fallback to Russian for unsupported language."""
-        text = get_text("greetings.welcome", "en")
-        assert isinstance(text, str)
-        assert len(text) > 0
-    
     def test_missing_key_returns_key(self):
         """Test that missing key returns the key itself."""
         key = "nonexistent.key.path"
@@ -148,17 +144,19 @@ class TestGetText:
         assert isinstance(text, str)
         assert len(text) > 0
     
+    def test_key_missing_only_in_kazakh_uses_russian(self, monkeypatch):
+        """Test that a key absent from the Kazakh locale resolves from Russian."""
+        monkeypatch.setattr(
+            "core.i18n._load_flat_locale",
+            lambda language: {"only.ru": "Только по-русски"} if language == "ru" else {},
+        )
+        assert get_text("only.ru", "kz") == "Только по-русски"
+    
     def test_case_insensitive_language_code(self):
         """Test that language codes are case-insensitive."""
         text1 = get_text("greetings.welcome", "RU")
         text2 = get_text("greetings.welcome", "ru")
         assert text1 == text2
-    
-    def test_none_language_uses_default(self):
-        """Test that None language uses default."""
-        text = get_text("greetings.welcome", None)
-        assert isinstance(text, str)
-        assert len(text) > 0
 
 
 class TestDetectLanguage:
@@ -202,6 +200,16 @@ class TestDetectLanguage:
         result = detect_language(telegram_locale="ru-RU")
         assert result == "ru"
     
+    def test_kazakh_locale_with_dash_and_uppercase(self):
+        """Test mixed-case Kazakh locale with dash separator."""
+        result = detect_language(telegram_locale="KK-kz")
+        assert result == "kz"
+    
+    def test_unsupported_locale_with_region_fallback(self):
+        """Test fallback to default for unsupported locale with region."""
+        result = detect_language(telegram_locale="en_US")
+        assert result == DEFAULT_LANGUAGE
+    
     def test_unsupported_locale_fallback(self):
         """Test fallback to default for unsupported locale."""
         result = detect_language(telegram_locale="en")
@@ -231,42 +239,26 @@ class TestLocaleFiles:
     
     def test_russian_locale_exists(self):
         """Test that Russian locale file exists."""
-        locale_path = Path(__file__).parent.parent / "locales" / "ru.json"
-        assert locale_path.exists()
+        assert (LOCALES_PATH / "ru.json").exists()
     
     def test_kazakh_locale_exists(self):
         """Test that Kazakh locale file exists."""
-        locale_path = Path(__file__).parent.parent / "locales" / "kz.json"
-        assert locale_path.exists()
+        assert (LOCALES_PATH / "kz.json").exists()
     
-    def test_russian_locale_valid_json(self):
+    def test_russian_locale_valid_json(self, locale_bundle):
         """Test that Russian locale is valid JSON."""
-        locale_path = Path(__file__).parent.parent / "locales" / "ru.json"
-        with open(locale_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(locale_bundle["ru"], dict)
     
-    def test_kazakh_locale_valid_json(self):
+    def test_kazakh_locale_valid_json(self, locale_bundle):
         """Test that Kazakh locale is valid JSON."""
-        locale_path = Path(__file__).parent.parent / "locales" / "kz.json"
-        with open(locale_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(locale_bundle["kz"], dict)
     
-    def test_locales_have_same_keys(self):
+    def test_locales_have_same_keys(self, locale_bundle):
         """Test that Russian and Kazakh locales have the same key structure."""
-        ru_path = Path(__file__).parent.parent / "locales" / "ru.json"
-        kz_path = Path(__file__).parent.parent / "locales" / "kz.json"
-        
-        with open(ru_path, "r", encoding="utf-8") as f:
-            ru_data = json.load(f)
-        with open(kz_path, "r", encoding="utf-8") as f:
-            kz_data = json.load(f)
-        
         # Check top-level keys
-        assert set(ru_data.keys()) == set(kz_data.keys())
+        assert set(locale_bundle["ru"].keys()) == set(locale_bundle["kz"].keys())
     
-    def test_required_sections_present(self):
+    def test_required_sections_present(self, locale_bundle):
         """Test that required sections are present in locales."""
         required_sections = [
             "greetings",
@@ -281,10 +273,7 @@ class TestLocaleFiles:
         ]
         
         for lang in SUPPORTED_LANGUAGES:
-            locale_path = Path(__file__).parent.parent / "locales" / f"{lang}.json"
-            with open(locale_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
+            data = locale_bundle[lang]
             for section in required_sections:
                 assert section in data, f"Section '{section}' missing in {lang}.json"
 
@@ -304,6 +293,23 @@ class TestClearCache:
         # but we can verify that reloading works)
         text = get_text("greetings.welcome", "ru")
         assert isinstance(text, str)
+    
+    def test_locale_parsed_once_until_cleared(self):
+        """Test that repeated lookups reuse the parsed locale data."""
+        first = _load_locale("ru")
+        assert _load_locale("ru") is first
+        
+        clear_cache()
+        assert _load_locale("ru") is not first
+    
+    def test_locale_loads_without_orjson(self, monkeypatch):
+        """Test that locale loading falls back to the stdlib json module."""
+        monkeypatch.setattr("core.i18n.orjson", None)
+        clear_cache()
+        try:
+            assert "VITA" in get_text("greetings.welcome", "ru")
+        finally:
+            clear_cache()
 
 
 class TestIntegration:
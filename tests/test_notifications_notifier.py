@@ -2,18 +2,92 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from dataclasses import FrozenInstanceError
+from types import MappingProxyType
+from unittest.mock import Mock
 
 from services.notifications.notifier import Notifier, NotificationEvent
 from services.notifications.adapters import (
     TelegramAdapter,
-    WhatsAppAdapter,
     InstagramAdapter,
 )
 from models import NotificationLogDTO
+from core.i18n import get_text
+
+
+# Read-only event payloads shared across tests; the notifier only reads them
+BOOKING_DATA = MappingProxyType({
+    "client_name": "Ivan",
+    "booking_date": "2024-01-01",
+    "booking_time": "10:00",
+    "specialist_name": "Dr. Smith",
+})
+COMPLAINT_DATA = MappingProxyType({
+    "client_name": "Ivan",
+    "complaint_subject": "Poor service",
+    "severity": "high",
+})
+DIGEST_DATA = MappingProxyType({
+    "date": "2024-01-01",
+    "new_bookings": 5,
+    "cancelled_bookings": 1,
+    "complaints": 0,
+    "urgent_events": 1,
+})
+URGENT_TAG = get_text("notification.urgent_tag", "ru")
+
+# Events are frozen, so tests that only read them can share one instance
+BOOKING_CREATED_EVENT = NotificationEvent(
+    event_type="booking_created",
+    recipient_id=123,
+    recipient_type="specialist",
+    language="ru",
+    data=BOOKING_DATA,
+    channels=["telegram"],
+)
+BOOKING_CANCELLED_EVENT = NotificationEvent(
+    event_type="booking_cancelled",
+    recipient_id=123,
+    recipient_type="specialist",
+    language="ru",
+    data=BOOKING_DATA,
+)
+COMPLAINT_RECEIVED_EVENT = NotificationEvent(
+    event_type="complaint_received",
+    recipient_id=123,
+    recipient_type="admin",
+    language="ru",
+    data=COMPLAINT_DATA,
+)
+
+def assert_channels_received(adapters, expected):
+    """Assert how many messages each mock-mode adapter recorded."""
+    received = {
+        name: len(adapter.get_sent_messages())
+        for name, adapter in adapters.items()
+        if adapter.mock_mode
+    }
+    assert received == expected
+
 
+@pytest.fixture
+def notifier_factory():
+    """Build notifiers and reset their pending/failed queues afterwards."""
+    created = []
+
+    def make(**kwargs):
+        notifier = Notifier(**kwargs)
+        created.append(notifier)
+        return notifier
+
+    yield make
+
+    for notifier in created:
+        notifier.clear_pending_notifications()
+        notifier.clear_failed_notifications()
 
+
+@pytest.mark.fast
 class TestNotificationEvent:
     """Tests for NotificationEvent dataclass."""
 
@@ -45,7 +119,13 @@ class TestNotificationEvent:
 
         assert event.data == data
 
+    def test_notification_event_is_frozen(self):
+        """Test notification events cannot be mutated after creation."""
+        with pytest.raises(FrozenInstanceError):
+            BOOKING_CREATED_EVENT.recipient_id = 456
+
 
+@pytest.mark.fast
 class TestNotifierInitialization:
     """Tests for Notifier initialization."""
 
@@ -79,38 +159,20 @@ class TestNotifierInitialization:
 class TestImmediateAlerts:
     """Tests for immediate per-event alerts."""
 
-    @pytest.mark.asyncio
-    async def test_send_immediate_alert_success(self):
+    async def test_send_immediate_alert_success(self, notifier_factory, telegram_mock):
         """Test successful immediate alert sending."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
-        notifier = Notifier(adapters={"telegram": adapter})
-
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            data={
-                "client_name": "Ivan",
-                "booking_date": "2024-01-01",
-                "booking_time": "10:00",
-                "specialist_name": "Dr. Smith",
-            },
-            channels=["telegram"],
-        )
-
-        result = await notifier.send_immediate_alert(event)
+        result = await notifier.send_immediate_alert(BOOKING_CREATED_EVENT)
 
         assert result is True
-        assert len(adapter.get_sent_messages()) == 1
+        assert len(telegram_mock.get_sent_messages()) == 1
 
-    @pytest.mark.asyncio
-    async def test_send_immediate_alert_invalid_recipient(self):
+    async def test_send_immediate_alert_invalid_recipient(
+        self, notifier_factory, telegram_mock
+    ):
         """Test immediate alert with invalid recipient."""
-        adapter = TelegramAdapter()
-        notifier = Notifier(adapters={"telegram": adapter})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         event = NotificationEvent(
             event_type="booking_created",
@@ -123,33 +185,18 @@ class TestImmediateAlerts:
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_send_immediate_alert_with_logging(self):
+    async def test_send_immediate_alert_with_logging(
+        self, notifier_factory, telegram_mock, log_recorder
+    ):
         """Test immediate alert with notification logging."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        log_callback = AsyncMock()
-        notifier = Notifier(adapters={"telegram": adapter}, log_callback=log_callback)
-
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            data={
-                "client_name": "Ivan",
-                "booking_date": "2024-01-01",
-                "booking_time": "10:00",
-                "specialist_name": "Dr. Smith",
-            },
-            channels=["telegram"],
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock}, log_callback=log_recorder
         )
 
-        await notifier.send_immediate_alert(event)
+        await notifier.send_immediate_alert(BOOKING_CREATED_EVENT)
 
-        assert log_callback.call_count == 1
-        call_args = log_callback.call_args[0][0]
+        assert len(log_recorder.calls) == 1
+        call_args = log_recorder.calls[0]
         assert isinstance(call_args, NotificationLogDTO)
         assert call_args.message_type == "immediate"
         assert call_args.delivery_status == "sent"
@@ -158,60 +205,49 @@ class TestImmediateAlerts:
 class TestUrgentEscalation:
     """Tests for urgent escalation notifications."""
 
-    @pytest.mark.asyncio
-    async def test_send_urgent_escalation_success(self):
+    async def test_send_urgent_escalation_success(
+        self, notifier_factory, telegram_mock
+    ):
         """Test successful urgent escalation sending."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        notifier = Notifier(adapters={"telegram": adapter})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         event = NotificationEvent(
             event_type="complaint_received",
             recipient_id=123,
             recipient_type="admin",
             language="ru",
-            data={
-                "client_name": "Ivan",
-                "complaint_subject": "Poor service",
-                "severity": "high",
-            },
+            data=COMPLAINT_DATA,
             channels=["telegram"],
         )
 
         result = await notifier.send_urgent_escalation(event)
 
         assert result is True
-        messages = adapter.get_sent_messages()
+        messages = telegram_mock.get_sent_messages()
         assert len(messages) == 1
-        assert "СРОЧНО" in messages[0]["message"]
+        assert messages[0]["message"].startswith(URGENT_TAG)
 
-    @pytest.mark.asyncio
-    async def test_send_urgent_escalation_with_logging(self):
+    async def test_send_urgent_escalation_with_logging(
+        self, notifier_factory, telegram_mock, log_recorder
+    ):
         """Test urgent escalation with logging."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        log_callback = AsyncMock()
-        notifier = Notifier(adapters={"telegram": adapter}, log_callback=log_callback)
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock}, log_callback=log_recorder
+        )
 
         event = NotificationEvent(
             event_type="complaint_received",
             recipient_id=123,
             recipient_type="admin",
             language="ru",
-            data={
-                "client_name": "Ivan",
-                "complaint_subject": "Poor service",
-                "severity": "high",
-            },
+            data=COMPLAINT_DATA,
             channels=["telegram"],
         )
 
         await notifier.send_urgent_escalation(event)
 
-        assert log_callback.call_count == 1
-        call_args = log_callback.call_args[0][0]
+        assert len(log_recorder.calls) == 1
+        call_args = log_recorder.calls[0]
         assert call_args.message_type == "urgent"
         assert call_args.urgency_level == "urgent"
 
@@ -219,108 +255,62 @@ class TestUrgentEscalation:
 class TestScheduledDigests:
     """Tests for scheduled daily digest notifications."""
 
-    @pytest.mark.asyncio
-    async def test_schedule_daily_digest(self):
-        """Test scheduling a daily digest."""
-        notifier = Notifier()
-
-        await notifier.schedule_daily_digest(
-            recipient_id=123,
-            recipient_type="admin",
-            language="ru",
-            digest_data={
-                "date": "2024-01-01",
-                "new_bookings": 5,
-                "cancelled_bookings": 1,
-                "complaints": 0,
-                "urgent_events": 1,
-            },
-        )
-
-        pending = notifier.get_pending_notifications()
-        assert len(pending) == 1
-        assert pending[0].event_type == "daily_digest"
-        assert pending[0].recipient_id == 123
-
-    @pytest.mark.asyncio
-    async def test_send_scheduled_digest(self):
+    async def test_send_scheduled_digest(self, notifier_factory, telegram_mock):
         """Test sending a scheduled digest."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        notifier = Notifier(adapters={"telegram": adapter})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         result = await notifier.send_scheduled_digest(
             recipient_id=123,
             recipient_type="admin",
             language="ru",
-            digest_data={
-                "date": "2024-01-01",
-                "new_bookings": 5,
-                "cancelled_bookings": 1,
-                "complaints": 0,
-                "urgent_events": 1,
-            },
+            digest_data=DIGEST_DATA,
             channels=["telegram"],
         )
 
         assert result is True
-        messages = adapter.get_sent_messages()
+        messages = telegram_mock.get_sent_messages()
         assert len(messages) == 1
 
-    @pytest.mark.asyncio
-    async def test_send_scheduled_digest_with_logging(self):
+    async def test_send_scheduled_digest_with_logging(
+        self, notifier_factory, telegram_mock, log_recorder
+    ):
         """Test scheduled digest with logging."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        log_callback = AsyncMock()
-        notifier = Notifier(adapters={"telegram": adapter}, log_callback=log_callback)
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock}, log_callback=log_recorder
+        )
 
         await notifier.send_scheduled_digest(
             recipient_id=123,
             recipient_type="admin",
             language="ru",
-            digest_data={
-                "date": "2024-01-01",
-                "new_bookings": 5,
-                "cancelled_bookings": 1,
-                "complaints": 0,
-                "urgent_events": 1,
-            },
+            digest_data=DIGEST_DATA,
             channels=["telegram"],
         )
 
-        assert log_callback.call_count == 1
-        call_args = log_callback.call_args[0][0]
+        assert len(log_recorder.calls) == 1
+        call_args = log_recorder.calls[0]
         assert call_args.message_type == "digest"
 
 
 class TestHealthCheckNotifications:
     """Tests for health check notifications."""
 
-    @pytest.mark.asyncio
-    async def test_send_health_check(self):
+    async def test_send_health_check(self, notifier_factory, telegram_mock):
         """Test sending health check notification."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-
-        notifier = Notifier(adapters={"telegram": adapter})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         result = await notifier.send_health_check(admin_id=1, language="ru")
 
         assert result is True
-        messages = adapter.get_sent_messages()
+        messages = telegram_mock.get_sent_messages()
         assert len(messages) == 1
         assert "нормально" in messages[0]["message"].lower()
 
-    @pytest.mark.asyncio
-    async def test_send_health_check_failure(self):
+    async def test_send_health_check_failure(self, notifier_factory, telegram_mock):
         """Test health check failure."""
-        adapter = TelegramAdapter()
-        adapter.is_available = False
+        telegram_mock.is_available = False
 
-        notifier = Notifier(adapters={"telegram": adapter})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         result = await notifier.send_health_check(admin_id=1, language="ru")
 
@@ -330,190 +320,114 @@ class TestHealthCheckNotifications:
 class TestMultiChannelSending:
     """Tests for multi-channel message sending."""
 
-    @pytest.mark.asyncio
-    async def test_send_to_multiple_channels_success(self):
+    async def test_send_to_multiple_channels_success(
+        self, notifier_factory, telegram_mock, whatsapp_mock
+    ):
         """Test sending to multiple channels."""
-        telegram = TelegramAdapter()
-        telegram.enable_mock_mode()
-        whatsapp = WhatsAppAdapter()
-        whatsapp.enable_mock_mode()
-
-        notifier = Notifier(adapters={"telegram": telegram, "whatsapp": whatsapp})
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock, "whatsapp": whatsapp_mock}
+        )
 
         event = NotificationEvent(
             event_type="booking_created",
             recipient_id=123,
             recipient_type="specialist",
             language="ru",
-            data={
-                "client_name": "Ivan",
-                "booking_date": "2024-01-01",
-                "booking_time": "10:00",
-                "specialist_name": "Dr. Smith",
-            },
+            data=BOOKING_DATA,
             channels=["telegram", "whatsapp"],
         )
 
         result = await notifier.send_immediate_alert(event)
 
         assert result is True
-        assert len(telegram.get_sent_messages()) == 1
-        assert len(whatsapp.get_sent_messages()) == 1
+        assert_channels_received(notifier.adapters, {"telegram": 1, "whatsapp": 1})
 
-    @pytest.mark.asyncio
-    async def test_send_to_unavailable_channel(self):
-        """Test sending to unavailable channel."""
-        telegram = TelegramAdapter()
-        telegram.enable_mock_mode()
-        whatsapp = WhatsAppAdapter()
-        whatsapp.is_available = False
+    async def test_send_to_channels_isolates_adapter_errors(
+        self, notifier_factory, telegram_mock, whatsapp_mock
+    ):
+        """Test one failing channel does not prevent delivery on the others."""
+        async def failing_send(*args, **kwargs):
+            raise RuntimeError("boom")
 
-        notifier = Notifier(adapters={"telegram": telegram, "whatsapp": whatsapp})
+        whatsapp_mock.send = failing_send
 
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            channels=["telegram", "whatsapp"],
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock, "whatsapp": whatsapp_mock}
         )
 
-        result = await notifier.send_immediate_alert(event)
+        result = await notifier._send_to_channels(
+            123, ["whatsapp", "telegram"], "Message"
+        )
 
         assert result is True
-        assert len(telegram.get_sent_messages()) == 1
+        assert_channels_received(notifier.adapters, {"telegram": 1, "whatsapp": 0})
 
-    @pytest.mark.asyncio
-    async def test_send_to_nonexistent_channel(self):
-        """Test sending to nonexistent channel."""
-        telegram = TelegramAdapter()
-        telegram.enable_mock_mode()
+    async def test_send_to_unavailable_channel(
+        self, notifier_factory, telegram_mock, whatsapp_mock
+    ):
+        """Test sending to unavailable channel."""
+        whatsapp_mock.is_available = False
 
-        notifier = Notifier(adapters={"telegram": telegram})
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock, "whatsapp": whatsapp_mock}
+        )
 
         event = NotificationEvent(
             event_type="booking_created",
             recipient_id=123,
             recipient_type="specialist",
             language="ru",
-            channels=["nonexistent"],
+            channels=["telegram", "whatsapp"],
         )
 
         result = await notifier.send_immediate_alert(event)
 
-        assert result is False
-
-
-class TestRetryLogic:
-    """Tests for retry logic and failure handling."""
-
-    @pytest.mark.asyncio
-    async def test_failed_notification_escalation(self):
-        """Test escalation to manual alert after retries."""
-        adapter = TelegramAdapter()
-        adapter.is_available = False
+        assert result is True
+        assert_channels_received(notifier.adapters, {"telegram": 1, "whatsapp": 0})
 
-        log_callback = AsyncMock()
-        notifier = Notifier(adapters={"telegram": adapter}, log_callback=log_callback)
+    async def test_send_to_nonexistent_channel(self, notifier_factory, telegram_mock):
+        """Test sending to nonexistent channel."""
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
 
         event = NotificationEvent(
             event_type="booking_created",
             recipient_id=123,
             recipient_type="specialist",
             language="ru",
-            channels=["telegram"],
+            channels=["nonexistent"],
         )
 
         result = await notifier.send_immediate_alert(event)
 
         assert result is False
-        assert len(notifier.get_failed_notifications()) == 1
-
-    @pytest.mark.asyncio
-    async def test_manual_alert_on_repeated_failures(self):
-        """Test manual alert sent on repeated failures."""
-        adapter = TelegramAdapter()
-        adapter.enable_mock_mode()
-        adapter.is_available = False
-
-        notifier = Notifier(adapters={"telegram": adapter})
-
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            channels=["telegram"],
-        )
-
-        await notifier.send_immediate_alert(event)
-
-        assert len(notifier.get_failed_notifications()) == 1
 
 
+@pytest.mark.fast
 class TestNotificationFormatting:
     """Tests for notification message formatting."""
 
-    def test_format_booking_created_message(self):
+    def test_format_booking_created_message(self, notifier_factory):
         """Test formatting booking created message."""
-        notifier = Notifier()
+        notifier = notifier_factory()
 
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            data={
-                "client_name": "Ivan",
-                "booking_date": "2024-01-01",
-                "booking_time": "10:00",
-                "specialist_name": "Dr. Smith",
-            },
-        )
-
-        message = notifier._format_notification_message(event)
+        message = notifier._format_notification_message(BOOKING_CREATED_EVENT)
 
         assert "Ivan" in message
         assert "2024-01-01" in message
 
-    def test_format_booking_cancelled_message(self):
+    def test_format_booking_cancelled_message(self, notifier_factory):
         """Test formatting booking cancelled message."""
-        notifier = Notifier()
+        notifier = notifier_factory()
 
-        event = NotificationEvent(
-            event_type="booking_cancelled",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            data={
-                "client_name": "Ivan",
-                "booking_date": "2024-01-01",
-                "booking_time": "10:00",
-                "specialist_name": "Dr. Smith",
-            },
-        )
-
-        message = notifier._format_notification_message(event)
+        message = notifier._format_notification_message(BOOKING_CANCELLED_EVENT)
 
         assert "Ivan" in message
 
-    def test_format_complaint_received_message(self):
+    def test_format_complaint_received_message(self, notifier_factory):
         """Test formatting complaint received message."""
-        notifier = Notifier()
-
-        event = NotificationEvent(
-            event_type="complaint_received",
-            recipient_id=123,
-            recipient_type="admin",
-            language="ru",
-            data={
-                "client_name": "Ivan",
-                "complaint_subject": "Poor service",
-                "severity": "high",
-            },
-        )
+        notifier = notifier_factory()
 
-        message = notifier._format_notification_message(event)
+        message = notifier._format_notification_message(COMPLAINT_RECEIVED_EVENT)
 
         assert "Ivan" in message
 
@@ -521,89 +435,60 @@ class TestNotificationFormatting:
 class TestPendingNotifications:
     """Tests for pending notifications management."""
 
-    @pytest.mark.asyncio
-    async def test_get_pending_notifications(self):
-        """Test getting pending notifications."""
-        notifier = Notifier()
+    async def test_pending_lifecycle(self, notifier_factory):
+        """Test scheduling, listing and clearing pending digests."""
+        notifier = notifier_factory()
 
-        await notifier.schedule_daily_digest(
-            recipient_id=123,
-            recipient_type="admin",
-            language="ru",
-        )
+        await asyncio.gather(*[
+            notifier.schedule_daily_digest(
+                recipient_id=recipient_id,
+                recipient_type="admin",
+                language="ru",
+                digest_data=DIGEST_DATA,
+            )
+            for recipient_id in (1, 2, 3)
+        ])
 
         pending = notifier.get_pending_notifications()
-        assert len(pending) == 1
-
-    @pytest.mark.asyncio
-    async def test_clear_pending_notifications(self):
-        """Test clearing pending notifications."""
-        notifier = Notifier()
-
-        await notifier.schedule_daily_digest(
-            recipient_id=123,
-            recipient_type="admin",
-            language="ru",
-        )
+        assert len(pending) == 3
+        assert all(event.event_type == "daily_digest" for event in pending)
+        assert sorted(event.recipient_id for event in pending) == [1, 2, 3]
 
         notifier.clear_pending_notifications()
-        pending = notifier.get_pending_notifications()
-        assert len(pending) == 0
+        assert len(notifier.get_pending_notifications()) == 0
 
 
 class TestFailedNotifications:
-    """Tests for failed notifications management."""
-
-    @pytest.mark.asyncio
-    async def test_get_failed_notifications(self):
-        """Test getting failed notifications."""
-        adapter = TelegramAdapter()
-        adapter.is_available = False
+    """Tests for failed notification handling and management."""
 
-        notifier = Notifier(adapters={"telegram": adapter})
+    @pytest.mark.parametrize("after_action,expected", [("none", 1), ("clear", 0)])
+    async def test_failed_lifecycle(
+        self, notifier_factory, telegram_mock, log_recorder, after_action, expected
+    ):
+        """Test failed sends are recorded, logged and can be cleared."""
+        telegram_mock.is_available = False
 
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            channels=["telegram"],
+        notifier = notifier_factory(
+            adapters={"telegram": telegram_mock}, log_callback=log_recorder
         )
 
-        await notifier.send_immediate_alert(event)
-
-        failed = notifier.get_failed_notifications()
-        assert len(failed) == 1
+        result = await notifier.send_immediate_alert(BOOKING_CREATED_EVENT)
 
-    @pytest.mark.asyncio
-    async def test_clear_failed_notifications(self):
-        """Test clearing failed notifications."""
-        adapter = TelegramAdapter()
-        adapter.is_available = False
-
-        notifier = Notifier(adapters={"telegram": adapter})
-
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            channels=["telegram"],
-        )
+        assert result is False
+        assert log_recorder.calls[0].delivery_status == "failed"
 
-        await notifier.send_immediate_alert(event)
-        notifier.clear_failed_notifications()
+        if after_action == "clear":
+            notifier.clear_failed_notifications()
 
-        failed = notifier.get_failed_notifications()
-        assert len(failed) == 0
+        assert len(notifier.get_failed_notifications()) == expected
 
 
 class TestAdapterAvailability:
     """Tests for adapter availability control."""
 
-    def test_set_adapter_availability(self):
+    def test_set_adapter_availability(self, notifier_factory):
         """Test setting adapter availability."""
-        notifier = Notifier()
+        notifier = notifier_factory()
 
         notifier.set_adapter_availability("telegram", False)
 
@@ -613,25 +498,13 @@ class TestAdapterAvailability:
 
         assert notifier.adapters["telegram"].is_available is True
 
-    def test_set_unavailable_adapter_status(self):
+    async def test_set_unavailable_adapter_status(
+        self, notifier_factory, telegram_mock
+    ):
         """Test that unavailable adapters are skipped."""
-        telegram = TelegramAdapter()
-        telegram.enable_mock_mode()
-
-        notifier = Notifier(adapters={"telegram": telegram})
+        notifier = notifier_factory(adapters={"telegram": telegram_mock})
         notifier.set_adapter_availability("telegram", False)
 
-        event = NotificationEvent(
-            event_type="booking_created",
-            recipient_id=123,
-            recipient_type="specialist",
-            language="ru",
-            channels=["telegram"],
-        )
-
-        # Need to use asyncio.run since we can't use await here
-        import asyncio
-
-        result = asyncio.run(notifier.send_immediate_alert(event))
+        result = await notifier.send_immediate_alert(BOOKING_CREATED_EVENT)
 
         assert result is False
@@ -1,8 +1,9 @@
 """Tests for notification templates."""
 
 import pytest
-from datetime import datetime, timezone, time
+from datetime import datetime, timedelta, timezone
 
+import services.notifications.templates as templates_module
 from services.notifications.templates import (
     NotificationTemplate,
     BookingNotificationTemplate,
@@ -14,6 +15,49 @@ from services.notifications.templates import (
 )
 
 
+# Templates only hold a language code, so one instance per module is enough
+@pytest.fixture(scope="module")
+def ru_tpl():
+    """Russian base template."""
+    return NotificationTemplate("ru")
+
+
+@pytest.fixture(scope="module")
+def ru_booking_tpl():
+    """Russian booking template."""
+    return BookingNotificationTemplate("ru")
+
+
+@pytest.fixture(scope="module")
+def kz_booking_tpl():
+    """Kazakh booking template."""
+    return BookingNotificationTemplate("kz")
+
+
+@pytest.fixture(scope="module")
+def ru_complaint_tpl():
+    """Russian complaint template."""
+    return ComplaintNotificationTemplate("ru")
+
+
+@pytest.fixture(scope="module")
+def ru_digest_tpl():
+    """Russian digest template."""
+    return DigestNotificationTemplate("ru")
+
+
+@pytest.fixture(scope="module")
+def ru_admin_tpl():
+    """Russian admin alert template."""
+    return AdminAlertTemplate("ru")
+
+
+@pytest.fixture(scope="class")
+def today_utc():
+    """Fixed reference day so results do not depend on the wall clock."""
+    return datetime(2024, 6, 15, tzinfo=timezone.utc)
+
+
 class TestNotificationTemplate:
     """Tests for base NotificationTemplate."""
 
@@ -29,11 +73,9 @@ class TestNotificationTemplate:
 
         assert template.language == "kz"
 
-    def test_template_format_message(self):
+    def test_template_format_message(self, ru_tpl):
         """Test formatting message with template."""
-        template = NotificationTemplate("ru")
-
-        message = template.format_message(
+        message = ru_tpl.format_message(
             "booking_created",
             client_name="Ivan",
             booking_date="2024-01-01",
@@ -54,11 +96,9 @@ class TestBookingNotificationTemplate:
 
         assert template.language == "ru"
 
-    def test_booking_created_message(self):
+    def test_booking_created_message(self, ru_booking_tpl):
         """Test formatting booking created message."""
-        template = BookingNotificationTemplate("ru")
-
-        message = template.booking_created(
+        message = ru_booking_tpl.booking_created(
             client_name="Ivan",
             booking_date="2024-01-01",
             booking_time="10:00",
@@ -69,11 +109,9 @@ class TestBookingNotificationTemplate:
         assert "2024-01-01" in message
         assert "10:00" in message
 
-    def test_booking_cancelled_message(self):
+    def test_booking_cancelled_message(self, ru_booking_tpl):
         """Test formatting booking cancelled message."""
-        template = BookingNotificationTemplate("ru")
-
-        message = template.booking_cancelled(
+        message = ru_booking_tpl.booking_cancelled(
             client_name="Ivan",
             booking_date="2024-01-01",
             booking_time="10:00",
@@ -82,11 +120,9 @@ class TestBookingNotificationTemplate:
 
         assert "Ivan" in message
 
-    def test_booking_rescheduled_message(self):
+    def test_booking_rescheduled_message(self, ru_booking_tpl):
         """Test formatting booking rescheduled message."""
-        template = BookingNotificationTemplate("ru")
-
-        message = template.booking_rescheduled(
+        message = ru_booking_tpl.booking_rescheduled(
             client_name="Ivan",
             new_date="2024-01-02",
             new_time="11:00",
@@ -96,11 +132,9 @@ class TestBookingNotificationTemplate:
         assert "Ivan" in message
         assert "2024-01-02" in message
 
-    def test_booking_template_kazakh_language(self):
+    def test_booking_template_kazakh_language(self, kz_booking_tpl):
         """Test booking template with Kazakh language."""
-        template = BookingNotificationTemplate("kz")
-
-        message = template.booking_created(
+        message = kz_booking_tpl.booking_created(
             client_name="Ivan",
             booking_date="2024-01-01",
             booking_time="10:00",
@@ -119,11 +153,9 @@ class TestComplaintNotificationTemplate:
 
         assert template.language == "ru"
 
-    def test_complaint_received_message(self):
+    def test_complaint_received_message(self, ru_complaint_tpl):
         """Test formatting complaint received message."""
-        template = ComplaintNotificationTemplate("ru")
-
-        message = template.complaint_received(
+        message = ru_complaint_tpl.complaint_received(
             client_name="Ivan",
             complaint_subject="Poor service",
             severity="high",
@@ -142,11 +174,9 @@ class TestDigestNotificationTemplate:
 
         assert template.language == "ru"
 
-    def test_daily_digest_message(self):
+    def test_daily_digest_message(self, ru_digest_tpl):
         """Test formatting daily digest message."""
-        template = DigestNotificationTemplate("ru")
-
-        message = template.daily_digest(
+        message = ru_digest_tpl.daily_digest(
             date="2024-01-01",
             new_bookings=5,
             cancelled_bookings=1,
@@ -168,11 +198,9 @@ class TestAdminAlertTemplate:
 
         assert template.language == "ru"
 
-    def test_manual_alert_message(self):
+    def test_manual_alert_message(self, ru_admin_tpl):
         """Test formatting manual alert message."""
-        template = AdminAlertTemplate("ru")
-
-        message = template.manual_alert(
+        message = ru_admin_tpl.manual_alert(
             attempts=3,
             message="Failed notification",
             recipient="123",
@@ -181,19 +209,15 @@ class TestAdminAlertTemplate:
         assert "3" in message
         assert "Failed notification" in message
 
-    def test_health_check_message(self):
+    def test_health_check_message(self, ru_admin_tpl):
         """Test formatting health check message."""
-        template = AdminAlertTemplate("ru")
-
-        message = template.health_check()
+        message = ru_admin_tpl.health_check()
 
         assert len(message) > 0
 
-    def test_health_check_failed_message(self):
+    def test_health_check_failed_message(self, ru_admin_tpl):
         """Test formatting health check failed message."""
-        template = AdminAlertTemplate("ru")
-
-        message = template.health_check_failed("Connection timeout")
+        message = ru_admin_tpl.health_check_failed("Connection timeout")
 
         assert "Connection timeout" in message
 
@@ -201,20 +225,13 @@ class TestAdminAlertTemplate:
 class TestAddUrgentTag:
     """Tests for add_urgent_tag function."""
 
-    def test_add_urgent_tag_ru(self):
-        """Test adding urgent tag in Russian."""
-        message = "Test message"
-        result = add_urgent_tag(message, "ru")
-
-        assert "СРОЧНО" in result
-        assert "Test message" in result
-
-    def test_add_urgent_tag_kz(self):
-        """Test adding urgent tag in Kazakh."""
+    @pytest.mark.parametrize("language,tag", [("ru", "СРОЧНО"), ("kz", "ШҰРАЙЛЫ")])
+    def test_add_urgent_tag_language(self, language, tag):
+        """Test adding localized urgent tag."""
         message = "Test message"
-        result = add_urgent_tag(message, "kz")
+        result = add_urgent_tag(message, language)
 
-        assert "ШҰРАЙЛЫ" in result
+        assert tag in result
         assert "Test message" in result
 
     def test_add_urgent_tag_preserves_message(self):
@@ -228,11 +245,10 @@ class TestAddUrgentTag:
 class TestShouldEscalateToUrgent:
     """Tests for should_escalate_to_urgent function."""
 
-    def test_escalate_same_day_booking_after_8am(self):
+    def test_escalate_same_day_booking_after_8am(self, today_utc):
         """Test escalation for same-day booking after 08:00."""
-        today = datetime.now(timezone.utc)
-        booking_time = today.replace(hour=9, minute=0, second=0, microsecond=0)
-        current_time = today.replace(hour=10, minute=0, second=0, microsecond=0)
+        booking_time = today_utc.replace(hour=9)
+        current_time = today_utc.replace(hour=10)
 
         result = should_escalate_to_urgent(
             "booking",
@@ -242,11 +258,10 @@ class TestShouldEscalateToUrgent:
 
         assert result is True
 
-    def test_no_escalate_same_day_booking_before_8am(self):
+    def test_no_escalate_same_day_booking_before_8am(self, today_utc):
         """Test no escalation for same-day booking before 08:00."""
-        today = datetime.now(timezone.utc)
-        booking_time = today.replace(hour=14, minute=0, second=0, microsecond=0)
-        current_time = today.replace(hour=7, minute=0, second=0, microsecond=0)
+        booking_time = today_utc.replace(hour=14)
+        current_time = today_utc.replace(hour=7)
 
         result = should_escalate_to_urgent(
             "booking",
@@ -256,61 +271,14 @@ class TestShouldEscalateToUrgent:
 
         assert result is False
 
-    def test_no_escalate_future_booking(self):
+    def test_no_escalate_future_booking(self, today_utc):
         """Test no escalation for future booking."""
-        from datetime import timedelta
-        today = datetime.now(timezone.utc)
-        booking_time = today + timedelta(days=1)
-        booking_time = booking_time.replace(hour=14, minute=0, second=0, microsecond=0)
+        booking_time = (today_utc + timedelta(days=1)).replace(hour=14)
 
         result = should_escalate_to_urgent(
             "booking",
             booking_datetime=booking_time,
-        )
-
-        assert result is False
-
-    def test_escalate_high_severity_complaint(self):
-        """Test escalation for high severity complaint."""
-        result = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="high",
-        )
-
-        assert result is True
-
-    def test_escalate_critical_complaint(self):
-        """Test escalation for critical complaint."""
-        result = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="critical",
-        )
-
-        assert result is True
-
-    def test_escalate_urgent_complaint(self):
-        """Test escalation for urgent complaint."""
-        result = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="urgent",
-        )
-
-        assert result is True
-
-    def test_no_escalate_normal_complaint(self):
-        """Test no escalation for normal complaint."""
-        result = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="normal",
-        )
-
-        assert result is False
-
-    def test_no_escalate_low_complaint(self):
-        """Test no escalation for low severity complaint."""
-        result = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="low",
+            current_time=today_utc.replace(hour=10),
         )
 
         assert result is False
@@ -323,31 +291,40 @@ class TestShouldEscalateToUrgent:
 
         assert result is False
 
-    def test_escalate_uses_current_time_default(self):
+    def test_escalate_uses_current_time_default(self, today_utc, monkeypatch):
         """Test that function uses current time by default."""
-        today = datetime.now(timezone.utc)
-        booking_time = today.replace(hour=9, minute=0, second=0, microsecond=0)
+        now = today_utc.replace(hour=10)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now
+
+        monkeypatch.setattr(templates_module, "datetime", FrozenDatetime)
 
         result = should_escalate_to_urgent(
             "booking",
-            booking_datetime=booking_time,
+            booking_datetime=today_utc.replace(hour=9),
         )
 
-        if today.hour >= 8:
-            assert result is True
-        else:
-            assert result is False
-
-    def test_escalate_case_insensitive_severity(self):
-        """Test that severity check is case insensitive."""
-        result_high = should_escalate_to_urgent(
-            "complaint",
-            complaint_severity="HIGH",
-        )
+        assert result is True
 
-        result_high_lower = should_escalate_to_urgent(
+    @pytest.mark.parametrize(
+        "severity,expected",
+        [
+            ("high", True),
+            ("critical", True),
+            ("urgent", True),
+            ("HIGH", True),
+            ("normal", False),
+            ("low", False),
+        ],
+    )
+    def test_complaint_severity_escalation(self, severity, expected):
+        """Test complaint escalation by (case-insensitive) severity."""
+        result = should_escalate_to_urgent(
             "complaint",
-            complaint_severity="high",
+            complaint_severity=severity,
         )
 
-        assert result_high == result_high_lower
+        assert result is expected
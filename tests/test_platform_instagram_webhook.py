@@ -0,0 +1,215 @@
+"""Tests for Instagram webhook parsing, validation and verification.
+
+These tests are synchronous and I/O-free; they live apart from the async
+send tests so ``pytest -n auto`` can distribute them across workers.
+"""
+
+import hmac
+import hashlib
+import json
+import pytest
+from datetime import datetime, timezone
+
+from integrations.platform_handlers.base import MessageType, WebhookValidationError
+
+
+# Webhook body (raw bytes as received, and decoded) and its signature
+# under the fixture's app secret
+_PAYLOAD_BYTES = b'{"test": "data"}'
+_PAYLOAD_STR = _PAYLOAD_BYTES.decode("utf-8")
+_EXPECTED_SIG = hmac.new(b"test_app_secret", _PAYLOAD_BYTES, hashlib.sha256).digest()
+
+
+def _message_webhook(message):
+    """Wrap a message object in a single-event webhook payload."""
+    return {
+        "entry": [{
+            "messaging": [{
+                "sender": {"id": "123456789"},
+                "message": {"mid": "m_123", **message}
+            }]
+        }]
+    }
+
+
+def _attachment_webhook(attachment_type):
+    """Webhook payload carrying a single attachment of the given type."""
+    return _message_webhook({
+        "attachments": [{
+            "type": attachment_type,
+            "payload": {"url": f"https://example.com/{attachment_type}"}
+        }]
+    })
+
+
+# parse_webhook does not mutate its payload, so tests can share these
+_TEXT_PAYLOAD = _message_webhook({"text": "Hello, world!"})
+_IMAGE_PAYLOAD = _attachment_webhook("image")
+_VIDEO_PAYLOAD = _attachment_webhook("video")
+_AUDIO_PAYLOAD = _attachment_webhook("audio")
+_FILE_PAYLOAD = _attachment_webhook("file")
+
+
+class TestInstagramParseWebhook:
+    """Tests for parsing Instagram webhooks."""
+    
+    def test_parse_text_message(self, instagram_adapter):
+        """Test parsing text message."""
+        parsed = instagram_adapter.parse_webhook(_TEXT_PAYLOAD)
+        
+        assert parsed is not None
+        assert parsed.platform == "instagram"
+        assert parsed.platform_user_id == "123456789"
+        assert parsed.message_type == MessageType.TEXT
+        assert parsed.text == "Hello, world!"
+    
+    @pytest.mark.parametrize(
+        "payload,expected_mtype,expected_media_type",
+        [
+            pytest.param(_IMAGE_PAYLOAD, MessageType.IMAGE, "image", id="image"),
+            pytest.param(_VIDEO_PAYLOAD, MessageType.VIDEO, "video", id="video"),
+            pytest.param(_AUDIO_PAYLOAD, MessageType.VOICE, "audio", id="audio"),
+            pytest.param(_FILE_PAYLOAD, MessageType.DOCUMENT, "document", id="file"),
+        ],
+    )
+    def test_parse_attachment_message(
+        self, instagram_adapter, payload, expected_mtype, expected_media_type
+    ):
+        """Test parsing image, video, audio and other attachments."""
+        parsed = instagram_adapter.parse_webhook(payload)
+        
+        assert parsed is not None
+        assert parsed.message_type == expected_mtype
+        attachment = payload["entry"][0]["messaging"][0]["message"]["attachments"][0]
+        assert parsed.media_url == attachment["payload"]["url"]
+        assert parsed.media_type == expected_media_type
+    
+    def test_parse_multiple_message_types(self, instagram_adapter):
+        """Test parsing multiple message types with one adapter."""
+        assert instagram_adapter.parse_webhook(_TEXT_PAYLOAD).message_type == MessageType.TEXT
+        assert instagram_adapter.parse_webhook(_IMAGE_PAYLOAD).message_type == MessageType.IMAGE
+    
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_parse_raw_body(self, instagram_adapter, monkeypatch, use_orjson):
+        """Test parsing the raw webhook body as received over HTTP."""
+        if not use_orjson:
+            monkeypatch.setattr("integrations.platform_handlers.instagram.orjson", None)
+        body = json.dumps(_TEXT_PAYLOAD).encode("utf-8")
+        
+        parsed = instagram_adapter.parse_webhook(body)
+        
+        assert parsed is not None
+        assert parsed.platform_user_id == "123456789"
+        assert parsed.message_type == MessageType.TEXT
+        assert parsed.text == "Hello, world!"
+    
+    def test_parse_webhook_preserves_timestamp(self, instagram_adapter):
+        """Test millisecond event timestamp is converted to UTC datetime."""
+        payload = _message_webhook({"text": "Hello, world!"})
+        payload["entry"][0]["messaging"][0]["timestamp"] = 1609459200000
+        
+        parsed = instagram_adapter.parse_webhook(payload)
+        
+        assert parsed.timestamp == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    
+    def test_parse_returns_first_message_event(self, instagram_adapter):
+        """Test that non-message events are skipped and the first message wins."""
+        payload = {
+            "entry": [
+                {"messaging": [{"sender": {"id": "1"}, "read": {"mid": "m_0"}}]},
+                {"messaging": [
+                    {"sender": {"id": "2"}, "message": {"mid": "m_1", "text": "first"}},
+                    {"sender": {"id": "3"}, "message": {"mid": "m_2", "text": "second"}},
+                ]},
+            ]
+        }
+        
+        parsed = instagram_adapter.parse_webhook(payload)
+        
+        assert parsed.platform_user_id == "2"
+        assert parsed.text == "first"
+    
+    def test_parse_verification_challenge(self, instagram_adapter):
+        """Test parsing webhook verification challenge."""
+        payload = {"hub.challenge": "test_challenge"}
+        
+        parsed = instagram_adapter.parse_webhook(payload)
+        
+        assert parsed is None
+    
+    def test_parse_empty_webhook(self, instagram_adapter):
+        """Test parsing empty webhook."""
+        parsed = instagram_adapter.parse_webhook({"entry": []})
+        
+        assert parsed is None
+
+
+class TestInstagramValidateWebhook:
+    """Tests for validating Instagram webhooks."""
+    
+    def test_validate_webhook_success(self, instagram_adapter):
+        """Test successful webhook validation."""
+        signature = "sha256=" + _EXPECTED_SIG.hex()
+        
+        result = instagram_adapter.validate_webhook(_PAYLOAD_BYTES, signature)
+        
+        assert result is True
+    
+    def test_validate_webhook_without_prefix(self, instagram_adapter):
+        """Test webhook validation without sha256= prefix."""
+        result = instagram_adapter.validate_webhook(_PAYLOAD_STR, _EXPECTED_SIG.hex())
+        
+        assert result is True
+    
+    @pytest.mark.parametrize(
+        "signature",
+        ["sha256=invalid_signature", "sha256=" + "00" * 32],
+        ids=["malformed_hex", "wrong_digest"],
+    )
+    def test_validate_webhook_invalid_signature(self, instagram_adapter, signature):
+        """Test webhook validation with invalid signature."""
+        with pytest.raises(WebhookValidationError):
+            instagram_adapter.validate_webhook(
+                payload=_PAYLOAD_BYTES,
+                signature=signature
+            )
+    
+    @pytest.mark.parametrize("payload", [b"", _PAYLOAD_BYTES, b"x" * 4096])
+    def test_validate_webhook_reuses_hmac_template(self, instagram_adapter, payload):
+        """Test repeated validations match a freshly keyed HMAC."""
+        signature = hmac.new(b"test_app_secret", payload, hashlib.sha256).hexdigest()
+        
+        assert instagram_adapter.validate_webhook(payload, signature) is True
+        assert instagram_adapter.validate_webhook(payload, signature) is True
+    
+    def test_validate_webhook_no_app_secret(self, instagram_adapter_no_creds):
+        """Test webhook validation without app secret."""
+        result = instagram_adapter_no_creds.validate_webhook(
+            payload={},
+            signature="signature"
+        )
+        
+        assert result is False
+
+
+class TestInstagramVerifySubscription:
+    """Tests for webhook subscription verification."""
+    
+    @pytest.mark.parametrize(
+        "mode,token,expected",
+        [
+            ("subscribe", "test_verify_token", "test_challenge"),
+            ("subscribe", "wrong_token", None),
+            ("unsubscribe", "test_verify_token", None),
+        ],
+        ids=["success", "wrong_token", "wrong_mode"],
+    )
+    def test_verify_subscription(self, instagram_adapter, mode, token, expected):
+        """Test subscription verification handshake."""
+        result = instagram_adapter.verify_webhook_subscription(
+            mode=mode,
+            token=token,
+            challenge="test_challenge"
+        )
+        
+        assert result == expected
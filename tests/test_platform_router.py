@@ -1,45 +1,73 @@
 """Tests for message router."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 from datetime import datetime, timezone
 
-from integrations.platform_handlers.router import MessageRouter
-from integrations.platform_handlers.base import Message, MessageType, PlatformAdapter
-from core.conversation import ConversationState, get_storage, reset_storage
+from integrations.platform_handlers.router import MessageRouter, _hashed_user_id
+from integrations.platform_handlers.base import Message, MessageType
+from core.conversation import ConversationState, get_storage
+
+
+# Validated once; fixtures hand out cheap copies via model_copy()
+_SAMPLE_TELEGRAM_MSG = Message(
+    message_id="123",
+    platform="telegram",
+    platform_user_id="987654321",
+    message_type=MessageType.TEXT,
+    text="Hello, world!",
+    language_code="ru",
+    username="testuser",
+    first_name="Test",
+    last_name="User"
+)
+
+_SAMPLE_WHATSAPP_MSG = Message(
+    message_id="456",
+    platform="whatsapp",
+    platform_user_id="+1234567890",
+    message_type=MessageType.TEXT,
+    text="Hello from WhatsApp!",
+    first_name="John"
+)
+
+
+@pytest.fixture
+def storage():
+    """Shared conversation storage."""
+    return get_storage()
 
 
 @pytest.fixture(autouse=True)
-def reset_conversation_storage():
-    """Reset conversation storage before each test."""
-    reset_storage()
+async def reset_conversation_storage(storage):
+    """Empty the shared conversation storage around each test."""
+    await storage.clear_all()
     yield
-    reset_storage()
+    await storage.clear_all()
 
 
-@pytest.fixture
-def mock_telegram_adapter():
-    """Create mock Telegram adapter."""
-    adapter = MagicMock(spec=PlatformAdapter)
-    adapter.platform_name = "telegram"
-    adapter.parse_webhook = MagicMock()
-    adapter.send_message = AsyncMock(return_value=True)
-    return adapter
+@pytest.fixture(scope="module")
+def mock_telegram_adapter(stub_adapter):
+    """Create stub Telegram adapter once per module."""
+    return stub_adapter("telegram")
 
 
-@pytest.fixture
-def mock_whatsapp_adapter():
-    """Create mock WhatsApp adapter."""
-    adapter = MagicMock(spec=PlatformAdapter)
-    adapter.platform_name = "whatsapp"
-    adapter.parse_webhook = MagicMock()
-    adapter.send_message = AsyncMock(return_value=True)
-    return adapter
+@pytest.fixture(scope="module")
+def mock_whatsapp_adapter(stub_adapter):
+    """Create stub WhatsApp adapter once per module."""
+    return stub_adapter("whatsapp")
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_adapters(mock_telegram_adapter, mock_whatsapp_adapter):
+    """Clear what the shared stub adapters recorded in earlier tests."""
+    mock_telegram_adapter.reset()
+    mock_whatsapp_adapter.reset()
+
+
+@pytest.fixture(scope="module")
 def message_router(mock_telegram_adapter, mock_whatsapp_adapter):
-    """Create MessageRouter with mock adapters."""
+    """Create MessageRouter with stub adapters, shared across the module."""
     return MessageRouter(
         adapters={
             "telegram": mock_telegram_adapter,
@@ -50,31 +78,8 @@ def message_router(mock_telegram_adapter, mock_whatsapp_adapter):
 
 @pytest.fixture
 def sample_telegram_message():
-    """Create sample Telegram message."""
-    return Message(
-        message_id="123",
-        platform="telegram",
-        platform_user_id="987654321",
-        message_type=MessageType.TEXT,
-        text="Hello, world!",
-        language_code="ru",
-        username="testuser",
-        first_name="Test",
-        last_name="User"
-    )
-
-
-@pytest.fixture
-def sample_whatsapp_message():
-    """Create sample WhatsApp message."""
-    return Message(
-        message_id="456",
-        platform="whatsapp",
-        platform_user_id="+1234567890",
-        message_type=MessageType.TEXT,
-        text="Hello from WhatsApp!",
-        first_name="John"
-    )
+    """Sample Telegram message (a copy, since routing sets internal_user_id)."""
+    return _SAMPLE_TELEGRAM_MSG.model_copy()
 
 
 class TestMessageRouterInit:
@@ -99,21 +104,41 @@ class TestMessageRouterInit:
         
         assert len(router.adapters) == 0
     
-    def test_register_adapter(self, message_router, mock_telegram_adapter):
+    def test_register_adapter(self, message_router, stub_adapter):
         """Test registering an adapter."""
-        new_adapter = MagicMock(spec=PlatformAdapter)
-        new_adapter.platform_name = "instagram"
+        # Register on a copy so the shared router stays unchanged
+        router = MessageRouter(adapters=dict(message_router.adapters))
+        new_adapter = stub_adapter("instagram")
         
-        message_router.register_adapter("instagram", new_adapter)
+        router.register_adapter("instagram", new_adapter)
         
-        assert "instagram" in message_router.adapters
-        assert message_router.adapters["instagram"] == new_adapter
+        assert "instagram" in router.adapters
+        assert router.adapters["instagram"] == new_adapter
+        assert "instagram" not in message_router.adapters
+
+
+class TestMessageRouterClose:
+    """Tests for MessageRouter shutdown."""
+    
+    async def test_close_closes_every_adapter(self, stub_adapter):
+        """Test closing the router closes all adapters, even after one fails."""
+        failing = stub_adapter("whatsapp")
+        
+        async def broken_close():
+            raise RuntimeError("already closed")
+        
+        failing.close = broken_close
+        healthy = stub_adapter("instagram")
+        router = MessageRouter(adapters={"whatsapp": failing, "instagram": healthy})
+        
+        await router.close()
+        
+        assert healthy.closed is True
 
 
 class TestMessageRouterRouting:
     """Tests for message routing."""
     
-    @pytest.mark.asyncio
     async def test_route_telegram_message(self, message_router, sample_telegram_message):
         """Test routing Telegram message."""
         context = await message_router.route_message(sample_telegram_message)
@@ -124,19 +149,17 @@ class TestMessageRouterRouting:
         assert context.current_state == ConversationState.START
         assert context.language == "ru"
     
-    @pytest.mark.asyncio
-    async def test_route_whatsapp_message(self, message_router, sample_whatsapp_message):
+    async def test_route_whatsapp_message(self, message_router):
         """Test routing WhatsApp message."""
         # Set internal_user_id to avoid hashing
-        sample_whatsapp_message.internal_user_id = 12345
+        message = _SAMPLE_WHATSAPP_MSG.model_copy(update={"internal_user_id": 12345})
         
-        context = await message_router.route_message(sample_whatsapp_message)
+        context = await message_router.route_message(message)
         
         assert context is not None
         assert context.platform == "whatsapp"
         assert context.user_id == 12345
     
-    @pytest.mark.asyncio
     async def test_route_message_with_handler(self, message_router, sample_telegram_message):
         """Test routing message with handler."""
         handler_called = False
@@ -152,11 +175,11 @@ class TestMessageRouterRouting:
         assert context is not None
         assert handler_called is True
     
-    @pytest.mark.asyncio
-    async def test_route_message_existing_context(self, message_router, sample_telegram_message):
+    async def test_route_message_existing_context(
+        self, message_router, storage, sample_telegram_message
+    ):
         """Test routing message for user with existing context."""
         # Create initial context
-        storage = get_storage()
         await storage.update(
             user_id=987654321,
             state=ConversationState.WAITING_NAME,
@@ -167,16 +190,14 @@ class TestMessageRouterRouting:
         assert context is not None
         assert context.current_state == ConversationState.WAITING_NAME
     
-    @pytest.mark.asyncio
-    async def test_route_message_updates_platform(self, message_router):
+    async def test_route_message_updates_platform(self, message_router, storage):
         """Test that routing updates platform if different."""
         # Create context with telegram platform
-        storage = get_storage()
-        await storage.update(
+        # update() returns the stored context, so no separate load is needed
+        context = await storage.update(
             user_id=12345,
             state=ConversationState.START,
         )
-        context = await storage.load(12345)
         context.platform = "telegram"
         await storage.save(context)
         
@@ -199,10 +220,9 @@ class TestMessageRouterRouting:
 class TestMessageRouterParseAndRoute:
     """Tests for parse_and_route."""
     
-    @pytest.mark.asyncio
     async def test_parse_and_route_success(self, message_router, mock_telegram_adapter, sample_telegram_message):
         """Test parse and route successfully."""
-        mock_telegram_adapter.parse_webhook.return_value = sample_telegram_message
+        mock_telegram_adapter.parse_webhook_returns = sample_telegram_message
         
         context = await message_router.parse_and_route(
             platform="telegram",
@@ -210,9 +230,8 @@ class TestMessageRouterParseAndRoute:
         )
         
         assert context is not None
-        mock_telegram_adapter.parse_webhook.assert_called_once()
+        assert len(mock_telegram_adapter.parsed) == 1
     
-    @pytest.mark.asyncio
     async def test_parse_and_route_no_adapter(self, message_router):
         """Test parse and route with no adapter."""
         context = await message_router.parse_and_route(
@@ -222,10 +241,9 @@ class TestMessageRouterParseAndRoute:
         
         assert context is None
     
-    @pytest.mark.asyncio
     async def test_parse_and_route_no_message(self, message_router, mock_telegram_adapter):
         """Test parse and route when no message parsed."""
-        mock_telegram_adapter.parse_webhook.return_value = None
+        mock_telegram_adapter.parse_webhook_returns = None
         
         context = await message_router.parse_and_route(
             platform="telegram",
@@ -234,10 +252,9 @@ class TestMessageRouterParseAndRoute:
         
         assert context is None
     
-    @pytest.mark.asyncio
     async def test_parse_and_route_with_handler(self, message_router, mock_telegram_adapter, sample_telegram_message):
         """Test parse and route with handler."""
-        mock_telegram_adapter.parse_webhook.return_value = sample_telegram_message
+        mock_telegram_adapter.parse_webhook_returns = sample_telegram_message
         handler_called = False
         
         async def test_handler(message, context):
@@ -256,36 +273,46 @@ class TestMessageRouterParseAndRoute:
 class TestMessageRouterUserIdMapper:
     """Tests for user ID mapping."""
     
-    @pytest.mark.asyncio
-    async def test_default_mapper_telegram(self, message_router):
-        """Test default mapper with Telegram user ID."""
-        user_id = await message_router._default_user_id_mapper("telegram", "123456789")
+    @pytest.mark.parametrize(
+        "platform,platform_user_id,expected",
+        [
+            ("telegram", "123456789", 123456789),
+            ("whatsapp", "+1234567890", None),
+            ("instagram", "123", None),
+        ],
+    )
+    async def test_default_mapper(self, message_router, platform, platform_user_id, expected):
+        """Test default mapper returns a stable positive ID (raw ID for Telegram)."""
+        mapper = message_router._default_user_id_mapper
         
-        assert user_id == 123456789
-    
-    @pytest.mark.asyncio
-    async def test_default_mapper_whatsapp(self, message_router):
-        """Test default mapper with WhatsApp user ID."""
-        user_id = await message_router._default_user_id_mapper("whatsapp", "+1234567890")
+        user_id = await mapper(platform, platform_user_id)
         
-        # Should return consistent hash
         assert isinstance(user_id, int)
         assert user_id > 0
-        
-        # Same input should return same output
-        user_id2 = await message_router._default_user_id_mapper("whatsapp", "+1234567890")
-        assert user_id == user_id2
+        assert await mapper(platform, platform_user_id) == user_id
+        if expected is not None:
+            assert user_id == expected
     
-    @pytest.mark.asyncio
     async def test_default_mapper_different_platforms(self, message_router):
         """Test default mapper with same ID on different platforms."""
-        user_id1 = await message_router._default_user_id_mapper("whatsapp", "123")
-        user_id2 = await message_router._default_user_id_mapper("instagram", "123")
+        mapper = message_router._default_user_id_mapper
         
         # Different platforms should produce different IDs
-        assert user_id1 != user_id2
+        assert await mapper("whatsapp", "123") != await mapper("instagram", "123")
+    
+    async def test_default_mapper_caches_repeat_users(self, message_router):
+        """Test repeated lookups for the same users hit the hash cache."""
+        _hashed_user_id.cache_clear()
+        user_ids = [f"+7700000{i:04d}" for i in range(50)]
+        
+        first = [await message_router._default_user_id_mapper("whatsapp", u) for u in user_ids]
+        second = [await message_router._default_user_id_mapper("whatsapp", u) for u in user_ids]
+        
+        assert first == second
+        assert len(set(first)) == len(user_ids)
+        info = _hashed_user_id.cache_info()
+        assert (info.misses, info.hits) == (len(user_ids), len(user_ids))
     
-    @pytest.mark.asyncio
     async def test_custom_mapper(self):
         """Test custom user ID mapper."""
         async def custom_mapper(platform, platform_user_id):
@@ -309,7 +336,6 @@ class TestMessageRouterUserIdMapper:
 class TestMessageRouterSendToUser:
     """Tests for sending messages to users."""
     
-    @pytest.mark.asyncio
     async def test_send_to_user_success(self, message_router, sample_telegram_message):
         """Test sending message to user successfully."""
         # Create context for user
@@ -323,7 +349,6 @@ class TestMessageRouterSendToUser:
         
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_send_to_user_no_context(self, message_router):
         """Test sending message to user without context."""
         result = await message_router.send_to_user(
@@ -333,16 +358,14 @@ class TestMessageRouterSendToUser:
         
         assert result is False
     
-    @pytest.mark.asyncio
-    async def test_send_to_user_no_adapter(self, message_router):
+    async def test_send_to_user_no_adapter(self, message_router, storage):
         """Test sending message when adapter not available."""
         # Create context with unknown platform
-        storage = get_storage()
-        await storage.update(
+        # update() returns the stored context, so no separate load is needed
+        context = await storage.update(
             user_id=12345,
             state=ConversationState.START,
         )
-        context = await storage.load(12345)
         context.platform = "unknown"
         await storage.save(context)
         
@@ -374,10 +397,9 @@ class TestMessageRouterGetAdapter:
 class TestMessageRouterIntegration:
     """Integration tests for message router."""
     
-    @pytest.mark.asyncio
     async def test_complete_message_flow(self, message_router, mock_telegram_adapter, sample_telegram_message):
         """Test complete message flow from webhook to response."""
-        mock_telegram_adapter.parse_webhook.return_value = sample_telegram_message
+        mock_telegram_adapter.parse_webhook_returns = sample_telegram_message
         
         # Parse and route webhook
         context = await message_router.parse_and_route(
@@ -395,9 +417,9 @@ class TestMessageRouterIntegration:
         )
         
         assert result is True
-        mock_telegram_adapter.send_message.assert_called_once()
+        assert len(mock_telegram_adapter.sent) == 1
+        assert mock_telegram_adapter.sent[0]["text"] == "Reply"
     
-    @pytest.mark.asyncio
     async def test_multi_platform_user(self, message_router):
         """Test user switching platforms."""
         # User sends Telegram message
@@ -1,37 +1,71 @@
 """Tests for Telegram platform adapter."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
 from aiogram import Bot
-from aiogram.types import Update, Message as AiogramMessage, User, Chat, CallbackQuery
+from aiogram.types import (
+    Update,
+    Message as AiogramMessage,
+    User,
+    Chat,
+    CallbackQuery,
+    Voice,
+    PhotoSize,
+)
 
 from integrations.platform_handlers.telegram import TelegramAdapter
 from integrations.platform_handlers.base import Message, MessageType
 
 
-@pytest.fixture
-def mock_bot():
-    """Create mock aiogram Bot."""
-    bot = AsyncMock(spec=Bot)
-    bot.send_message = AsyncMock(return_value=True)
-    bot.send_photo = AsyncMock(return_value=True)
-    bot.send_video = AsyncMock(return_value=True)
-    bot.send_document = AsyncMock(return_value=True)
-    bot.send_audio = AsyncMock(return_value=True)
-    bot.send_chat_action = AsyncMock(return_value=True)
+# Message date for parse tests; the value itself is never asserted
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_BOT_SEND_METHODS = (
+    "send_message",
+    "send_photo",
+    "send_video",
+    "send_document",
+    "send_audio",
+    "send_chat_action",
+)
+
+
+@pytest.fixture(scope="module")
+async def mock_bot():
+    """Create mock aiogram Bot once per module.
+    
+    Send methods return an already-resolved future, so awaiting them skips
+    the coroutine AsyncMock would create per call.
+    """
+    sent = asyncio.get_running_loop().create_future()
+    sent.set_result(True)
+    bot = MagicMock(spec=Bot)
+    for method in _BOT_SEND_METHODS:
+        setattr(bot, method, MagicMock(return_value=sent))
     return bot
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_bot(mock_bot):
+    """Clear recorded calls on the shared bot mock.
+    
+    Tests that need a failing call patch it in a context manager, so no
+    side effects are left behind to reset.
+    """
+    mock_bot.reset_mock()
+
+
+@pytest.fixture(scope="module")
 def telegram_adapter(mock_bot):
     """Create TelegramAdapter with mock bot."""
     adapter = TelegramAdapter(bot=mock_bot)
     return adapter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_user():
     """Create mock Telegram user."""
     user = MagicMock(spec=User)
@@ -43,7 +77,7 @@ def mock_user():
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_chat():
     """Create mock Telegram chat."""
     chat = MagicMock(spec=Chat)
@@ -55,7 +89,6 @@ def mock_chat():
 class TestTelegramSendMessage:
     """Tests for sending messages via Telegram."""
     
-    @pytest.mark.asyncio
     async def test_send_text_message_success(self, telegram_adapter, mock_bot):
         """Test sending text message successfully."""
         result = await telegram_adapter.send_message(
@@ -64,12 +97,12 @@ class TestTelegramSendMessage:
         )
         
         assert result is True
-        mock_bot.send_message.assert_called_once_with(
-            chat_id=123456789,
-            text="Test message"
-        )
+        assert mock_bot.send_message.call_count == 1
+        assert mock_bot.send_message.call_args.kwargs == {
+            "chat_id": 123456789,
+            "text": "Test message",
+        }
     
-    @pytest.mark.asyncio
     async def test_send_message_with_kwargs(self, telegram_adapter, mock_bot):
         """Test sending message with additional kwargs."""
         result = await telegram_adapter.send_message(
@@ -79,13 +112,13 @@ class TestTelegramSendMessage:
         )
         
         assert result is True
-        mock_bot.send_message.assert_called_once_with(
-            chat_id=123456789,
-            text="Test message",
-            parse_mode="HTML"
-        )
+        assert mock_bot.send_message.call_count == 1
+        assert mock_bot.send_message.call_args.kwargs == {
+            "chat_id": 123456789,
+            "text": "Test message",
+            "parse_mode": "HTML",
+        }
     
-    @pytest.mark.asyncio
     async def test_send_message_invalid_recipient_id(self, telegram_adapter, mock_bot):
         """Test sending message with invalid recipient ID."""
         result = await telegram_adapter.send_message(
@@ -96,7 +129,6 @@ class TestTelegramSendMessage:
         assert result is False
         mock_bot.send_message.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_send_message_bot_not_configured(self):
         """Test sending message when bot is not configured."""
         adapter = TelegramAdapter(bot=None)
@@ -107,15 +139,16 @@ class TestTelegramSendMessage:
         
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_send_message_api_error(self, telegram_adapter, mock_bot):
         """Test sending message with API error."""
-        mock_bot.send_message.side_effect = Exception("API error")
-        
-        result = await telegram_adapter.send_message(
-            recipient_id="123456789",
-            text="Test message"
-        )
+        with patch.object(
+            mock_bot, "send_message", new_callable=AsyncMock,
+            side_effect=Exception("API error"),
+        ):
+            result = await telegram_adapter.send_message(
+                recipient_id="123456789",
+                text="Test message"
+            )
         
         assert result is False
 
@@ -123,60 +156,35 @@ class TestTelegramSendMessage:
 class TestTelegramSendMedia:
     """Tests for sending media via Telegram."""
     
-    @pytest.mark.asyncio
-    async def test_send_image(self, telegram_adapter, mock_bot):
-        """Test sending image."""
+    @pytest.mark.parametrize(
+        "media_type,bot_method,media_arg",
+        [
+            ("image", "send_photo", "photo"),
+            ("video", "send_video", "video"),
+            ("document", "send_document", "document"),
+            ("audio", "send_audio", "audio"),
+        ],
+    )
+    async def test_send_media(
+        self, telegram_adapter, mock_bot, media_type, bot_method, media_arg
+    ):
+        """Test each media type is sent through its Bot method."""
         result = await telegram_adapter.send_media(
             recipient_id="123456789",
-            media_url="https://example.com/image.jpg",
-            media_type="image",
-            caption="Test caption"
-        )
-        
-        assert result is True
-        mock_bot.send_photo.assert_called_once_with(
-            chat_id=123456789,
-            photo="https://example.com/image.jpg",
+            media_url="https://example.com/file",
+            media_type=media_type,
             caption="Test caption"
         )
-    
-    @pytest.mark.asyncio
-    async def test_send_video(self, telegram_adapter, mock_bot):
-        """Test sending video."""
-        result = await telegram_adapter.send_media(
-            recipient_id="123456789",
-            media_url="https://example.com/video.mp4",
-            media_type="video"
-        )
-        
-        assert result is True
-        mock_bot.send_video.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_send_document(self, telegram_adapter, mock_bot):
-        """Test sending document."""
-        result = await telegram_adapter.send_media(
-            recipient_id="123456789",
-            media_url="https://example.com/file.pdf",
-            media_type="document"
-        )
-        
-        assert result is True
-        mock_bot.send_document.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_send_audio(self, telegram_adapter, mock_bot):
-        """Test sending audio."""
-        result = await telegram_adapter.send_media(
-            recipient_id="123456789",
-            media_url="https://example.com/audio.mp3",
-            media_type="audio"
-        )
         
         assert result is True
-        mock_bot.send_audio.assert_called_once()
+        send = getattr(mock_bot, bot_method)
+        assert send.call_count == 1
+        assert send.call_args.kwargs == {
+            "chat_id": 123456789,
+            "caption": "Test caption",
+            media_arg: "https://example.com/file",
+        }
     
-    @pytest.mark.asyncio
     async def test_send_unsupported_media_type(self, telegram_adapter, mock_bot):
         """Test sending unsupported media type."""
         result = await telegram_adapter.send_media(
@@ -191,22 +199,21 @@ class TestTelegramSendMedia:
 class TestTelegramSendTyping:
     """Tests for sending typing indicator via Telegram."""
     
-    @pytest.mark.asyncio
     async def test_send_typing_success(self, telegram_adapter, mock_bot):
         """Test sending typing indicator successfully."""
         result = await telegram_adapter.send_typing(recipient_id="123456789")
         
         assert result is True
-        mock_bot.send_chat_action.assert_called_once_with(
-            chat_id=123456789,
-            action="typing"
-        )
+        assert mock_bot.send_chat_action.call_count == 1
+        assert mock_bot.send_chat_action.call_args.kwargs == {
+            "chat_id": 123456789,
+            "action": "typing",
+        }
 
 
 class TestTelegramNotifyError:
     """Tests for sending error notifications via Telegram."""
     
-    @pytest.mark.asyncio
     async def test_notify_error(self, telegram_adapter, mock_bot):
         """Test sending error notification."""
         result = await telegram_adapter.notify_error(
@@ -227,7 +234,7 @@ class TestTelegramParseWebhook:
         """Test parsing text message."""
         message = AiogramMessage(
             message_id=1,
-            date=datetime.now(timezone.utc),
+            date=_FIXED_TS,
             chat=mock_chat,
             from_user=mock_user,
             text="Hello, world!"
@@ -246,8 +253,6 @@ class TestTelegramParseWebhook:
     
     def test_parse_voice_message(self, telegram_adapter, mock_user, mock_chat):
         """Test parsing voice message."""
-        from aiogram.types import Voice
-        
         voice = Voice(
             file_id="voice_file_id_123",
             file_unique_id="unique_123",
@@ -256,7 +261,7 @@ class TestTelegramParseWebhook:
         
         message = AiogramMessage(
             message_id=2,
-            date=datetime.now(timezone.utc),
+            date=_FIXED_TS,
             chat=mock_chat,
             from_user=mock_user,
             voice=voice
@@ -272,8 +277,6 @@ class TestTelegramParseWebhook:
     
     def test_parse_photo_message(self, telegram_adapter, mock_user, mock_chat):
         """Test parsing photo message."""
-        from aiogram.types import PhotoSize
-        
         photo = PhotoSize(
             file_id="photo_file_id_123",
             file_unique_id="unique_123",
@@ -283,7 +286,7 @@ class TestTelegramParseWebhook:
         
         message = AiogramMessage(
             message_id=3,
-            date=datetime.now(timezone.utc),
+            date=_FIXED_TS,
             chat=mock_chat,
             from_user=mock_user,
             photo=[photo],
@@ -336,34 +339,25 @@ class TestTelegramValidateWebhook:
 class TestTelegramIntegration:
     """Integration tests for Telegram adapter."""
     
-    @pytest.mark.asyncio
     async def test_complete_send_flow(self, telegram_adapter, mock_bot):
-        """Test complete send flow with multiple message types."""
-        # Send text message
-        result1 = await telegram_adapter.send_message("123", "Text")
-        assert result1 is True
-        
-        # Send typing indicator
-        result2 = await telegram_adapter.send_typing("123")
-        assert result2 is True
-        
-        # Send image
-        result3 = await telegram_adapter.send_media("123", "url", "image")
-        assert result3 is True
+        """Test complete send flow with concurrent sends."""
+        results = await asyncio.gather(
+            telegram_adapter.send_message("123", "Text"),
+            telegram_adapter.send_typing("123"),
+            telegram_adapter.send_media("123", "url", "image"),
+        )
         
-        # Verify all calls made
+        assert results == [True, True, True]
         assert mock_bot.send_message.call_count == 1
         assert mock_bot.send_chat_action.call_count == 1
         assert mock_bot.send_photo.call_count == 1
     
     def test_parse_multiple_message_types(self, telegram_adapter, mock_user, mock_chat):
         """Test parsing multiple message types."""
-        from aiogram.types import Voice
-        
         # Text message
         msg1 = AiogramMessage(
             message_id=1,
-            date=datetime.now(timezone.utc),
+            date=_FIXED_TS,
             chat=mock_chat,
             from_user=mock_user,
             text="Test"
@@ -379,7 +373,7 @@ class TestTelegramIntegration:
         )
         msg2 = AiogramMessage(
             message_id=2,
-            date=datetime.now(timezone.utc),
+            date=_FIXED_TS,
             chat=mock_chat,
             from_user=mock_user,
             voice=voice
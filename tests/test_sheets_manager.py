@@ -1,11 +1,17 @@
 """Tests for Google Sheets Manager."""
 
+import threading
 import pytest
-from datetime import datetime
-from unittest.mock import Mock, MagicMock, patch, call
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch, call
 from tenacity import RetryError
 
-from integrations.google.sheets_manager import GoogleSheetsManager, WORKSHEETS
+from integrations.google.sheets_manager import (
+    GoogleSheetsManager,
+    WORKSHEETS,
+    ERROR_BUFFER_SIZE,
+    ERROR_FLUSH_INTERVAL,
+)
 from models import (
     SpecialistDTO,
     ScheduleDTO,
@@ -17,6 +23,52 @@ from models import (
 from exceptions import RecoverableExternalError, SheetsInitializationError, SheetsError
 
 
+def _sheet_values(*records):
+    """Raw worksheet values (header row first) holding the given records."""
+    header = list(records[0])
+    return [header] + [[record.get(name, "") for name in header] for record in records]
+
+
+def _live_worksheet(values):
+    """Mock worksheet backed by a list of rows, so reads see rows changed behind the manager's back."""
+    rows = [list(row) for row in values]
+    worksheet = MagicMock()
+    worksheet.rows = rows
+    worksheet.get_all_values.side_effect = lambda: [list(row) for row in rows]
+    worksheet.col_values.side_effect = lambda col: [row[col - 1] for row in rows]
+    worksheet.delete_rows.side_effect = lambda start, end: rows.__delitem__(slice(start - 1, end))
+    return worksheet
+
+
+def _api_error(code, headers=None):
+    """gspread APIError carrying the given HTTP error code and response headers."""
+    import gspread
+
+    response = MagicMock()
+    response.json.return_value = {"error": {"code": code, "message": "API Error"}}
+    response.text = "API Error"
+    response.headers = headers or {}
+    return gspread.exceptions.APIError(response)
+
+
+@pytest.fixture(autouse=True)
+def retry_sleeps(monkeypatch):
+    """Record retry waits instead of sleeping through them."""
+    sleeps = []
+    for attr in vars(GoogleSheetsManager).values():
+        if hasattr(attr, "retry"):
+            monkeypatch.setattr(attr.retry, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture(autouse=True)
+def _fresh_connections():
+    """Keep cached Sheets connections from leaking between tests."""
+    GoogleSheetsManager.clear_connection_cache()
+    yield
+    GoogleSheetsManager.clear_connection_cache()
+
+
 @pytest.fixture
 def mock_service_account(tmp_path):
     """Create a mock service account JSON file."""
@@ -34,9 +86,21 @@ def mock_gspread_client():
     client.open_by_key.return_value = spreadsheet
     spreadsheet.title = "Test Spreadsheet"
     spreadsheet.worksheets.return_value = []
+    spreadsheet.batch_update.return_value = {
+        "replies": [{"addSheet": {"properties": {"title": title}}} for title in WORKSHEETS.values()]
+    }
     return client, spreadsheet
 
 
+@pytest.fixture
+def setup_manager(mock_service_account):
+    """Manager with the Sheets connection skipped; tests attach mock worksheets."""
+    with patch.object(GoogleSheetsManager, "_initialize"):
+        manager = GoogleSheetsManager("test_id", service_account_path=mock_service_account)
+    yield manager
+    manager.close()
+
+
 class TestGoogleSheetsManagerInitialization:
     """Test suite for manager initialization."""
 
@@ -50,8 +114,17 @@ class TestGoogleSheetsManagerInitialization:
             mock_settings.service_account_json_path = mock_service_account
             manager = GoogleSheetsManager("test_sheet_id", service_account_path=mock_service_account)
 
-            # Verify add_worksheet was called for each missing worksheet
-            assert mock_spreadsheet.add_worksheet.call_count >= len(WORKSHEETS)
+            # Verify every missing worksheet was added in a single batch request
+            mock_spreadsheet.batch_update.assert_called_once()
+            requests = mock_spreadsheet.batch_update.call_args.args[0]["requests"]
+            assert [r["addSheet"]["properties"]["title"] for r in requests] == list(WORKSHEETS.values())
+            mock_spreadsheet.add_worksheet.assert_not_called()
+
+            # Headers for all of them go out in one values write
+            mock_spreadsheet.values_batch_update.assert_called_once()
+            data = mock_spreadsheet.values_batch_update.call_args.args[0]["data"]
+            assert len(data) == len(WORKSHEETS)
+            assert set(manager.worksheets) == set(WORKSHEETS)
 
     @patch("integrations.google.sheets_manager.gspread")
     def test_initialization_logs_operation(self, mock_gspread_module, mock_service_account):
@@ -70,6 +143,20 @@ class TestGoogleSheetsManagerInitialization:
                 manager = GoogleSheetsManager("test_sheet_id", service_account_path=mock_service_account)
                 mock_log.assert_called()
 
+    @patch("integrations.google.sheets_manager.gspread")
+    def test_initialization_reuses_cached_connection(self, mock_gspread_module, mock_service_account, mock_gspread_client):
+        """Test that a second manager reuses the authorized client and spreadsheet."""
+        mock_client, mock_spreadsheet = mock_gspread_client
+        mock_gspread_module.service_account.return_value = mock_client
+
+        first = GoogleSheetsManager("test_sheet_id", service_account_path=mock_service_account)
+        second = GoogleSheetsManager("test_sheet_id", service_account_path=mock_service_account)
+
+        mock_gspread_module.service_account.assert_called_once()
+        mock_client.open_by_key.assert_called_once_with("test_sheet_id")
+        assert second.client is first.client
+        assert second.spreadsheet is mock_spreadsheet
+
     @patch("integrations.google.sheets_manager.gspread")
     def test_initialization_missing_service_account_file(self, mock_gspread_module, mock_service_account):
         """Test that missing service account file raises error."""
@@ -84,24 +171,11 @@ class TestGoogleSheetsManagerInitialization:
 class TestReadOperations:
     """Test suite for read operations."""
 
-    @pytest.fixture
-    def setup_manager(self, mock_service_account):
-        """Set up manager with mocked dependencies."""
-        with patch("integrations.google.sheets_manager.gspread"):
-            with patch("integrations.google.sheets_manager.settings") as mock_settings:
-                mock_settings.service_account_json_path = mock_service_account
-                manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
-                manager.spreadsheet_id = "test_id"
-                manager.service_account_path = mock_service_account
-                manager.worksheets = {}
-                manager.sync_state = Mock()
-                return manager
-
     def test_read_specialists(self, setup_manager):
         """Test reading specialists from Sheets."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
+        mock_worksheet.get_all_values.return_value = _sheet_values(
             {
                 "ID": "1",
                 "ФИ": "John Doe",
@@ -112,16 +186,64 @@ class TestReadOperations:
                 "Создано": "2025-01-01T00:00:00",
                 "Обновлено": "2025-01-02T00:00:00",
             }
-        ]
+        )
         manager.worksheets["specialists"] = mock_worksheet
 
         specialists = manager.read_specialists()
+        manager.read_specialists()
 
+        assert mock_worksheet.get_all_values.call_count == 1
         assert len(specialists) == 1
         assert specialists[0].name == "John Doe"
         assert specialists[0].specialization == "Cardiology"
         assert specialists[0].is_active is True
 
+    def test_read_specialists_cache_follows_writes(self, setup_manager):
+        """Test that cached records include own writes and refetch after invalidation."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.return_value = _sheet_values(
+            {"ID": 1, "ФИ": "John Doe", "Специализация": "Cardiology", "Активен": "Да"}
+        )
+        manager.worksheets["specialists"] = mock_worksheet
+
+        manager.read_specialists()
+        manager.add_specialist(SpecialistDTO(id=2, name="Jane Doe", specialization="Neurology"))
+        specialists = manager.read_specialists()
+
+        assert [s.name for s in specialists] == ["John Doe", "Jane Doe"]
+        assert mock_worksheet.get_all_values.call_count == 1
+
+        manager.invalidate("specialists")
+        manager.read_specialists()
+
+        assert mock_worksheet.get_all_values.call_count == 2
+
+    def test_iter_specialists_pagination(self, setup_manager):
+        """Test that specialists are read page by page until a short page."""
+        manager = setup_manager
+        manager.spreadsheet = MagicMock()
+        values = _sheet_values(*(
+            {"ID": str(i), "ФИ": f"Specialist {i}", "Активен": "Да"} for i in range(1, 6)
+        ))
+        # The API trims trailing empty cells from each row
+        values[5] = values[5][:2]
+        manager.spreadsheet.values_get.side_effect = [
+            {"values": values[0:3]},
+            {"values": values[3:5]},
+            {"values": values[5:]},
+        ]
+
+        specialists = list(manager.iter_specialists(chunk_size=2))
+
+        assert [s.id for s in specialists] == [1, 2, 3, 4, 5]
+        assert specialists[-1].is_active is False
+        assert [c.args[0] for c in manager.spreadsheet.values_get.call_args_list] == [
+            "'Специалисты'!A1:Z3",
+            "'Специалисты'!A4:Z5",
+            "'Специалисты'!A6:Z7",
+        ]
+
     def test_read_specialists_with_api_error(self, setup_manager):
         """Test that API errors are retried and then raised."""
         import gspread
@@ -133,7 +255,7 @@ class TestReadOperations:
         mock_response.json.return_value = {"error": {"code": 500, "message": "API Error"}}
         mock_response.text = "API Error"
         api_error = gspread.exceptions.APIError(mock_response)
-        mock_worksheet.get_all_records.side_effect = api_error
+        mock_worksheet.get_all_values.side_effect = api_error
         manager.worksheets["specialists"] = mock_worksheet
 
         with pytest.raises(RetryError):
@@ -143,7 +265,7 @@ class TestReadOperations:
         """Test reading bookings from Sheets."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
+        mock_worksheet.get_all_values.return_value = _sheet_values(
             {
                 "ID": "1",
                 "Специалист ID": "1",
@@ -155,7 +277,7 @@ class TestReadOperations:
                 "Создано": "2025-01-01T00:00:00",
                 "Обновлено": "2025-01-02T00:00:00",
             }
-        ]
+        )
         manager.worksheets["bookings"] = mock_worksheet
 
         bookings = manager.read_bookings()
@@ -169,7 +291,7 @@ class TestReadOperations:
         """Test reading schedule from Sheets."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
+        mock_worksheet.get_all_values.return_value = _sheet_values(
             {
                 "ID": "1",
                 "Специалист ID": "1",
@@ -180,7 +302,7 @@ class TestReadOperations:
                 "Создано": "2025-01-01T00:00:00",
                 "Обновлено": "2025-01-02T00:00:00",
             }
-        ]
+        )
         manager.worksheets["schedule"] = mock_worksheet
 
         schedules = manager.read_schedule()
@@ -194,19 +316,6 @@ class TestReadOperations:
 class TestWriteOperations:
     """Test suite for write operations."""
 
-    @pytest.fixture
-    def setup_manager(self, mock_service_account):
-        """Set up manager with mocked dependencies."""
-        with patch("integrations.google.sheets_manager.gspread"):
-            with patch("integrations.google.sheets_manager.settings") as mock_settings:
-                mock_settings.service_account_json_path = mock_service_account
-                manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
-                manager.spreadsheet_id = "test_id"
-                manager.service_account_path = mock_service_account
-                manager.worksheets = {}
-                manager.sync_state = Mock()
-                return manager
-
     def test_add_specialist(self, setup_manager):
         """Test adding a specialist."""
         manager = setup_manager
@@ -222,10 +331,32 @@ class TestWriteOperations:
 
         result = manager.add_specialist(specialist)
 
-        mock_worksheet.append_row.assert_called_once()
+        mock_worksheet.append_rows.assert_called_once()
+        rows = mock_worksheet.append_rows.call_args.args[0]
+        assert len(rows) == 1
+        assert rows[0][1:3] == ["Jane Doe", "Neurology"]
         assert result.name == "Jane Doe"
         assert result.created_at is not None
 
+    def test_add_specialists_single_request(self, setup_manager):
+        """Test that several specialists are written with one append request."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        manager.worksheets["specialists"] = mock_worksheet
+
+        specialists = [
+            SpecialistDTO(name=f"Specialist {i}", specialization="Neurology")
+            for i in range(3)
+        ]
+
+        result = manager.add_specialists(specialists)
+
+        assert mock_worksheet.append_rows.call_count == 1
+        rows = mock_worksheet.append_rows.call_args.args[0]
+        assert [row[1] for row in rows] == ["Specialist 0", "Specialist 1", "Specialist 2"]
+        assert all(s.created_at is not None for s in result)
+        assert manager._pending_appends == {}
+
     def test_add_specialist_with_api_error(self, setup_manager):
         """Test that API errors are retried and then raised."""
         import gspread
@@ -237,7 +368,7 @@ class TestWriteOperations:
         mock_response.json.return_value = {"error": {"code": 500, "message": "API Error"}}
         mock_response.text = "API Error"
         api_error = gspread.exceptions.APIError(mock_response)
-        mock_worksheet.append_row.side_effect = api_error
+        mock_worksheet.append_rows.side_effect = api_error
         manager.worksheets["specialists"] = mock_worksheet
 
         specialist = SpecialistDTO(name="Jane", specialization="Neurology")
@@ -249,7 +380,7 @@ class TestWriteOperations:
         """Test updating a specialist."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
+        mock_worksheet.get_all_values.return_value = _sheet_values(
             {
                 "ID": "1",
                 "ФИ": "Old Name",
@@ -260,7 +391,7 @@ class TestWriteOperations:
                 "Создано": "2025-01-01T00:00:00",
                 "Обновлено": "2025-01-02T00:00:00",
             }
-        ]
+        )
         manager.worksheets["specialists"] = mock_worksheet
 
         specialist = SpecialistDTO(
@@ -271,15 +402,97 @@ class TestWriteOperations:
 
         result = manager.update_specialist(1, specialist)
 
-        mock_worksheet.delete_rows.assert_called_once()
-        mock_worksheet.insert_row.assert_called_once()
+        mock_worksheet.batch_update.assert_called_once()
+        mock_worksheet.delete_rows.assert_not_called()
+        mock_worksheet.insert_row.assert_not_called()
+        (update,) = mock_worksheet.batch_update.call_args.args[0]
+        assert update["range"] == "A2:H2"
+        assert update["values"][0][:2] == [1, "New Name"]
+        assert update["values"][0][6] == "2025-01-01T00:00:00"
         assert result.name == "New Name"
 
+    def test_update_specialist_rechecks_shifted_rows(self, setup_manager):
+        """Test that a row inserted elsewhere makes the update read the sheet again."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values(
+            {"ID": "1", "ФИ": "First", "Создано": "2025-01-01T00:00:00"},
+            {"ID": "2", "ФИ": "Second", "Создано": "2025-01-01T00:00:00"},
+        ))
+        manager.worksheets["specialists"] = mock_worksheet
+        manager.read_specialists()
+        mock_worksheet.rows.insert(1, ["5", "Inserted", "2025-01-03T00:00:00"])
+
+        manager.update_specialist(1, SpecialistDTO(name="First Updated", specialization="Cardiology"))
+
+        (update,) = mock_worksheet.batch_update.call_args.args[0]
+        assert update["range"] == "A3:H3"
+        assert update["values"][0][1] == "First Updated"
+        assert mock_worksheet.get_all_values.call_count == 2
+
+    def test_update_specialists_single_request(self, setup_manager):
+        """Test that several specialists are updated with one batch write."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.return_value = _sheet_values(
+            {"ID": "1", "ФИ": "First", "Создано": "2025-01-01T00:00:00"},
+            {"ID": "2", "ФИ": "Second", "Создано": "2025-01-01T00:00:00"},
+        )
+        manager.worksheets["specialists"] = mock_worksheet
+
+        manager.update_specialists({
+            2: SpecialistDTO(name="Second Updated", specialization="Neurology"),
+            1: SpecialistDTO(name="First Updated", specialization="Cardiology"),
+        })
+
+        mock_worksheet.batch_update.assert_called_once()
+        updates = mock_worksheet.batch_update.call_args.args[0]
+        assert [u["range"] for u in updates] == ["A3:H3", "A2:H2"]
+        assert [u["values"][0][1] for u in updates] == ["Second Updated", "First Updated"]
+
+    def test_update_specialists_missing_id_writes_nothing(self, setup_manager):
+        """Test that an unknown ID fails the whole batch before any write."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values({"ID": "1", "ФИ": "First"}))
+        manager.worksheets["specialists"] = mock_worksheet
+
+        with pytest.raises(SheetsError):
+            manager.update_specialists({
+                1: SpecialistDTO(name="First", specialization="Cardiology"),
+                99: SpecialistDTO(name="Ghost", specialization="Cardiology"),
+            })
+
+        mock_worksheet.batch_update.assert_not_called()
+
+    def test_batched_coalesces_writes(self, setup_manager):
+        """Test that writes inside batched() are deferred and repeated row writes merged."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.return_value = _sheet_values(
+            {"ID": "1", "ФИ": "First", "Создано": "2025-01-01T00:00:00"},
+        )
+        manager.worksheets["specialists"] = mock_worksheet
+
+        with manager.batched():
+            manager.add_specialist(SpecialistDTO(name="New A", specialization="Cardiology"))
+            manager.add_specialist(SpecialistDTO(name="New B", specialization="Neurology"))
+            manager.update_specialist(1, SpecialistDTO(name="Draft", specialization="Cardiology"))
+            manager.update_specialist(1, SpecialistDTO(name="Final", specialization="Cardiology"))
+
+            mock_worksheet.append_rows.assert_not_called()
+            mock_worksheet.batch_update.assert_not_called()
+
+        mock_worksheet.append_rows.assert_called_once()
+        assert len(mock_worksheet.append_rows.call_args.args[0]) == 2
+        mock_worksheet.batch_update.assert_called_once()
+        updates = mock_worksheet.batch_update.call_args.args[0]
+        assert [u["range"] for u in updates] == ["A2:H2"]
+        assert updates[0]["values"][0][1] == "Final"
+
     def test_delete_specialist(self, setup_manager):
         """Test deleting a specialist."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
+        mock_worksheet.get_all_values.return_value = _sheet_values(
             {
                 "ID": "1",
                 "ФИ": "John Doe",
@@ -290,7 +503,7 @@ class TestWriteOperations:
                 "Создано": "2025-01-01T00:00:00",
                 "Обновлено": "2025-01-02T00:00:00",
             }
-        ]
+        )
         manager.worksheets["specialists"] = mock_worksheet
 
         result = manager.delete_specialist(1)
@@ -298,11 +511,77 @@ class TestWriteOperations:
         mock_worksheet.delete_rows.assert_called_once()
         assert result is True
 
+    def test_delete_specialists_uses_row_index(self, setup_manager):
+        """Test that later deletes use the shifted row index without reading again."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values(
+            {"ID": "1", "ФИ": "First"},
+            {"ID": "2", "ФИ": "Second"},
+            {"ID": "3", "ФИ": "Third"},
+        ))
+        manager.worksheets["specialists"] = mock_worksheet
+
+        assert manager.delete_specialist(1) is True
+        assert manager.delete_specialist(3) is True
+        assert manager.delete_specialist(1) is False
+
+        assert mock_worksheet.delete_rows.call_args_list == [call(2, 2), call(3, 3)]
+        assert mock_worksheet.get_all_values.call_count == 1
+
+    def test_delete_specialist_rechecks_shifted_rows(self, setup_manager):
+        """Test that a row deleted elsewhere makes the delete read the sheet again."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values(
+            {"ID": "1", "ФИ": "First"},
+            {"ID": "2", "ФИ": "Second"},
+            {"ID": "3", "ФИ": "Third"},
+        ))
+        manager.worksheets["specialists"] = mock_worksheet
+        manager.read_specialists()
+        del mock_worksheet.rows[1]  # another user deletes specialist 1
+
+        assert manager.delete_specialist(2) is True
+
+        mock_worksheet.delete_rows.assert_called_once_with(2, 2)
+        assert [row[0] for row in mock_worksheet.rows] == ["ID", "3"]
+        assert mock_worksheet.get_all_values.call_count == 2
+
+    def test_delete_specialist_added_elsewhere(self, setup_manager):
+        """Test that an ID missing from the cached rows is looked up in a fresh read."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values({"ID": "1", "ФИ": "First"}))
+        manager.worksheets["specialists"] = mock_worksheet
+        manager.read_specialists()
+        mock_worksheet.rows.insert(1, ["7", "Added Elsewhere"])
+
+        assert manager.delete_specialist(7) is True
+
+        mock_worksheet.delete_rows.assert_called_once_with(2, 2)
+        assert [row[0] for row in mock_worksheet.rows] == ["ID", "1"]
+
+    def test_delete_specialist_row_index_rebuilt_after_external_delete(self, setup_manager):
+        """Test that the shifted row map is rebuilt when the sheet changed elsewhere too."""
+        manager = setup_manager
+        mock_worksheet = _live_worksheet(_sheet_values(
+            {"ID": "1", "ФИ": "First"},
+            {"ID": "2", "ФИ": "Second"},
+            {"ID": "3", "ФИ": "Third"},
+            {"ID": "4", "ФИ": "Fourth"},
+        ))
+        manager.worksheets["specialists"] = mock_worksheet
+
+        assert manager.delete_specialist(1) is True
+        del mock_worksheet.rows[1]  # another user deletes specialist 2
+        assert manager.delete_specialist(4) is True
+
+        assert mock_worksheet.delete_rows.call_args_list == [call(2, 2), call(3, 3)]
+        assert [row[0] for row in mock_worksheet.rows] == ["ID", "3"]
+
     def test_delete_specialist_not_found(self, setup_manager):
         """Test deleting a non-existent specialist."""
         manager = setup_manager
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = []
+        mock_worksheet.get_all_values.return_value = []
         manager.worksheets["specialists"] = mock_worksheet
 
         result = manager.delete_specialist(999)
@@ -325,7 +604,7 @@ class TestWriteOperations:
 
         result = manager.add_booking(booking)
 
-        mock_worksheet.append_row.assert_called_once()
+        mock_worksheet.append_rows.assert_called_once()
         assert result.client_name == "Alice"
         assert result.created_at is not None
 
@@ -343,7 +622,7 @@ class TestWriteOperations:
 
         result = manager.add_day_off(day_off)
 
-        mock_worksheet.append_row.assert_called_once()
+        mock_worksheet.append_rows.assert_called_once()
         assert result.specialist_id == 1
         assert result.date == "2025-01-20"
 
@@ -351,19 +630,6 @@ class TestWriteOperations:
 class TestLogging:
     """Test suite for logging operations."""
 
-    @pytest.fixture
-    def setup_manager(self, mock_service_account):
-        """Set up manager with mocked dependencies."""
-        with patch("integrations.google.sheets_manager.gspread"):
-            with patch("integrations.google.sheets_manager.settings") as mock_settings:
-                mock_settings.service_account_json_path = mock_service_account
-                manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
-                manager.spreadsheet_id = "test_id"
-                manager.service_account_path = mock_service_account
-                manager.worksheets = {}
-                manager.sync_state = Mock()
-                return manager
-
     def test_log_admin_action(self, setup_manager):
         """Test logging an admin action."""
         manager = setup_manager
@@ -375,11 +641,60 @@ class TestLogging:
             resource_type="specialist",
             description="Test action",
         )
+        manager._flush_logs_now()
 
-        mock_worksheet.append_row.assert_called_once()
+        mock_worksheet.append_rows.assert_called_once()
+        assert mock_worksheet.append_rows.call_args.args[0][0][1] == "create"
         assert action.action_type == "create"
         assert action.resource_type == "specialist"
 
+    def test_log_flush_coalesces(self, setup_manager):
+        """Test that queued admin actions are written with one append request."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        manager.worksheets["admin_logs"] = mock_worksheet
+
+        for i in range(49):
+            manager._log_admin_action(action_type="create", description=f"Action {i}")
+        mock_worksheet.append_rows.assert_not_called()
+
+        # The 50th queued row fills a batch and writes it
+        manager._log_admin_action(action_type="create", description="Action 49")
+
+        mock_worksheet.append_rows.assert_called_once()
+        assert len(mock_worksheet.append_rows.call_args.args[0]) == 50
+
+    def test_log_rows_written_with_each_write(self, setup_manager):
+        """Test that log rows are written before a write outside batched() returns."""
+        manager = setup_manager
+        logs_worksheet = MagicMock()
+        manager.worksheets["admin_logs"] = logs_worksheet
+        manager.worksheets["specialists"] = MagicMock()
+
+        manager.add_specialist(SpecialistDTO(name="First", specialization="Cardiology"))
+        logs_worksheet.append_rows.assert_called_once()
+        assert len(logs_worksheet.append_rows.call_args.args[0]) == 1
+
+        with manager.batched():
+            manager.add_specialist(SpecialistDTO(name="Second", specialization="Cardiology"))
+            manager.add_specialist(SpecialistDTO(name="Third", specialization="Cardiology"))
+            assert logs_worksheet.append_rows.call_count == 1
+
+        assert logs_worksheet.append_rows.call_count == 2
+        assert len(logs_worksheet.append_rows.call_args.args[0]) == 2
+
+    def test_public_log_admin_action_written_synchronously(self, setup_manager):
+        """Test that audit rows logged by callers are not left waiting in the queue."""
+        manager = setup_manager
+        logs_worksheet = MagicMock()
+        manager.worksheets["admin_logs"] = logs_worksheet
+
+        manager.log_admin_action(AdminActionDTO(action_type="create", resource_type="specialist", description="Audit"))
+
+        logs_worksheet.append_rows.assert_called_once()
+        assert logs_worksheet.append_rows.call_args.args[0][0][4] == "Audit"
+        assert manager._log_queue.empty()
+
     def test_log_error(self, setup_manager):
         """Test logging an error."""
         manager = setup_manager
@@ -391,11 +706,56 @@ class TestLogging:
             message="Test error",
             context="test_context",
         )
+        manager._flush_logs_now()
 
-        mock_worksheet.append_row.assert_called_once()
+        mock_worksheet.append_rows.assert_called_once()
         assert error.error_type == "api_error"
         assert error.message == "Test error"
 
+    def test_log_error_no_api_call_on_path(self, setup_manager):
+        """Test that logging an error is buffered and written only on flush."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        manager.worksheets["errors"] = mock_worksheet
+
+        manager._log_error(error_type="api_error", message="First")
+        manager._log_error(error_type="api_error", message="Second")
+
+        assert mock_worksheet.append_rows.call_count == 0
+        manager.close()
+
+        mock_worksheet.append_rows.assert_called_once()
+        assert [row[2] for row in mock_worksheet.append_rows.call_args.args[0]] == ["First", "Second"]
+
+    def test_log_error_flushed_once_oldest_row_is_due(self, setup_manager):
+        """Test that buffered errors are written once the oldest has waited the flush interval."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        manager.worksheets["errors"] = mock_worksheet
+
+        manager._log_error(error_type="api_error", message="First")
+        manager._log_error(error_type="api_error", message="Second")
+        mock_worksheet.append_rows.assert_not_called()
+
+        manager._error_buffer_since -= ERROR_FLUSH_INTERVAL
+        manager._log_error(error_type="api_error", message="Third")
+
+        mock_worksheet.append_rows.assert_called_once()
+        assert [row[2] for row in mock_worksheet.append_rows.call_args.args[0]] == ["First", "Second", "Third"]
+        assert manager._error_buffer_since is None
+
+    def test_log_error_buffer_overflow_is_logged(self, setup_manager, caplog):
+        """Test that dropping the oldest buffered error row is logged."""
+        manager = setup_manager
+        manager.worksheets["errors"] = MagicMock()
+
+        for i in range(ERROR_BUFFER_SIZE + 1):
+            manager._log_error(error_type="api_error", message=f"Error {i}")
+
+        assert len(manager._error_buffer) == ERROR_BUFFER_SIZE
+        assert manager._error_buffer[0][2] == "Error 1"
+        assert "dropped the oldest unwritten row" in caplog.text
+
     def test_log_error_graceful_failure(self, setup_manager):
         """Test that logging errors fails gracefully."""
         import gspread
@@ -407,64 +767,83 @@ class TestLogging:
         mock_response.json.return_value = {"error": {"code": 500, "message": "API Error"}}
         mock_response.text = "API Error"
         api_error = gspread.exceptions.APIError(mock_response)
-        mock_worksheet.append_row.side_effect = api_error
+        mock_worksheet.append_rows.side_effect = api_error
         manager.worksheets["errors"] = mock_worksheet
 
         error = manager._log_error(
             error_type="api_error",
             message="Test error",
         )
+        manager._flush_logs_now()
 
         assert error.error_type == "api_error"
         assert error.message == "Test error"
+        # The row stays buffered for the next flush
+        assert [row[2] for row in manager._error_buffer] == ["Test error"]
 
 
 class TestSyncOperations:
     """Test suite for sync operations."""
 
-    @pytest.fixture
-    def setup_manager(self, mock_service_account):
-        """Set up manager with mocked dependencies."""
-        with patch("integrations.google.sheets_manager.gspread"):
-            with patch("integrations.google.sheets_manager.settings") as mock_settings:
-                mock_settings.service_account_json_path = mock_service_account
-                manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
-                manager.spreadsheet_id = "test_id"
-                manager.service_account_path = mock_service_account
-                manager.worksheets = {}
-                from models import SyncState
-                manager.sync_state = SyncState()
-                return manager
-
     def test_sync_pull_changes(self, setup_manager):
-        """Test pulling changes from Sheets."""
+        """Test pulling changes from Sheets with one batched read."""
         manager = setup_manager
-        specialists = [
-            SpecialistDTO(
-                id=1,
-                name="John Doe",
-                specialization="Cardiology",
-            )
-        ]
-        bookings = [
-            BookingDTO(
-                id=1,
-                specialist_id=1,
-                client_name="Alice",
-                booking_datetime=datetime(2025, 1, 15, 10, 0),
-            )
-        ]
-
-        with patch.object(manager, "read_specialists", return_value=specialists):
-            with patch.object(manager, "read_bookings", return_value=bookings):
-                state = manager.sync_pull_changes()
-
-                assert state.items_pulled == 2
-                assert state.last_synced is not None
+        manager.spreadsheet = MagicMock()
+        manager.spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [
+                {
+                    "values": [
+                        ["ID", "ФИ", "Специализация", "Телефон", "Email", "Активен"],
+                        ["1", "John Doe", "Cardiology", "", "", "Да"],
+                    ]
+                },
+                {
+                    "values": [
+                        ["ID", "Специалист ID", "Клиент", "Дата/Время", "Длительность мин"],
+                        ["1", "1", "Alice", "2025-01-15T10:00:00", "60"],
+                    ]
+                },
+            ]
+        }
+
+        state = manager.sync_pull_changes()
+
+        manager.spreadsheet.values_batch_get.assert_called_once()
+        assert len(manager.spreadsheet.values_batch_get.call_args.args[0]) == 2
+        assert state.items_pulled == 2
+        assert state.errors == []
+        assert state.last_synced is not None
+
+    def test_sync_skips_when_revision_unchanged(self, setup_manager):
+        """Test that a pull skips the read when the spreadsheet was not modified."""
+        manager = setup_manager
+        manager.spreadsheet = MagicMock()
+        manager.spreadsheet.get_lastUpdateTime.return_value = "2025-01-01T00:00:00.000Z"
+        manager.spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [
+                {"values": [["ID", "ФИ", "Специализация"], ["1", "John Doe", "Cardiology"]]},
+                {"values": []},
+            ]
+        }
+
+        first = manager.sync_pull_changes()
+        second = manager.sync_pull_changes()
+        manager.spreadsheet.get_lastUpdateTime.return_value = "2025-01-02T00:00:00.000Z"
+        third = manager.sync_pull_changes()
+
+        assert first.items_pulled == 1
+        assert second.items_pulled == 0
+        assert second.last_synced is not None
+        assert third.items_pulled == 1
+        assert manager.spreadsheet.values_batch_get.call_count == 2
 
     def test_sync_push_changes(self, setup_manager):
-        """Test pushing changes to Sheets."""
+        """Test pushing changes to Sheets after one batched remote read."""
         manager = setup_manager
+        manager.spreadsheet = MagicMock()
+        manager.spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [{"values": []}, {"values": []}]
+        }
         local_specialists = [
             SpecialistDTO(
                 id=1,
@@ -474,15 +853,53 @@ class TestSyncOperations:
         ]
         local_bookings = []
 
-        remote_specialists = []
-        remote_bookings = []
+        with patch.object(manager, "add_specialists") as mock_add:
+            state = manager.sync_push_changes(local_specialists, local_bookings)
+
+        manager.spreadsheet.values_batch_get.assert_called_once()
+        assert state.last_synced is not None
+        mock_add.assert_called_once_with(local_specialists)
+        assert state.items_pushed == 1
+
+    async def test_sync_pull_changes_async(self, setup_manager):
+        """Test that the async pull runs the sync pull in a worker thread."""
+        manager = setup_manager
+        loop_thread = threading.get_ident()
+        sync_threads = []
+
+        def fake_pull():
+            sync_threads.append(threading.get_ident())
+            return manager.sync_state
+
+        with patch.object(manager, "sync_pull_changes", side_effect=fake_pull):
+            state = await manager.sync_pull_changes_async()
+
+        assert state is manager.sync_state
+        assert sync_threads and sync_threads[0] != loop_thread
+
+    async def test_overlapping_async_syncs_run_one_at_a_time(self, setup_manager):
+        """Test that concurrent async pulls never touch the manager at the same time."""
+        import asyncio
+        import time
+
+        manager = setup_manager
+        manager.spreadsheet = MagicMock()
+        manager.spreadsheet.get_lastUpdateTime.side_effect = Exception("no Drive access")
+        active = []
+        overlaps = []
 
-        with patch.object(manager, "read_specialists", return_value=remote_specialists):
-            with patch.object(manager, "read_bookings", return_value=remote_bookings):
-                with patch.object(manager, "add_specialist") as mock_add:
-                    state = manager.sync_push_changes(local_specialists, local_bookings)
+        def batch_get(ranges):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return {"valueRanges": [{"values": []}, {"values": []}]}
 
-                    assert state.last_synced is not None
+        manager.spreadsheet.values_batch_get.side_effect = batch_get
+
+        await asyncio.gather(*(manager.sync_pull_changes_async() for _ in range(3)))
+
+        assert overlaps == [1, 1, 1]
 
     def test_sync_handles_conflicts(self, setup_manager):
         """Test that sync detects conflicts based on timestamps."""
@@ -504,29 +921,16 @@ class TestSyncOperations:
             )
         ]
 
-        # Mock the update_specialist method
-        with patch.object(manager, "update_specialist"):
+        with patch.object(manager, "update_specialists") as mock_update:
             manager._sync_specialists(local, remote)
 
-        assert manager.sync_state.items_pushed >= 0
+        mock_update.assert_called_once_with({1: local[0]})
+        assert manager.sync_state.items_pushed == 1
 
 
 class TestRetryLogic:
     """Test suite for retry logic."""
 
-    @pytest.fixture
-    def setup_manager(self, mock_service_account):
-        """Set up manager with mocked dependencies."""
-        with patch("integrations.google.sheets_manager.gspread"):
-            with patch("integrations.google.sheets_manager.settings") as mock_settings:
-                mock_settings.service_account_json_path = mock_service_account
-                manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
-                manager.spreadsheet_id = "test_id"
-                manager.service_account_path = mock_service_account
-                manager.worksheets = {}
-                manager.sync_state = Mock()
-                return manager
-
     def test_retry_on_api_error(self, setup_manager):
         """Test that API errors trigger retries."""
         import gspread
@@ -543,9 +947,9 @@ class TestRetryLogic:
                 mock_response.json.return_value = {"error": {"code": 500, "message": "Temporary error"}}
                 mock_response.text = "Temporary error"
                 raise gspread.exceptions.APIError(mock_response)
-            return [{"ID": "1", "ФИ": "John"}]
+            return _sheet_values({"ID": "1", "ФИ": "John"})
 
-        mock_worksheet.get_all_records.side_effect = side_effect
+        mock_worksheet.get_all_values.side_effect = side_effect
         manager.worksheets["specialists"] = mock_worksheet
 
         # This should eventually succeed after retries
@@ -553,6 +957,55 @@ class TestRetryLogic:
         assert len(specialists) == 1
         assert call_count == 3  # Verify it actually retried
 
+    def test_retry_after_header_sets_wait(self, setup_manager, retry_sleeps):
+        """Test that a 429 waits for the server-advised Retry-After interval."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.side_effect = [
+            _api_error(429, {"Retry-After": "7"}),
+            _sheet_values({"ID": "1", "ФИ": "John"}),
+        ]
+        manager.worksheets["specialists"] = mock_worksheet
+
+        specialists = manager.read_specialists()
+
+        assert len(specialists) == 1
+        assert retry_sleeps == [7.0]
+        assert mock_worksheet.get_all_values.call_count == 2
+
+    def test_server_error_backs_off_with_jitter(self, setup_manager, retry_sleeps):
+        """Test that server errors without Retry-After use capped exponential backoff."""
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.side_effect = [
+            _api_error(503),
+            _api_error(503),
+            _sheet_values({"ID": "1", "ФИ": "John"}),
+        ]
+        manager.worksheets["specialists"] = mock_worksheet
+
+        manager.read_specialists()
+
+        assert len(retry_sleeps) == 2
+        assert 1 <= retry_sleeps[0] <= 2
+        assert 2 <= retry_sleeps[1] <= 3
+
+    @pytest.mark.parametrize("code", [400, 403, 404])
+    def test_client_error_not_retried(self, setup_manager, retry_sleeps, code):
+        """Test that client errors other than 408/429 are raised without retrying."""
+        import gspread
+
+        manager = setup_manager
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.side_effect = _api_error(code)
+        manager.worksheets["specialists"] = mock_worksheet
+
+        with pytest.raises(gspread.exceptions.APIError):
+            manager.read_specialists()
+
+        assert mock_worksheet.get_all_values.call_count == 1
+        assert retry_sleeps == []
+
     def test_retry_exhaustion_raises_error(self, setup_manager):
         """Test that retry exhaustion raises RetryError."""
         import gspread
@@ -564,13 +1017,36 @@ class TestRetryLogic:
         mock_response.json.return_value = {"error": {"code": 500, "message": "API Error"}}
         mock_response.text = "API Error"
         api_error = gspread.exceptions.APIError(mock_response)
-        mock_worksheet.get_all_records.side_effect = api_error
+        mock_worksheet.get_all_values.side_effect = api_error
         manager.worksheets["specialists"] = mock_worksheet
 
         with pytest.raises(RetryError):
             manager.read_specialists()
 
 
+class TestOrjsonHTTPClient:
+    """Test suite for the orjson-backed gspread HTTP client."""
+
+    def test_values_get_decodes_with_orjson(self):
+        """Test that API responses are decoded through orjson."""
+        orjson = pytest.importorskip("orjson")
+        import requests
+        from integrations.google.sheets_manager import OrjsonHTTPClient
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = '{"values": [["ID", "ФИ"], ["1", "Иван"]]}'.encode("utf-8")
+        session = MagicMock()
+        session.request.return_value = response
+        client = OrjsonHTTPClient(auth=MagicMock(), session=session)
+
+        with patch("integrations.google.sheets_manager.orjson.loads", wraps=orjson.loads) as loads:
+            result = client.values_get("sheet_id", "A1:B2")
+
+        loads.assert_called_once()
+        assert result == {"values": [["ID", "ФИ"], ["1", "Иван"]]}
+
+
 class TestUtilityMethods:
     """Test suite for utility methods."""
 
@@ -590,6 +1066,27 @@ class TestUtilityMethods:
         assert result is not None
         assert result.year == 2025
 
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2025-01-15T10:30:00Z", datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)),
+            ("2025-01-15 10:30:00", datetime(2025, 1, 15, 10, 30)),
+            ("15/01/2025", datetime(2025, 1, 15)),
+        ],
+        ids=["utc_suffix", "space_separator", "day_first"],
+    )
+    def test_parse_datetime_other_formats(self, value, expected):
+        """Test parsing UTC-suffixed ISO and fallback formats."""
+        assert GoogleSheetsManager._parse_datetime(value) == expected
+
+    def test_parse_datetimes_matches_single_parse(self):
+        """Test that bulk parsing gives the same results as parsing one by one."""
+        values = ["2025-01-01T10:00:00", "2025-01-01T10:00:00Z", "2025-01-01", "01/02/2025", "", "invalid"]
+
+        assert GoogleSheetsManager._parse_datetimes(values) == [
+            GoogleSheetsManager._parse_datetime(v) for v in values
+        ]
+
     def test_parse_datetime_none(self):
         """Test parsing None value."""
         result = GoogleSheetsManager._parse_datetime(None)